@@ -7,6 +7,7 @@ Simuluje monotónní časovač CircuitPythonu:
 - ticks_ms() vrací řízený simulovaný čas
 - ticks_add() a ticks_diff() fungují stejně jako v MicroPythonu
 - čas se neposouvá automaticky, testy jej řídí ručně
+- jemnější posuny (µs) se akumulují, dokud nedají celou milisekundu
 """
 
 # Konstanty převzaté z MicroPythonu
@@ -17,6 +18,9 @@ _TICKS_HALFPERIOD = _TICKS_PERIOD // 2
 # Interní simulovaný čas (v milisekundách)
 _fake_ticks = 0
 
+# Zbytek simulovaného času pod 1 ms (v mikrosekundách, 0 <= _fake_us < 1000)
+_fake_us = 0.0
+
 
 def ticks_ms() -> int:
     """Vrací aktuální simulovaný čas v milisekundách."""
@@ -45,12 +49,33 @@ def ticks_less(ticks1: int, ticks2: int) -> bool:
 # ---------------------------------------------------------
 
 def set_ticks_ms(value: int) -> None:
-    """Nastaví simulovaný čas v milisekundách."""
-    global _fake_ticks
+    """Nastaví simulovaný čas v milisekundách (a vynuluje zbytek v µs)."""
+    global _fake_ticks, _fake_us
     _fake_ticks = int(value)
+    _fake_us = 0.0
 
 
 def advance_ticks(delta: int) -> None:
     """Posune simulovaný čas o delta milisekund."""
     global _fake_ticks
     _fake_ticks = (_fake_ticks + int(delta)) % _TICKS_PERIOD
+
+
+def advance_ticks_us(delta_us: float) -> None:
+    """
+    Posune simulovaný čas o delta_us mikrosekund.
+
+    Zbytek pod 1 ms se akumuluje, takže mnoho krátkých posunů
+    (např. přenosy po I2C) dá dohromady správný počet milisekund.
+    """
+    global _fake_us
+    total = _fake_us + delta_us
+    whole_ms = int(total // 1000)
+    _fake_us = total - whole_ms * 1000
+    if whole_ms:
+        advance_ticks(whole_ms)
+
+
+def ticks_sub_ms_us() -> float:
+    """Vrací zbytek simulovaného času pod 1 ms (v µs)."""
+    return _fake_us
@@ -9,14 +9,33 @@ Plně kompatibilní s testy:
 - deinit()
 - writeto()
 - readfrom_into()
+- writeto_then_readfrom()
+
+Volitelný časový model sběrnice (enable_timing):
+- každá transakce spotřebuje simulovaný čas podle frekvence sběrnice,
+  délky adresy a počtu bajtů (včetně START/STOP a ACK bitů),
+- o tento čas se posune adafruit_ticks, takže měření smyčky na PC
+  odpovídá skutečné zátěži sběrnice.
+
+Registr modelů zařízení (attach):
+- na adresu lze připojit stavový model (viz _fake/hardware/i2c_devices.py),
+- zápisy na tuto adresu dekóduje model, čtení odpovídají z jeho stavu,
+- ostatní adresy se chovají jako dřív (write_history + queue_read).
 """
 
+import adafruit_ticks as ticks
+
+
 class I2C:
     def __init__(self, scl=None, sda=None, frequency=400000):
         self.scl = scl
         self.sda = sda
         self.frequency = frequency
 
+        # časový model sběrnice (ve výchozím stavu vypnutý)
+        self.timing = False
+        self.bus_time_us = 0.0
+
         # Testy očekávají tyto struktury:
         self.write_history = []   # seznam: (addr, bytes)
         self.read_history = []    # seznam: (addr, length)
@@ -26,6 +45,9 @@ class I2C:
         # která byla použita ve write_history nebo queue_read.
         self._known_devices = {0x38, 0x62}
 
+        # připojené modely zařízení: adresa → model
+        self.devices = {}
+
     # ---------------------------------------------------------
     # Kompatibilita s CircuitPythonem
     # ---------------------------------------------------------
@@ -38,6 +60,52 @@ class I2C:
     def unlock(self):
         pass
 
+    # ---------------------------------------------------------
+    # Časový model sběrnice
+    # ---------------------------------------------------------
+    def enable_timing(self, enabled=True):
+        """Zapne/vypne účtování simulovaného času za přenosy."""
+        self.timing = enabled
+
+    def transaction_bits(self, addr, nwrite, nread=0):
+        """
+        Vrátí počet hodinových cyklů jedné transakce.
+
+        START (1) + adresa s ACK (9, u 10bitové adresy 18) + 9 bitů
+        na každý bajt (8 dat + ACK) + STOP (1). Zápis s následným
+        čtením obsahuje opakovaný START a adresu znovu.
+        """
+        addr_bits = 18 if addr > 0x7F else 9
+        bits = 1 + addr_bits + 9 * (nwrite + nread) + 1
+        if nwrite and nread:
+            bits += 1 + addr_bits
+        return bits
+
+    def transaction_time_us(self, addr, nwrite, nread=0):
+        """Vrátí dobu jedné transakce v µs při aktuální frekvenci sběrnice."""
+        return self.transaction_bits(addr, nwrite, nread) * 1_000_000 / self.frequency
+
+    def _charge(self, addr, nwrite, nread):
+        """Připočte dobu transakce a posune simulovaný čas."""
+        if not self.timing:
+            return
+        us = self.transaction_time_us(addr, nwrite, nread)
+        self.bus_time_us += us
+        ticks.advance_ticks_us(us)
+
+    # ---------------------------------------------------------
+    # Registr modelů zařízení
+    # ---------------------------------------------------------
+    def attach(self, device):
+        """Připojí model zařízení na jeho adresu a vrátí ho."""
+        self.devices[device.address] = device
+        self._known_devices.add(device.address)
+        return device
+
+    def detach(self, addr):
+        """Odpojí model zařízení z adresy."""
+        self.devices.pop(addr, None)
+
     # ---------------------------------------------------------
     # Testovací API
     # ---------------------------------------------------------
@@ -58,17 +126,40 @@ class I2C:
         """Vrací seznam známých zařízení."""
         return sorted(self._known_devices)
 
-    def writeto(self, addr, data, *, stop=True):
-        """Uloží zápis do write_history."""
+    def writeto(self, addr, data, *, start=0, end=None, stop=True):
+        """Uloží zápis (data[start:end]) do write_history."""
+        if end is None:
+            end = len(data)
+        self._write(addr, memoryview(data)[start:end])
+        self._charge(addr, end - start, 0)
+
+    def readfrom_into(self, addr, buf, *, start=0, end=None, stop=True):
+        """Naplní buffer (buf[start:end]) hodnotami z queue_read."""
+        if end is None:
+            end = len(buf)
+        self._read(addr, memoryview(buf)[start:end])
+        self._charge(addr, 0, end - start)
+
+    def _write(self, addr, data):
         b = bytes(data)
         self.write_history.append((addr, b))
         self._known_devices.add(addr)
 
-    def readfrom_into(self, addr, buf, *, stop=True):
-        """Naplní buffer hodnotami z queue_read."""
+        device = self.devices.get(addr)
+        if device is not None:
+            device.write(b)
+
+    def _read(self, addr, buf):
         self.read_history.append((addr, len(buf)))
         self._known_devices.add(addr)
 
+        device = self.devices.get(addr)
+        if device is not None:
+            data = device.read(len(buf))
+            for i in range(len(buf)):
+                buf[i] = data[i]
+            return
+
         if not self._read_queue:
             # Pokud není nic ve frontě, vrací nuly
             for i in range(len(buf)):
@@ -78,3 +169,14 @@ class I2C:
         data = self._read_queue.pop(0)
         for i in range(len(buf)):
             buf[i] = data[i] if i < len(data) else 0
+
+    def writeto_then_readfrom(self, addr, out_buf, in_buf, *, out_start=0, out_end=None,
+                              in_start=0, in_end=None):
+        """Zápis (uloží se do write_history) a následné čtení z queue_read."""
+        if out_end is None:
+            out_end = len(out_buf)
+        if in_end is None:
+            in_end = len(in_buf)
+        self._write(addr, memoryview(out_buf)[out_start:out_end])
+        self._read(addr, memoryview(in_buf)[in_start:in_end])
+        self._charge(addr, out_end - out_start, in_end - in_start)
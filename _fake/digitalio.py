@@ -8,8 +8,44 @@ Fake implementace CircuitPython modulu `digitalio`.
 Simuluje digitální piny (GPIO) pro vývoj a testování na PC.
 Chování je deterministické a ukládá historii změn, aby bylo možné
 psát přesné unit testy bez skutečného hardware.
+
+Vnější buzení vstupů (testovací API):
+    drive(pin, value)   – nastaví úroveň, kterou na pinu drží okolí
+                          (např. INT výstup PCF8574); projeví se ve value
+                          všech DigitalInOut na tomto pinu, i později vytvořených
+    release(pin)        – okolí pin přestane budit (platí opět pull rezistor)
+    reset()             – zapomene buzení všech pinů i vytvořené objekty
+                          (volá se v tearDown testů, aby stav nepřešel do dalších)
 """
 
+# úrovně, kterými okolí budí piny: pin → bool
+_driven = {}
+
+# vytvořené DigitalInOut objekty: pin → seznam objektů
+_instances = {}
+
+
+def drive(pin, value):
+    """Nastaví úroveň, kterou na pinu drží okolí (testovací API)."""
+    _driven[pin] = bool(value)
+    for io in _instances.get(pin, ()):
+        if io.direction == Direction.INPUT:
+            io.value = bool(value)
+
+
+def reset():
+    """Zapomene buzení všech pinů i vytvořené DigitalInOut (testovací API)."""
+    _driven.clear()
+    _instances.clear()
+
+
+def release(pin):
+    """Okolí přestane pin budit – vstup se vrátí na úroveň pull rezistoru."""
+    _driven.pop(pin, None)
+    for io in _instances.get(pin, ()):
+        if io.direction == Direction.INPUT:
+            io.value = io.pull == Pull.UP
+
 class Direction:
     """
     Enum-like třída reprezentující směr digitálního pinu.
@@ -55,6 +91,7 @@ class DigitalInOut:
         self.pull = None
         self.value = False
         self.write_history = []
+        _instances.setdefault(pin, []).append(self)
 
     def switch_to_output(self, value=False):
         """
@@ -76,10 +113,16 @@ class DigitalInOut:
         """
         self.direction = Direction.INPUT
         self.pull = pull
+        if self.pin in _driven:
+            self.value = _driven[self.pin]
+        else:
+            self.value = pull == Pull.UP
 
     def deinit(self):
         """
         Dummy metoda pro kompatibilitu s CircuitPythonem.
         V reálném zařízení uvolňuje pin.
         """
-        pass
+        instances = _instances.get(self.pin)
+        if instances and self in instances:
+            instances.remove(self)
@@ -0,0 +1,6 @@
+"""
+hardware – detailní simulace periferií pro fake hardware.
+
+Obsahuje stavové modely I2C zařízení, které lze připojit
+k fake busio.I2C (viz I2C.attach()).
+"""
@@ -0,0 +1,370 @@
+"""
+i2c_devices.py – stavové modely I2C zařízení pro fake busio.I2C.
+
+Každý model dekóduje zápisy do svého vnitřního stavu (registrů)
+a na čtení odpovídá z tohoto stavu. Testy tak nemusí ručně plnit
+frontu queue_read() a simulace může běžet libovolně dlouho.
+
+Modely:
+- PCA9633Model     – PWM driver motorů JoyCaru (0x62)
+- PCF8574Model     – I/O expander senzorů JoyCaru (0x38)
+- IS31FL3731Model  – LED matice 17×7 na pico:ed (0x74)
+- CuteBotProModel  – řídicí deska CuteBot Pro, protokol 0xFF 0xF9 (0x10)
+
+Použití:
+    from busio import I2C
+    from _fake.hardware.i2c_devices import PCA9633Model
+
+    hw = I2C()
+    pca = hw.attach(PCA9633Model())
+    ...
+    pca.pwm(0)
+"""
+
+
+class FakeI2CDevice:
+    """
+    Základ modelu I2C zařízení.
+
+    Potomci přepisují write() a read(). Fake sběrnice volá:
+        - write(data)  pro každý zápis (bytes),
+        - read(n)      pro každé čtení, musí vrátit n bajtů.
+    """
+
+    address = 0x00
+
+    def __init__(self, address=None):
+        if address is not None:
+            self.address = address
+
+    def write(self, data):
+        pass
+
+    def read(self, n):
+        return bytes(n)
+
+
+# ---------------------------------------------------------
+# PCA9633
+# ---------------------------------------------------------
+
+class PCA9633Model(FakeI2CDevice):
+    """
+    Model PWM driveru PCA9633.
+
+    Řídicí bajt: bity 7:5 = režim auto-inkrementu, bity 3:0 = registr.
+    Režimy auto-inkrementu (rozsah, ve kterém ukazatel rotuje):
+        000 – bez inkrementu
+        100 – všechny registry 0x00–0x0C
+        101 – jen PWM0–PWM3 (0x02–0x05)
+        110 – jen GRPPWM–GRPFREQ (0x06–0x07)
+        111 – PWM0–GRPFREQ (0x02–0x07)
+    """
+
+    address = 0x62
+    REGISTER_COUNT = 13
+
+    # režim auto-inkrementu → (první, poslední) registr
+    _AI_RANGES = {
+        0b100: (0x00, 0x0C),
+        0b101: (0x02, 0x05),
+        0b110: (0x06, 0x07),
+        0b111: (0x02, 0x07),
+    }
+
+    def __init__(self, address=None):
+        super().__init__(address)
+        self.regs = bytearray(self.REGISTER_COUNT)
+        self.regs[0x00] = 0x11   # MODE1 po resetu (SLEEP + ALLCALL)
+        self.regs[0x01] = 0x05   # MODE2 po resetu
+        self.regs[0x06] = 0xFF   # GRPPWM po resetu
+        self.regs[0x0C] = 0xE0   # ALLCALLADR po resetu
+        self._pointer = 0
+        self._ai = 0
+        self.frames = 0
+
+    def _advance(self):
+        """Posune ukazatel registru podle režimu auto-inkrementu."""
+        rng = self._AI_RANGES.get(self._ai)
+        if rng is None:
+            return
+        first, last = rng
+        self._pointer = first if self._pointer >= last else self._pointer + 1
+
+    def write(self, data):
+        if not data:
+            return
+        self.frames += 1
+        self._ai = data[0] >> 5
+        self._pointer = data[0] & 0x0F
+        for value in data[1:]:
+            if self._pointer < self.REGISTER_COUNT:
+                self.regs[self._pointer] = value
+            self._advance()
+
+    def read(self, n):
+        out = bytearray(n)
+        for i in range(n):
+            if self._pointer < self.REGISTER_COUNT:
+                out[i] = self.regs[self._pointer]
+            self._advance()
+        return bytes(out)
+
+    def pwm(self, channel):
+        """Vrátí hodnotu PWM kanálu 0–3."""
+        return self.regs[0x02 + channel]
+
+
+# ---------------------------------------------------------
+# PCF8574
+# ---------------------------------------------------------
+
+class PCF8574Model(FakeI2CDevice):
+    """
+    Model I/O expanderu PCF8574 (kvazi-obousměrné piny).
+
+    Atributy:
+        pins   – úroveň, kterou na pinech drží okolí (senzory), výchozí 0xFF
+        latch  – poslední zapsaný bajt; pin se zapsanou 0 čte vždy 0
+        intPin – pin mikrokontroléru připojený na výstup INT (nebo None)
+
+    INT (aktivní v nule) se stáhne, když se vstupy liší od posledního
+    čtení, a uvolní se čtením expanderu – stejně jako u skutečného čipu.
+    """
+
+    address = 0x38
+
+    def __init__(self, address=None, pins=0xFF, intPin=None):
+        super().__init__(address)
+        self.latch = 0xFF
+        self.reads = 0
+        self.intPin = intPin
+        self._pins = pins
+        self._lastRead = pins & self.latch
+        self._driveInt(True)
+
+    @property
+    def pins(self):
+        return self._pins
+
+    @pins.setter
+    def pins(self, value):
+        self._pins = value
+        if (value & self.latch) != self._lastRead:
+            self._driveInt(False)
+
+    def _driveInt(self, level):
+        if self.intPin is not None:
+            import digitalio
+            digitalio.drive(self.intPin, level)
+
+    def write(self, data):
+        if data:
+            self.latch = data[-1]
+            self._lastRead = self._pins & self.latch
+            self._driveInt(True)
+
+    def read(self, n):
+        self.reads += 1
+        self._lastRead = self._pins & self.latch
+        self._driveInt(True)
+        return bytes([self._lastRead]) * n
+
+
+# ---------------------------------------------------------
+# IS31FL3731
+# ---------------------------------------------------------
+
+class IS31FL3731Model(FakeI2CDevice):
+    """
+    Model LED driveru IS31FL3731 (matice 17×7 na pico:ed).
+
+    Registr 0xFD vybírá banku: 0–7 = snímky (frame), 0x0B = funkční registry.
+    Každý snímek má 0xB4 registrů:
+        0x00–0x11 zapnutí LED, 0x12–0x23 blikání, 0x24–0xB3 PWM (144 LED).
+    Zápisy i čtení automaticky inkrementují registr.
+    """
+
+    address = 0x74
+
+    COMMAND = 0xFD
+    FUNCTION_BANK = 0x0B
+    FRAME_SIZE = 0xB4
+    PWM_START = 0x24
+
+    # funkční registry
+    REG_CONFIG = 0x00
+    REG_PICTURE_FRAME = 0x01
+    REG_AUTOPLAY1 = 0x02
+    REG_AUTOPLAY2 = 0x03
+    REG_BREATH1 = 0x08
+    REG_BREATH2 = 0x09
+    REG_SHUTDOWN = 0x0A
+
+    def __init__(self, address=None):
+        super().__init__(address)
+        self.frames = [bytearray(self.FRAME_SIZE) for _ in range(8)]
+        self.function = bytearray(0x0D)
+        self.bank = 0
+        self._pointer = 0
+        self.bytes_written = 0
+
+    def _bankData(self):
+        if self.bank == self.FUNCTION_BANK:
+            return self.function
+        return self.frames[self.bank & 0x07]
+
+    def write(self, data):
+        if not data:
+            return
+        self.bytes_written += len(data)
+        reg = data[0]
+        if reg == self.COMMAND:
+            if len(data) > 1:
+                self.bank = data[1]
+            return
+        self._pointer = reg
+        bank = self._bankData()
+        for value in data[1:]:
+            if self._pointer < len(bank):
+                bank[self._pointer] = value
+            self._pointer += 1
+
+    def read(self, n):
+        bank = self._bankData()
+        out = bytearray(n)
+        for i in range(n):
+            if self._pointer < len(bank):
+                out[i] = bank[self._pointer]
+            self._pointer += 1
+        return bytes(out)
+
+    def pwm(self, frame=None):
+        """Vrátí 144 hodnot PWM daného snímku (výchozí = právě zobrazený)."""
+        if frame is None:
+            frame = self.displayed_frame()
+        start = self.PWM_START
+        return bytes(self.frames[frame][start:start + 144])
+
+    def displayed_frame(self):
+        """Vrátí číslo snímku zobrazeného v režimu obrázku."""
+        return self.function[self.REG_PICTURE_FRAME] & 0x07
+
+    def mode(self):
+        """Vrátí režim zobrazení: 0 = obrázek, 1 = autoplay, 2 = audio."""
+        return (self.function[self.REG_CONFIG] >> 3) & 0x03
+
+    def is_awake(self):
+        """Vrací True, pokud čip není v režimu shutdown."""
+        return self.function[self.REG_SHUTDOWN] & 0x01 == 1
+
+
+# ---------------------------------------------------------
+# CuteBot Pro
+# ---------------------------------------------------------
+
+class CuteBotProModel(FakeI2CDevice):
+    """
+    Model řídicí desky CuteBot Pro (protokol V2, rámec 0xFF 0xF9).
+
+    Rámec zápisu: [0xFF, 0xF9, příkaz, délka, parametry...]
+    Po příkazu, který něco vrací (0x60, 0xA0), připraví model odpověď
+    pro následující čtení.
+
+    Atributy:
+        left_speed, right_speed – poslední přímé řízení motorů (-100..100)
+        lights                  – barvy světlometů [(r, g, b), (r, g, b)]
+        line_state              – stav 4kanálového čárového senzoru (0–15)
+        line_offset             – offset čáry 0–6000 (3000 = střed)
+        gray                    – šedé hodnoty 4 kanálů
+        distance                – počítadla enkodérů [levý, pravý]
+        pid_done                – stav dokončení PID akce (0 = běží)
+        version                 – verze firmware (3 bajty)
+        commands                – historie (příkaz, parametry)
+    """
+
+    address = 0x10
+
+    def __init__(self, address=None):
+        super().__init__(address)
+        self.left_speed = 0
+        self.right_speed = 0
+        self.lights = [(0, 0, 0), (0, 0, 0)]
+        self.line_state = 0
+        self.line_offset = 3000
+        self.gray = [0, 0, 0, 0]
+        self.distance = [0, 0]
+        self.pid_done = 1
+        self.version = (2, 0, 0)
+        self.commands = []
+        self._response = b""
+
+    def write(self, data):
+        if len(data) < 4 or data[0] != 0xFF or data[1] != 0xF9:
+            return
+        command = data[2]
+        params = bytes(data[4:4 + data[3]])
+        self.commands.append((command, params))
+        handler = getattr(self, "_cmd_%02X" % command, None)
+        if handler is not None:
+            handler(params)
+
+    def read(self, n):
+        out = bytearray(n)
+        for i in range(min(n, len(self._response))):
+            out[i] = self._response[i]
+        return bytes(out)
+
+    def advance(self, ms):
+        """Posune simulaci o ms – enkodéry přičtou ujetou dráhu podle rychlosti."""
+        self.distance[0] += abs(self.left_speed) * ms // 100
+        self.distance[1] += abs(self.right_speed) * ms // 100
+
+    # --- příkazy -----------------------------------------------------------
+
+    def _cmd_10(self, p):
+        """Přímé řízení motorů: [kolo, |levá|, |pravá|, směr]."""
+        wheel, left, right, direction = p[0], p[1], p[2], p[3]
+        if direction & 0x01:
+            left = -left
+        if direction & 0x02:
+            right = -right
+        if wheel in (0, 2):
+            self.left_speed = left
+        if wheel in (1, 2):
+            self.right_speed = right
+
+    def _cmd_20(self, p):
+        """Světlomety: [světlo, r, g, b]."""
+        color = (p[1], p[2], p[3])
+        if p[0] in (0, 2):
+            self.lights[0] = color
+        if p[0] in (1, 2):
+            self.lights[1] = color
+
+    def _cmd_50(self, p):
+        """Vynulování enkodéru."""
+        if p[0] < 2:
+            self.distance[p[0]] = 0
+
+    def _cmd_60(self, p):
+        """Čárový senzor: 0 = stav, 1 = offset, 2 = šedá hodnota kanálu."""
+        if p[0] == 0x00:
+            self._response = bytes([self.line_state & 0x0F])
+        elif p[0] == 0x01:
+            self._response = bytes([(self.line_offset >> 8) & 0xFF, self.line_offset & 0xFF])
+        elif p[0] == 0x02:
+            self._response = bytes([self.gray[p[1] & 0x03] & 0xFF])
+
+    def _cmd_A0(self, p):
+        """Dotazy: 0 = verze, 1/2 = rychlost, 3/4 = vzdálenost, 5 = stav PID."""
+        what = p[0]
+        if what == 0x00:
+            self._response = bytes(self.version)
+        elif what in (0x01, 0x02):
+            speed = self.left_speed if what == 0x01 else self.right_speed
+            self._response = bytes([abs(speed) & 0xFF])
+        elif what in (0x03, 0x04):
+            self._response = (self.distance[what - 3] & 0xFFFFFFFF).to_bytes(4, "little")
+        elif what == 0x05:
+            self._response = bytes([self.pid_done])
@@ -12,10 +12,16 @@ import adafruit_ticks as ticks
 perf_counter = _real_time.perf_counter
 monotonic = _real_time.monotonic
 
+# potřebuje je standardní knihovna (logging, asyncio)
+localtime = _real_time.localtime
+gmtime = _real_time.gmtime
+strftime = _real_time.strftime
+get_clock_info = _real_time.get_clock_info
+
 # Fake funkce pro studentský kód
 def monotonic_ns() -> int:
-    """Deterministická verze monotonic_ns() pro studentský kód."""
-    return ticks.ticks_ms() * 1_000_000
+    """Deterministická verze monotonic_ns() pro studentský kód (včetně zbytku pod 1 ms)."""
+    return ticks.ticks_ms() * 1_000_000 + int(ticks.ticks_sub_ms_us() * 1000)
 
 def time() -> float:
     """Deterministická verze time() pro studentský kód."""
@@ -10,7 +10,7 @@ class Display:
 
     Tato třída poskytuje:
     - rychlé vykreslování ikon a čísel,
-    - optimalizovaný přenos přes I²C (jediný blok 145 bajtů),
+    - optimalizovaný přenos přes I²C (jen změněné úseky, nejvýše 145 bajtů),
     - předpočítané indexy pro ikony (ultra-fast bitmapy),
     - zpětně kompatibilní API (iconA/B/C, number, position, sensors, redraw).
 
@@ -42,7 +42,7 @@ class Display:
     """
 
     def __init__(self) -> None: ...
-    def __new__(cls) -> "Display": ...
+    def __new__(cls, i2c: Optional[object] = None) -> "Display": ...
 
     # ---------------------------------------------------------
     # Základní operace s pixely
@@ -78,6 +78,7 @@ class Display:
         Chování:
         - Nastaví všech 144 fyzických LED na stejnou hodnotu jasu.
         - Hodnota jasu je oříznuta do rozsahu 0–255.
+        - Framebuffer se vyplní zdvojováním kopií řezů (8 kopií místo 144 zápisů).
         - Po nastavení všech hodnot se provede `flush()`, takže změna je okamžitě vidět.
 
         Typické použití:
@@ -157,14 +158,17 @@ class Display:
 
     def flush(self) -> None:
         """
-        Překreslí displej – odešle celý interní framebuffer do LED driveru.
+        Překreslí displej – odešle změněné úseky framebufferu do LED driveru.
 
         Chování:
-        - Odešle 145 bajtů přes I²C:
-          - první bajt je adresa registru PWM (0x24),
-          - následuje 144 bajtů jasu pro jednotlivé LED.
-        - Používá jediný I²C přenos bez dalších alokací.
-        - Čas trvání je dán rychlostí I²C (při 650 kHz cca 3 ms).
+        - Sleduje, které bajty se od posledního flush() změnily
+          (po blocích 16 bajtů), a odešle jen tyto úseky:
+          - každý úsek je jeden zápis s auto-inkrementem od registru 0x24 + index,
+          - blízké úseky (mezera do 2 bajtů) se sloučí do jednoho zápisu.
+        - Po `fill()`/`clear()` se odešle celý snímek (145 bajtů, cca 3 ms při 650 kHz),
+          změna jednoho pixelu stojí jen 2 bajty.
+        - Odesílá se přímo z flush bufferu bez dalších alokací.
+        - S plánovačem (`setScheduler`) se vždy zařadí celý snímek.
 
         Poznámka:
         - Tato metoda je relativně „drahá“ (v řádu milisekund),
@@ -172,6 +176,16 @@ class Display:
           po sérii změn (např. více ikon s `flush=False`).
         """
 
+    async def flushAsync(self) -> None:
+        """
+        Asynchronní varianta `flush()` pro asyncio.
+
+        Chování:
+        - Pokud je sběrnice obsazená, předává řízení ostatním úlohám
+          (`await asyncio.sleep(0)`) místo aktivního čekání.
+        - Jinak se chová stejně jako `flush()`.
+        """
+
     def redraw(self) -> None:
         """
         Alias pro `flush()` – zachovává kompatibilitu s původním API.
@@ -181,6 +195,295 @@ class Display:
         - Vhodné pro starší kód, který používal `display.redraw()`.
         """
 
+    # ---------------------------------------------------------
+    # Hromadné operace
+    # ---------------------------------------------------------
+
+    def rect(
+        self,
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        color: Optional[int] = None,
+        filled: bool = True,
+        flush: bool = True,
+    ) -> None:
+        """
+        Vykreslí obdélník s levým horním rohem (x, y) o rozměru w × h.
+
+        Chování:
+        - Ořízne se na displej.
+        - Vyplněný obdélník je jedna kopie řezu framebufferu na sloupec
+          (pixely sloupce leží ve framebufferu za sebou).
+        - `filled=False` vykreslí jen obrys.
+        """
+
+    def hline(self, x: int, y: int, w: int, color: Optional[int] = None, flush: bool = True) -> None:
+        """Vykreslí vodorovnou čáru délky w od (x, y)."""
+
+    def vline(self, x: int, y: int, h: int, color: Optional[int] = None, flush: bool = True) -> None:
+        """Vykreslí svislou čáru délky h od (x, y) – jedna kopie řezu."""
+
+    def line(
+        self, x0: int, y0: int, x1: int, y1: int, color: Optional[int] = None, flush: bool = True
+    ) -> None:
+        """Vykreslí úsečku (Bresenham, pixely mimo displej se vynechají)."""
+
+    def row(self, y: int, color: Optional[int] = None, flush: bool = True) -> None:
+        """Nastaví celý řádek y na jednu hodnotu jasu."""
+
+    def column(self, x: int, color: Optional[int] = None, flush: bool = True) -> None:
+        """Nastaví celý sloupec x na jednu hodnotu jasu."""
+
+    def blitFrame(self, src: bytes, flush: bool = True) -> None:
+        """
+        Zkopíruje celý snímek (144 bajtů, viz `snapshot()`) do framebufferu.
+
+        Chování:
+        - Jediná kopie řezu, jiná délka než 144 vyhodí ValueError.
+        """
+
+    # ---------------------------------------------------------
+    # Sprity (libovolná pozice)
+    # ---------------------------------------------------------
+
+    def blit(
+        self,
+        bitmap,
+        x: int,
+        y: int,
+        color: Optional[int] = None,
+        transparent: bool = False,
+        width: int = 5,
+        flush: bool = True,
+    ) -> None:
+        """
+        Vykreslí bitmapu na libovolnou pozici (x, y) = levý horní roh.
+
+        Parametry:
+        - bitmap: posloupnost řádků (tuple/bytes), bit ix řádku je sloupec x + ix.
+        - color: jas rozsvícených pixelů (None = `default_brightness`).
+        - transparent: zhasnuté pixely bitmapy se nekreslí.
+        - width: šířka bitmapy v pixelech.
+        - flush: po vykreslení provede `flush()`.
+
+        Chování:
+        - Pixely mimo displej se oříznou (x i y mohou být záporné).
+        - Bitmapa se pro danou pozici přeloží na pole indexů jednou
+          a uloží do LRU cache (`joycar.sprites.SpriteCache`) –
+          další vykreslení je stejně rychlé jako `iconA/B/C`.
+        """
+
+    def glyph(
+        self,
+        name: str,
+        x: int,
+        y: int,
+        color: Optional[int] = None,
+        transparent: bool = False,
+        flush: bool = True,
+    ) -> None:
+        """
+        Vykreslí piktogram 5×5 (číslice, písmena, šipky …) na libovolnou pozici.
+
+        Parametry i chování jako `blit()`; název je klíč piktogramu (např. "5", "<").
+        """
+
+    def setScheduler(self, scheduler: Optional[object]) -> None:
+        """
+        Odesílá snímky přes prioritní plánovač (`joycar.scheduler.BusScheduler`).
+
+        Chování:
+        - `flush()` snímek neodešle hned, ale zařadí ho jako přenos třídy DISPLAY.
+        - Pokud se v ticku plánovače nevejde do rozpočtu, odloží se;
+          opakovaný `flush()` ho znovu nezařadí – odešle se jednou
+          s nejnovějším obsahem framebufferu.
+        - `None` vrátí přímý zápis na sběrnici.
+        - Plánovač musí řídit sběrnici displeje (na pico:ed interní sběrnici);
+          plánovač sběrnice robota vyhodí ValueError.
+        """
+
+    # ---------------------------------------------------------
+    # Snímky čipu: double buffering a uložené obrazovky
+    # ---------------------------------------------------------
+
+    FIRST_SCREEN: int
+    """První snímek čipu pro uložené obrazovky (2)."""
+
+    LAST_SCREEN: int
+    """Poslední snímek čipu pro uložené obrazovky (7)."""
+
+    def setDoubleBuffer(self, enabled: bool = True) -> None:
+        """
+        Zapne/vypne double buffering.
+
+        Chování:
+        - `flush()` zapisuje do skrytého snímku (0 nebo 1) a po dokončení
+          ho zobrazí jediným zápisem registru – rozpracovaný snímek není vidět.
+        - Zadní snímek se dorovnává o změny z předchozího `flush()`,
+          takže se stále odesílají jen změněné úseky.
+        - Nelze kombinovat s plánovačem (`setScheduler`) – vyhodí ValueError.
+        """
+
+    def storeScreen(self, slot: int) -> None:
+        """
+        Nahraje aktuální framebuffer do snímku čipu `slot` (2–7).
+
+        Chování:
+        - Přenese celý snímek (145 bajtů) jednou, např. při startu programu.
+        - Framebuffer ani zobrazený obsah se nemění.
+        - Jiný slot vyhodí ValueError.
+        """
+
+    def showScreen(self, slot: int) -> None:
+        """
+        Zobrazí obrazovku uloženou `storeScreen()` jediným zápisem registru.
+
+        Chování:
+        - Obrazovka zůstane zobrazená do nejbližšího `flush()` se změnami,
+          ten opět zobrazí živý framebuffer.
+        """
+
+    # ---------------------------------------------------------
+    # Posuv textu
+    # ---------------------------------------------------------
+
+    def scroll(
+        self,
+        text: str,
+        y: int = 0,
+        color: Optional[int] = None,
+        periodMs: int = 100,
+        loop: bool = False,
+    ) -> object:
+        """
+        Spustí neblokující posuv textu (`joycar.scroller.TextScroller`).
+
+        Parametry:
+        - text: text z piktogramů (malá písmena se zkusí jako velká,
+          neznámé znaky se vykreslí jako mezera).
+        - y: horní řádek textu (0–1, text má 5 řádků; spodní řádek patří
+          liště senzorů, jinak ValueError).
+        - color: jas textu 0–255, mimo rozsah se ořízne (None = `default_brightness`).
+        - periodMs: doba posuvu o jeden sloupec.
+        - loop: po odjetí textu začít znovu.
+
+        Chování:
+        - Bitmapa textu se sestaví jednou, každý krok je 17 kopií řezů
+          do framebufferu (žádná volání `pixel()`).
+        - Text posouvá `update()` (tedy i `JoyCarRobot.update()`),
+          mění se jen řádky y až y + 4 – lišta senzorů zůstane.
+        - Vrací TextScroller, lze ho posouvat i ručně (`step()`).
+        """
+
+    def stopScroll(self) -> None:
+        """Zastaví posuv textu (text zůstane ve framebufferu)."""
+
+    def isScrolling(self) -> bool:
+        """Vrací True, pokud běží posuv textu."""
+
+    # ---------------------------------------------------------
+    # Animace na čipu (autoplay / dýchání)
+    # ---------------------------------------------------------
+
+    def snapshot(self) -> bytes:
+        """Vrátí kopii framebufferu (144 bajtů) – snímek pro `playAnimation()`."""
+
+    def playAnimation(
+        self,
+        frames: list,
+        delayMs: int = 110,
+        loops: int = 0,
+        breath: bool = False,
+        fadeInMs: int = 208,
+        fadeOutMs: int = 208,
+        offMs: int = 0,
+    ) -> None:
+        """
+        Nahraje až 8 snímků do čipu a spustí jejich přehrávání (autoplay).
+
+        Parametry:
+        - frames: seznam snímků po 144 bajtech (viz `snapshot()`).
+        - delayMs: doba jednoho snímku (krok 11 ms, 11–704 ms).
+        - loops: počet opakování 1–7, 0 = nekonečně.
+        - breath: zapne dýchání (plynulý náběh a doběh jasu).
+        - fadeInMs, fadeOutMs: náběh/doběh (26 ms · 2^n, nejvýše 3328 ms).
+        - offMs: zhasnutí mezi nádechy (3,5 ms · 2^n, nejvýše 448 ms).
+
+        Chování:
+        - Animace běží na čipu bez práce procesoru a bez provozu na sběrnici.
+        - Snímky se ukládají na konec paměti čipu a přepíší uložené obrazovky
+          ve stejných snímcích.
+        - Během animace `flush()` nic neodesílá, změny se projeví po `stopAnimation()`.
+        """
+
+    def breathe(self, fadeInMs: int = 208, fadeOutMs: int = 208, offMs: int = 0) -> None:
+        """Zapne dýchání zobrazeného obrazu (časy viz `playAnimation()`)."""
+
+    def stopAnimation(self) -> None:
+        """Zastaví animaci i dýchání, vrátí režim obrázku a zobrazí framebuffer."""
+
+    def isAnimating(self) -> bool:
+        """Vrací True, pokud na čipu běží animace nebo dýchání."""
+
+    # ---------------------------------------------------------
+    # Odložené vykreslování (snímky)
+    # ---------------------------------------------------------
+
+    FRAME_MS: int
+    """Výchozí perioda snímků pro `update()` v ms."""
+
+    def setFrameRate(self, fps: int) -> None:
+        """Nastaví, kolikrát za sekundu smí `update()` odeslat snímek."""
+
+    def setMaxFps(self, fps: Optional[int] = None) -> None:
+        """
+        Zapne režim max FPS (slučování snímků).
+
+        Chování:
+        - `flush()` (i nepřímo z `iconA`, `fill`, `clear` …) jen zaznamená požadavek,
+          změny se slučují ve framebufferu.
+        - Nejvýše `fps` snímků za sekundu odešle `update()` – volané z hlavní
+          smyčky (`JoyCarRobot.update()`) nebo podle vlastní `Period`.
+        - `None` režim vypne, `flush()` opět odesílá hned.
+        """
+
+    def framesRequested(self) -> int:
+        """
+        Vrátí počet požadovaných snímků: volání `flush()` se změnami
+        a `update()`, které vykreslilo lištu senzorů nebo posunulo text.
+        """
+
+    def framesSent(self) -> int:
+        """Vrátí počet skutečně odeslaných snímků."""
+
+    def resetFrameStats(self) -> None:
+        """Vynuluje počítadla snímků."""
+
+    def setSensorBar(self, pattern: int, bh: int = 9, bl: int = 1) -> None:
+        """
+        Zaznamená stav lišty senzorů na spodním řádku.
+
+        Chování:
+        - Nic nevykresluje ani neodesílá, vzor se vykreslí v nejbližším `update()`.
+        - Bity vzoru: 0 = překážka vlevo, 1 = vlevo, 2 = střed,
+          3 = vpravo, 4 = překážka vpravo.
+        """
+
+    def update(self) -> bool:
+        """
+        Vykreslí čekající změny a podle plánu snímků odešle framebuffer.
+
+        Chování:
+        - Volá se z hlavní smyčky (`JoyCarRobot.update()` to dělá sám).
+        - Mezi dvěma snímky se nic neodesílá, změny se jen hromadí.
+        - Vrací True, pokud byl odeslán snímek.
+        """
+
+    async def updateAsync(self) -> bool:
+        """Asynchronní varianta `update()`."""
+
     # ---------------------------------------------------------
     # Senzory a vyšší API
     # ---------------------------------------------------------
@@ -323,6 +626,11 @@ Použití:
 - `display.number(123)`
 - `display.sensors(...)`
 
-Tato instance je vytvořena při importu modulu `Display.py` a sdílí
-interní I²C spojení i framebuffer.
+Import modulu nemá vedlejší efekty: `display` je zástupce a skutečná
+instance (převzetí interní I²C sběrnice, inicializace čipu) vznikne
+až při prvním použití. Poté sdílí interní I²C spojení i framebuffer.
+
+- `display.isCreated()` vrací True, pokud už displej vznikl.
+- Atributy (např. jas) nastavujte metodami (`set_brightness()`).
+- Indexy ikon se počítají až při prvním vykreslení dané ikony.
 """
@@ -6,11 +6,15 @@ Studentům:
 - JoyCarRobot je hlavní třída, která propojuje displej, senzory a motory.
 """
 
-from picoed import i2c as pico_i2c
-
+from .buses import BusManager, buses, DISPLAY_BUS, ROBOT_BUS
 from .display import Display, display
+from .sprites import SpriteCache
+from .scroller import TextScroller
 from .battery import battery_voltage
 from .i2c import I2C
+from .busstats import BusStats
+from .scheduler import BusScheduler
+from .trace import BusTrace, TracedBus
 from .pcf8574 import PCF8574
 from .pca9633 import PCA9633, PCA9633_registers
 from .robot import JoyCarRobot
@@ -21,4 +25,4 @@ from .wheels import Wheels
 
 def createJoyCarRobot() -> JoyCarRobot:
     """Vytvoří a vrátí instanci JoyCarRobota."""
-    return JoyCarRobot(I2C(pico_i2c))
+    return JoyCarRobot(buses.i2c(ROBOT_BUS))
@@ -0,0 +1,79 @@
+"""
+aio.py – sada asyncio úloh pro JoyCar robota.
+
+Senzory, motory a displej běží jako samostatné úlohy, každá s vlastní
+periodou. Čekání na sběrnici i na další periodu předává řízení ostatním
+úlohám, takže se procesor netočí v `while not try_lock()` smyčkách.
+
+Použití:
+    import asyncio
+    from joycar import createJoyCarRobot
+    from joycar.aio import run
+
+    robot = createJoyCarRobot()
+    asyncio.run(run(robot, sensorsMs=10, wheelsMs=20, displayMs=100))
+
+Vlastní logika jako další úloha:
+    async def main():
+        tasks = createTasks(robot)
+        tasks.append(asyncio.create_task(myLogic(robot)))
+        await asyncio.gather(*tasks)
+"""
+
+import asyncio
+
+from joycar.display import display
+from joycar.robot import JoyCarRobot
+
+
+async def sensorsTask(robot: JoyCarRobot, periodMs: int = 10) -> None:
+    """
+    Periodicky obsluhuje senzory.
+
+    Expander se čte podle plánu senzorů (Sensors.updateAsync) – v režimu
+    přerušení jen při INT nebo po záložní periodě, jinak podle periody
+    čtení. periodMs určuje jen, jak často úloha plán kontroluje.
+    """
+    while True:
+        await robot.sensors.updateAsync()
+        await asyncio.sleep(periodMs / 1000)
+
+
+async def wheelsTask(robot: JoyCarRobot, periodMs: int = 20) -> None:
+    """Periodicky aktualizuje motory."""
+    while True:
+        await robot.wheels.updateAsync()
+        await asyncio.sleep(periodMs / 1000)
+
+
+async def displayTask(periodMs: int = 100) -> None:
+    """Periodicky překresluje displej (jen pokud se něco změnilo)."""
+    while True:
+        await display.updateAsync()
+        await asyncio.sleep(periodMs / 1000)
+
+
+def createTasks(robot: JoyCarRobot, sensorsMs: int = 10, wheelsMs: int = 20,
+                displayMs: int = 100) -> list:
+    """Vytvoří a vrátí úlohy pro senzory, motory a displej."""
+    return [
+        asyncio.create_task(sensorsTask(robot, sensorsMs)),
+        asyncio.create_task(wheelsTask(robot, wheelsMs)),
+        asyncio.create_task(displayTask(displayMs)),
+    ]
+
+
+async def run(robot: JoyCarRobot, sensorsMs: int = 10, wheelsMs: int = 20,
+              displayMs: int = 100) -> None:
+    """
+    Spustí úlohy robota a čeká na ně.
+
+    Při ukončení (chyba, zrušení úlohy) robota zastaví.
+    """
+    tasks = createTasks(robot, sensorsMs, wheelsMs, displayMs)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        robot.stop()
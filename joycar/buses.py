@@ -0,0 +1,258 @@
+"""
+buses.py – správa fyzických I2C sběrnic JoyCar robota.
+
+Tento modul poskytuje třídu BusManager, která:
+- vlastní všechny fyzické I2C sběrnice (vytváří je, případně uvolní piny),
+- pro každou sběrnici zvolí nejvyšší bezpečnou frekvenci podle
+  zaregistrovaných zařízení (nejpomalejší zařízení určuje takt),
+- rozdává sdílené joycar.i2c.I2C wrappery (jeden na sběrnici),
+- umí změřit a vypsat vytížení jednotlivých sběrnic.
+
+Globální instance `buses` zná obě sběrnice pico:ed:
+    DISPLAY_BUS – interní sběrnice LED matice (I2C0, max. 650 kHz)
+    ROBOT_BUS   – sběrnice konektoru (picoed.i2c) s PCF8574 a PCA9633
+
+Import modulu nic nevytváří: sběrnice se definují až při prvním použití
+`buses` a zařízení se zaregistrují samy, když je ovladač poprvé použije
+(Display, PCF8574, PCA9633).
+
+Použití:
+    from joycar.buses import buses, ROBOT_BUS
+    i2c = buses.i2c(ROBOT_BUS)
+
+    # CuteBot Pro na stejné sběrnici
+    buses.register(ROBOT_BUS, 0x10)
+    bot = CuteBotPro(i2c=buses.hw(ROBOT_BUS))
+
+    # vytížení sběrnic
+    buses.enableStats()
+    ...
+    buses.report()
+"""
+
+from time import monotonic_ns
+from busio import I2C as BusIO_I2C
+from joycar.busstats import BusStats
+from joycar.i2c import I2C
+from utils.log import log
+
+DISPLAY_BUS = "display"
+ROBOT_BUS = "robot"
+
+# maximální frekvence sběrnice podle zařízení (Hz)
+DEVICE_MAX_FREQUENCY = {
+    0x10: 100_000,      # CuteBot Pro
+    0x38: 100_000,      # PCF8574 (standard mode)
+    0x62: 1_000_000,    # PCA9633 (Fast-mode Plus)
+    0x74: 1_000_000,    # IS31FL3731
+}
+
+# frekvence pro zařízení, které v tabulce není
+DEFAULT_MAX_FREQUENCY = 100_000
+
+
+class _Bus:
+    """Záznam o jedné fyzické sběrnici."""
+
+    def __init__(self, name: str, scl, sda, maxFrequency: int, release, hw) -> None:
+        self.name = name
+        self.scl = scl
+        self.sda = sda
+        self.maxFrequency = maxFrequency
+        self.release = release
+        self.hw = hw
+        self.devices = {}
+        self.wrapper = None
+        self.stats = None
+        self.statsStart = 0
+
+
+class BusManager:
+    """
+    Vlastník všech fyzických I2C sběrnic.
+
+    Sběrnice se definuje piny a horní mezí frekvence (define), nebo se
+    převezme už vytvořený busio objekt (adopt). Fyzická sběrnice definovaná
+    piny vznikne až při prvním použití – do té doby lze registrovat zařízení
+    a frekvence se podle nich sníží.
+
+    Args:
+        defaults: funkce, která sběrnice definuje až při prvním použití správce
+    """
+
+    def __init__(self, defaults=None) -> None:
+        self._buses = {}
+        self._defaults = defaults
+
+    def _table(self) -> dict:
+        """Vrátí tabulku sběrnic (výchozí sběrnice se definují až teď)."""
+        defaults = self._defaults
+        if defaults is not None:
+            self._defaults = None
+            defaults(self)
+        return self._buses
+
+    # ---------------------------------------------------------
+    # Definice sběrnic a zařízení
+    # ---------------------------------------------------------
+
+    def define(self, name: str, scl, sda, maxFrequency: int = 1_000_000, release=None) -> None:
+        """
+        Definuje sběrnici na pinech scl/sda.
+
+        Args:
+            maxFrequency: horní mez frekvence (např. kvůli pull-up rezistorům)
+            release: busio objekt, který piny drží a při otevření se uvolní
+        """
+        self._table()[name] = _Bus(name, scl, sda, maxFrequency, release, None)
+
+    def adopt(self, name: str, hw: BusIO_I2C) -> None:
+        """Převezme už vytvořenou sběrnici (její frekvenci nelze změnit)."""
+        self._table()[name] = _Bus(name, None, None, self._hwFrequency(hw), None, hw)
+
+    def register(self, name: str, addr: int, maxFrequency: "int | None" = None) -> None:
+        """
+        Zaregistruje zařízení na sběrnici.
+
+        Pokud zařízení nesnese frekvenci již otevřené sběrnice, vyhodí ValueError.
+        """
+        bus = self._bus(name)
+        if maxFrequency is None:
+            maxFrequency = DEVICE_MAX_FREQUENCY.get(addr, DEFAULT_MAX_FREQUENCY)
+        if bus.hw is not None and maxFrequency < self.frequency(name):
+            if bus.scl is None:
+                # převzatou sběrnici nevlastníme, jen upozorníme
+                log.warning(f"I2C {name}: zařízení 0x{addr:02X} zvládá jen {maxFrequency} Hz")
+            else:
+                raise ValueError(f"I2C {name} už běží rychleji, než zvládá 0x{addr:02X}")
+        bus.devices[addr] = maxFrequency
+
+    def registerDevice(self, i2c: I2C, addr: int) -> None:
+        """
+        Zaregistruje zařízení na sběrnici, kterou obsluhuje wrapper i2c.
+
+        Volají ovladače při vytvoření; wrapper, který správce nerozdal
+        (vlastní I2C(...), testy), se ignoruje. Už známé zařízení se
+        nezaregistruje znovu.
+        """
+        for name, bus in self._buses.items():
+            if bus.wrapper is i2c:
+                if addr not in bus.devices:
+                    self.register(name, addr)
+                return
+
+    def names(self) -> list:
+        """Vrátí názvy všech sběrnic."""
+        return list(self._table())
+
+    def devices(self, name: str) -> list:
+        """Vrátí adresy zařízení zaregistrovaných na sběrnici."""
+        return sorted(self._bus(name).devices)
+
+    def frequency(self, name: str) -> int:
+        """
+        Vrátí frekvenci sběrnice.
+
+        Otevřená převzatá sběrnice vrací skutečnou frekvenci, jinak nejvyšší
+        frekvenci, kterou zvládnou všechna zaregistrovaná zařízení.
+        """
+        bus = self._bus(name)
+        if bus.scl is None:
+            return bus.maxFrequency
+        frequency = bus.maxFrequency
+        for deviceMax in bus.devices.values():
+            frequency = min(frequency, deviceMax)
+        return frequency
+
+    # ---------------------------------------------------------
+    # Přístup ke sběrnicím
+    # ---------------------------------------------------------
+
+    def hw(self, name: str) -> BusIO_I2C:
+        """
+        Vrátí fyzickou sběrnici (při prvním volání ji vytvoří).
+
+        Přímé přenosy přes hw() se do statistik sběrnice nezapočítají,
+        měří se jen wrapper z i2c().
+        """
+        bus = self._bus(name)
+        if bus.hw is None:
+            if bus.release is not None:
+                bus.release.deinit()
+                bus.release = None
+            bus.hw = BusIO_I2C(bus.scl, bus.sda, frequency=self.frequency(name))
+        return bus.hw
+
+    def i2c(self, name: str) -> I2C:
+        """Vrátí sdílený I2C wrapper sběrnice (pro všechny volající stejný)."""
+        bus = self._bus(name)
+        if bus.wrapper is None:
+            bus.wrapper = I2C(self.hw(name))
+            if bus.stats is not None:
+                bus.wrapper.enable_stats(bus.stats)
+        return bus.wrapper
+
+    def _bus(self, name: str) -> _Bus:
+        bus = self._table().get(name)
+        if bus is None:
+            raise KeyError(f"Neznámá I2C sběrnice: {name}")
+        return bus
+
+    @staticmethod
+    def _hwFrequency(hw) -> int:
+        return getattr(hw, "frequency", DEFAULT_MAX_FREQUENCY)
+
+    # ---------------------------------------------------------
+    # Vytížení
+    # ---------------------------------------------------------
+
+    def enableStats(self) -> None:
+        """
+        Zapne měření na wrapperech všech sběrnic (viz joycar.busstats).
+
+        Měří se provoz přes wrappery z i2c() – ty používají periferie robota
+        i displej. Sběrnice, která ještě není otevřená, se kvůli měření
+        neotevře; měření se na ni zapne, až ji někdo poprvé použije.
+        """
+        now = monotonic_ns()
+        for bus in self._table().values():
+            bus.stats = BusStats()
+            bus.statsStart = now
+            if bus.wrapper is not None:
+                bus.wrapper.enable_stats(bus.stats)
+
+    def utilization(self, name: str) -> float:
+        """Vrátí podíl času (0–1), kdy sběrnice přenášela data, od enableStats()."""
+        bus = self._bus(name)
+        if bus.stats is None:
+            return 0.0
+        elapsedUs = (monotonic_ns() - bus.statsStart) // 1000
+        if elapsedUs <= 0:
+            return 0.0
+        return bus.stats.totalTransferUs() / elapsedUs
+
+    def report(self) -> None:
+        """Vytiskne přehled sběrnic: frekvence, zařízení, vytížení."""
+        for name, bus in self._table().items():
+            devices = " ".join(f"0x{addr:02X}" for addr in sorted(bus.devices))
+            line = f"I2C {name}: {self.frequency(name) // 1000} kHz [{devices}]"
+            if bus.stats is not None:
+                line += f" util={self.utilization(name) * 100:.1f}%"
+            print(line)
+            if bus.stats is not None:
+                bus.stats.report()
+
+
+# ---------------------------------------------------------
+# Globální instance
+# ---------------------------------------------------------
+def _defineBoardBuses(manager: BusManager) -> None:
+    """Definuje sběrnice pico:ed (až při prvním použití `buses`)."""
+    from board import I2C0_SCL, I2C0_SDA
+    from picoed import i2c as pico_i2c, internal_i2c
+
+    manager.define(DISPLAY_BUS, I2C0_SCL, I2C0_SDA, maxFrequency=650_000, release=internal_i2c)
+    manager.adopt(ROBOT_BUS, pico_i2c)
+
+
+buses = BusManager(_defineBoardBuses)
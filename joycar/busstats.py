@@ -0,0 +1,151 @@
+"""
+busstats.py – měření vytížení I2C sběrnice JoyCar robota.
+
+Tento modul poskytuje třídu BusStats, která:
+- počítá transakce, zapsané a přečtené bajty pro každé zařízení,
+- měří čekání na zámek sběrnice a dobu samotného přenosu,
+- ukládá časy do histogramů s pevným počtem přihrádek (paměť se nemění),
+- umí vypsat stručný souhrn.
+
+Měření se zapíná přímo na I2C wrapperu. Vypnuté měření nic nestojí –
+I2C pak používá své původní metody bez jediné podmínky navíc.
+
+Použití:
+    stats = i2c.enable_stats()
+    ...
+    stats.report()
+    i2c.disable_stats()
+"""
+
+from array import array
+
+# horní meze přihrádek histogramu v µs (poslední přihrádka je "a více")
+_BUCKET_LIMITS = (16, 32, 64, 128, 256, 512, 1024)
+_BUCKETS = len(_BUCKET_LIMITS) + 1
+
+# adresa volného slotu zařízení
+_FREE = -1
+
+
+def _bucket(us: int) -> int:
+    """Vrátí index přihrádky histogramu pro danou dobu v µs."""
+    for i in range(_BUCKETS - 1):
+        if us < _BUCKET_LIMITS[i]:
+            return i
+    return _BUCKETS - 1
+
+
+class BusStats:
+    """
+    Statistiky I2C sběrnice s pevnou velikostí paměti.
+
+    Pro každé zařízení (max. maxDevices adres) se počítá:
+        - počet transakcí,
+        - zapsané a přečtené bajty,
+        - celkový čas přenosu v µs.
+
+    Zařízení nad limit se sčítají do posledního slotu ("ostatní").
+    """
+
+    MAX_DEVICES = 8
+
+    def __init__(self, maxDevices: int = MAX_DEVICES) -> None:
+        self._addrs = array("h", [_FREE] * maxDevices)
+        self._transactions = array("L", [0] * maxDevices)
+        self._written = array("L", [0] * maxDevices)
+        self._read = array("L", [0] * maxDevices)
+        self._transferUs = array("L", [0] * maxDevices)
+
+        self._lockHist = array("L", [0] * _BUCKETS)
+        self._transferHist = array("L", [0] * _BUCKETS)
+        self._lockCount = 0
+        self._lockUs = 0
+
+    def reset(self) -> None:
+        """Vynuluje všechny čítače (sloty zařízení zůstanou přiřazené)."""
+        for arr in (self._transactions, self._written, self._read,
+                    self._transferUs, self._lockHist, self._transferHist):
+            for i in range(len(arr)):
+                arr[i] = 0
+        self._lockCount = 0
+        self._lockUs = 0
+
+    # ---------------------------------------------------------
+    # Záznam (volá I2C wrapper)
+    # ---------------------------------------------------------
+
+    def _slot(self, addr: int) -> int:
+        """Vrátí index slotu zařízení (případně přiřadí volný)."""
+        addrs = self._addrs
+        last = len(addrs) - 1
+        for i in range(last):
+            if addrs[i] == addr:
+                return i
+            if addrs[i] == _FREE:
+                addrs[i] = addr
+                return i
+        if addrs[last] == _FREE:
+            addrs[last] = addr
+        return last
+
+    def recordLockWait(self, ns: int) -> None:
+        """Zaznamená čekání na zámek sběrnice."""
+        us = ns // 1000
+        self._lockCount += 1
+        self._lockUs += us
+        self._lockHist[_bucket(us)] += 1
+
+    def recordTransfer(self, addr: int, written: int, read: int, ns: int) -> None:
+        """Zaznamená jednu transakci se zařízením."""
+        us = ns // 1000
+        i = self._slot(addr)
+        self._transactions[i] += 1
+        self._written[i] += written
+        self._read[i] += read
+        self._transferUs[i] += us
+        self._transferHist[_bucket(us)] += 1
+
+    # ---------------------------------------------------------
+    # Výstup
+    # ---------------------------------------------------------
+
+    def device(self, addr: int) -> tuple:
+        """
+        Vrátí statistiku zařízení jako n-tici
+        (transakce, zapsané bajty, přečtené bajty, čas přenosu v µs).
+        """
+        addrs = self._addrs
+        for i in range(len(addrs)):
+            if addrs[i] == addr:
+                return (self._transactions[i], self._written[i],
+                        self._read[i], self._transferUs[i])
+        return (0, 0, 0, 0)
+
+    def totalTransferUs(self) -> int:
+        """Vrátí celkový čas přenosů všech zařízení v µs."""
+        return sum(self._transferUs)
+
+    def lockWait(self) -> tuple:
+        """Vrátí (počet zamknutí, celkové čekání na zámek v µs)."""
+        return (self._lockCount, self._lockUs)
+
+    def lockHistogram(self) -> array:
+        """Vrátí histogram čekání na zámek (přihrádky viz _BUCKET_LIMITS)."""
+        return self._lockHist
+
+    def transferHistogram(self) -> array:
+        """Vrátí histogram doby přenosu (přihrádky viz _BUCKET_LIMITS)."""
+        return self._transferHist
+
+    def report(self) -> None:
+        """Vytiskne stručný souhrn statistik."""
+        limits = "/".join(str(limit) for limit in _BUCKET_LIMITS)
+        print(f"I2C lock n={self._lockCount} wait={self._lockUs}us")
+        print(f"  hist lock  [<{limits}us,+]: {list(self._lockHist)}")
+        print(f"  hist xfer  [<{limits}us,+]: {list(self._transferHist)}")
+        for i in range(len(self._addrs)):
+            addr = self._addrs[i]
+            if addr == _FREE:
+                continue
+            print(f"  0x{addr:02X}: n={self._transactions[i]} w={self._written[i]}B "
+                  f"r={self._read[i]}B t={self._transferUs[i]}us")
@@ -1,154 +1,162 @@
+"""
+display.py – ovladač LED matice 17×7 (IS31FL3731) na pico:ed.
+
+Import modulu nemá vedlejší efekty: globální `display` je zástupce,
+skutečný Display() (převzetí interní sběrnice, inicializace čipu)
+vznikne až při prvním použití. Ikony a bitmapy se překládají na indexy
+framebufferu až při prvním vykreslení (viz joycar.sprites).
+"""
+
+from array import array
 from time import sleep
-from picoed import internal_i2c
-from board import I2C0_SCL, I2C0_SDA
-from busio import I2C
+from busio import I2C as BusIO_I2C
+from joycar.buses import buses, DISPLAY_BUS
+from joycar.glyphs import PICTOGRAMS
+from joycar.i2c import I2C
+from joycar.scroller import TextScroller
+from joycar.sprites import SpriteCache
+from utils.period import Period
 
 __all__ = ["display", "Display"]
 
 _ADDR = 0x74  # adresa IS31FL3731
 
-internal_i2c.deinit()
-fast_i2c = I2C(I2C0_SCL, I2C0_SDA, frequency=650_000)
+# sloupce lišty senzorů (bity vzoru 0–4: překážka L, L, střed, P, překážka P)
+_SENSOR_BAR_X = (16, 11, 8, 5, 0)
+_SENSOR_BAR_Y = 6
+
+# sledování změn: framebuffer je rozdělen na 9 bloků po 16 bajtech (dvojice sloupců),
+# v každém bloku se drží nejnižší a nejvyšší změněný bajt
+_BLOCKS = 9
+_BLOCK_SIZE = 16
+# sousední úseky s mezerou nejvýše tolik bajtů se odešlou jedním zápisem
+# (samostatný zápis stojí START + adresu + registr + STOP, tj. víc než 2 bajty dat)
+_MERGE_GAP = 3
+
+# banky IS31FL3731: 0–7 snímky, 0x0B funkční registry
+_FUNCTION_BANK = 0x0B
+_REG_CONFIG = 0x00
+_REG_PICTURE_FRAME = 0x01
+_REG_AUTOPLAY1 = 0x02
+_REG_AUTOPLAY2 = 0x03
+_REG_BREATH1 = 0x08
+_REG_BREATH2 = 0x09
+
+# režimy zobrazení (konfigurační registr, bity 4:3)
+_MODE_PICTURE = 0x00
+_MODE_AUTOPLAY = 0x08
+_BREATH_ENABLE = 0x10
+
+# časové jednotky čipu: krok autoplay 11 ms, náběh/doběh dýchání 26 ms · 2^n,
+# zhasnutí mezi nádechy 3,5 ms · 2^n
+_AUTOPLAY_STEP_MS = 11
+_FADE_UNIT_MS = 26
+_OFF_UNIT_US = 3500
+# zapnutí všech 144 LED snímku (registry 0x00–0x11)
+_LED_ENABLE = bytes([0x00] + [0xFF] * 18)
+
+# levé horní x ikon na pozicích A, B, C
+_ICON_X = {"A": 12, "B": 6, "C": 0}
+
 
 class Display:
 
     _needFlush = False
     _instance = None
+    _scheduler = None
 
     rows = 7
     cols = 17
 
     default_brightness = 32
 
-    def __new__(cls):
+    # výchozí perioda snímků pro update() (ms)
+    FRAME_MS = 50
+
+    # snímky čipu pro uložené obrazovky (0 a 1 patří živému framebufferu)
+    FIRST_SCREEN = 2
+    LAST_SCREEN = 7
+
+    def __new__(cls, i2c: "I2C | BusIO_I2C" = None):
+        # Display(i2c) = samostatný displej na dané sběrnici (testy, druhý čip),
+        # Display() = sdílená instance na interní sběrnici pico:ed
+        if i2c is not None:
+            instance = super().__new__(cls)
+            instance._init(i2c)
+            return instance
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._init()
         return cls._instance
 
-    def _init(self, i2c: I2C=fast_i2c):
+    def _init(self, i2c: "I2C | BusIO_I2C" = None):
+        if i2c is None:
+            # interní sběrnici vlastní správce sběrnic (uvolní picoed.internal_i2c, 650 kHz);
+            # sdílený wrapper, takže provoz displeje zahrnou i statistiky sběrnice
+            buses.register(DISPLAY_BUS, _ADDR)
+            i2c = buses.i2c(DISPLAY_BUS)
+        elif not isinstance(i2c, I2C):
+            i2c = I2C(i2c)
         self._i2c: I2C = i2c
 
         # persistentní flush buffer: 1 bajt adresa + 144 bajtů PWM
         self._flushbuf = bytearray(145)
         self._flushbuf[0] = 0x24  # startovní registr PWM
+        self._fbView = memoryview(self._flushbuf)
+
+        # index framebufferu pro každý pixel: _index[y * cols + x]
+        self._index = array("B", [self._pixelIndex(x, y)
+                                  for y in range(self.rows) for x in range(self.cols)])
+
+        # změněné úseky framebufferu (čistý blok má lo > hi)
+        self._dirtyLo = bytearray([_BLOCK_SIZE] * _BLOCKS)
+        self._dirtyHi = bytearray(_BLOCKS)
+        # změny odeslané posledním flush() (pro dorovnání zadního snímku)
+        self._lastLo = bytearray([_BLOCK_SIZE] * _BLOCKS)
+        self._lastHi = bytearray(_BLOCKS)
+
+        # stín stavu čipu: vybraná banka, zobrazený snímek, snímky se zapnutými LED
+        self._bankCmd = bytearray(b"\xFD\x00")
+        self._frameCmd = bytearray([_REG_PICTURE_FRAME, 0])
+        self._bank = 0
+        self._shownFrame = 0
+        self._enabledFrames = 0x01
+        # double buffering: do kterého snímku se kreslí, kam šel minulý flush()
+        self._doubleBuffer = False
+        self._drawFrame = 0
+        self._lastFrame = 0
+        # běží animace nebo dýchání na čipu (flush() nic neposílá)
+        self._animating = False
 
         # inicializace čipu
-        while not self._i2c.try_lock():
-            pass
-
-        try:
-            self._i2c.writeto(_ADDR, b"\xFD\x0B")  # config banka
-            self._i2c.writeto(_ADDR, b"\x00\x01")  # wake
-            self._i2c.writeto(_ADDR, b"\x01\x00")  # picture mode, frame 0
-            self._i2c.writeto(_ADDR, b"\xFD\x00")  # frame 0
+        with self._i2c:
+            self._i2c.write(_ADDR, b"\xFD\x0B")  # config banka
+            self._i2c.write(_ADDR, b"\x00\x01")  # wake
+            self._i2c.write(_ADDR, b"\x01\x00")  # picture mode, frame 0
+            self._i2c.write(_ADDR, b"\xFD\x00")  # frame 0
             sleep(0.002)
 
             # povolit všech 144 LED
             for reg in range(0x00, 0x12):
-                self._i2c.writeto(_ADDR, bytes([reg, 0xFF]))
-        finally:
-            self._i2c.unlock()
+                self._i2c.write(_ADDR, bytes([reg, 0xFF]))
+
+        # odložené vykreslování (viz update())
+        self._framePeriod = Period(timeout_ms=Display.FRAME_MS)
+        # režim max FPS: flush() jen žádá o snímek, odešle ho update()
+        self._coalesce = False
+        self._framesRequested = 0
+        self._framesSent = 0
+        self._sensorBar = -1
+        self._sensorBarHigh = 9
+        self._sensorBarLow = 1
+        self._sensorBarIdx = [self._pixelIndex(x, _SENSOR_BAR_Y) for x in _SENSOR_BAR_X]
+        self._scroller = None
+
+        # přeložené ikony a bitmapy pro libovolnou pozici (LRU)
+        self._sprites = SpriteCache(self._pixelIndex, self.cols, self.rows,
+                                    blockSize=_BLOCK_SIZE)
 
         self.fill(0)
-        self._load_pictograms()
-        self._precompute_icon_framebuffer_indices()
-
-    def _load_pictograms(self):
-        self._PICTOGRAMS = {
-            '>':  [0b00100, 0b00010, 0b11111, 0b00010, 0b00100],  # zatočení doprava
-            '<':  [0b00100, 0b01000, 0b11111, 0b01000, 0b00100],  # zatočení doleva
-            '^':  [0b00100, 0b00100, 0b10101, 0b01110, 0b00100],  # jedeme rovně
-            'v':  [0b00100, 0b01110, 0b10101, 0b00100, 0b00100],  # jedeme zpátky
-            'TL': [0b00100, 0b00100, 0b11100, 0b00000, 0b00000],  # rohová křižovatka doleva (turn to left)
-            'TR': [0b00100, 0b00100, 0b00111, 0b00000, 0b00000],  # rohová křižovatka doprava (turn to right)
-            'IT': [0b00100, 0b00100, 0b11111, 0b00000, 0b00000],  # intersection left-right (T)
-            'IL': [0b00100, 0b00100, 0b11100, 0b00100, 0b00100],  # intersection left-straight (T to left)
-            'IR': [0b00100, 0b00100, 0b00111, 0b00100, 0b00100],  # intersection right-straight (T to right)
-            'I+': [0b00100, 0b00100, 0b11111, 0b00100, 0b00100],  # intersection all directions (+)
-            '--': [0b00000, 0b00000, 0b11111, 0b00000, 0b00000],
-            ' -': [0b00000, 0b00000, 0b00111, 0b00000, 0b00000],
-            '- ': [0b00000, 0b00000, 0b11100, 0b00000, 0b00000],
-            '_':  [0b11111, 0b00000, 0b00000, 0b00000, 0b00000],
-            '.':  [0b00100, 0b00000, 0b00000, 0b00000, 0b00000],
-            '|':  [0b00100, 0b00100, 0b00100, 0b00100, 0b00100],
-            '/':  [0b10000, 0b01000, 0b00100, 0b00010, 0b00001],
-            '\\': [0b00001, 0b00010, 0b00100, 0b01000, 0b10000],
-            's':  [0b11100, 0b00010, 0b01110, 0b01000, 0b00111],
-            'x':  [0b10001, 0b01010, 0b00100, 0b01010, 0b10001],
-            ' ':  [0b00000, 0b00000, 0b00000, 0b00000, 0b00000],
-            ',':  [0b00100, 0b00010, 0b00000, 0b00000, 0b00000],
-            '0':  [0b01110, 0b01010, 0b01010, 0b01010, 0b01110],
-            '1':  [0b00100, 0b00100, 0b00100, 0b01100, 0b00100],
-            '2':  [0b01110, 0b01000, 0b01110, 0b00010, 0b01110],
-            '3':  [0b01110, 0b00010, 0b00110, 0b00010, 0b01110],
-            '4':  [0b00010, 0b00010, 0b01110, 0b01010, 0b01010],
-            '5':  [0b01110, 0b00010, 0b01110, 0b01000, 0b01110],
-            '6':  [0b01110, 0b01010, 0b01110, 0b01000, 0b01110],
-            '7':  [0b00010, 0b00010, 0b00010, 0b00010, 0b01110],
-            '8':  [0b01110, 0b01010, 0b01110, 0b01010, 0b01110],
-            '9':  [0b01110, 0b00010, 0b01110, 0b01010, 0b01110],
-
-            'A':  [0b01010, 0b01010, 0b01110, 0b01010, 0b00100],
-            'B':  [0b01100, 0b01010, 0b01100, 0b01010, 0b01100],
-            'C':  [0b00110, 0b01000, 0b01000, 0b01000, 0b00110],
-            'D':  [0b01100, 0b01010, 0b01010, 0b01010, 0b01100],
-            'E':  [0b01110, 0b01000, 0b01100, 0b01000, 0b01110],
-            'F':  [0b01000, 0b01000, 0b01100, 0b01000, 0b01110],
-            'H':  [0b01010, 0b01010, 0b01110, 0b01010, 0b01010],
-            'I':  [0b01110, 0b00100, 0b00100, 0b00100, 0b01110],
-            'J':  [0b00100, 0b01010, 0b00010, 0b00010, 0b00010],
-            'V':  [0b00100, 0b01010, 0b01010, 0b01010, 0b01010],
-            'Y':  [0b00100, 0b00100, 0b00100, 0b01010, 0b01010],
-            'Z':  [0b01110, 0b01000, 0b00100, 0b00010, 0b01110],
-        }
-
-    # ---------------------------------------------------------
-    # Předpočítání indexů pro ultra-fast ikony
-    # ---------------------------------------------------------
-    def _precompute_icon_framebuffer_indices(self):
-        self._ICON_FB_A_ON = {}
-        self._ICON_FB_B_ON = {}
-        self._ICON_FB_C_ON = {}
-
-        self._ICON_FB_A_OFF = {}
-        self._ICON_FB_B_OFF = {}
-        self._ICON_FB_C_OFF = {}
-
-        positions = {"A": 12, "B": 6, "C": 0}
-
-        for name, lines in self._PICTOGRAMS.items():
-            on_pixels = []
-            off_pixels = []
-
-            for iy, line in enumerate(lines):
-                for ix in range(5):
-                    if line & (1 << ix):
-                        on_pixels.append((ix, iy))
-                    else:
-                        off_pixels.append((ix, iy))
-
-            for label, x0 in positions.items():
-                on_idx = []
-                off_idx = []
-
-                for ix, iy in on_pixels:
-                    fb = self._pixelIndex(x0 + ix, iy)
-                    on_idx.append(fb)
-
-                for ix, iy in off_pixels:
-                    fb = self._pixelIndex(x0 + ix, iy)
-                    off_idx.append(fb)
-
-                if label == "A":
-                    self._ICON_FB_A_ON [name] = on_idx
-                    self._ICON_FB_A_OFF[name] = off_idx
-                elif label == "B":
-                    self._ICON_FB_B_ON [name] = on_idx
-                    self._ICON_FB_B_OFF[name] = off_idx
-                else:
-                    self._ICON_FB_C_ON [name] = on_idx
-                    self._ICON_FB_C_OFF[name] = off_idx
 
     def set_brightness(self, brightness):
         self.default_brightness = max(0, min(255, brightness))
@@ -164,6 +172,40 @@ class Display:
             y = 7 - y
         return x * 16 + y
 
+    def _markDirty(self, idx):
+        """Označí bajt framebufferu (0–143) jako změněný."""
+        block = idx >> 4
+        offset = idx & 0x0F
+        if offset < self._dirtyLo[block]:
+            self._dirtyLo[block] = offset
+        if offset > self._dirtyHi[block]:
+            self._dirtyHi[block] = offset
+        self._needFlush = True
+
+    def _markSpans(self, spans):
+        """Označí předpočítané úseky (blok, lo, hi) jako změněné."""
+        dirtyLo = self._dirtyLo
+        dirtyHi = self._dirtyHi
+        for block, lo, hi in spans:
+            if lo < dirtyLo[block]:
+                dirtyLo[block] = lo
+            if hi > dirtyHi[block]:
+                dirtyHi[block] = hi
+        self._needFlush = True
+
+    def _markAll(self):
+        """Označí celý framebuffer jako změněný."""
+        for block in range(_BLOCKS):
+            self._dirtyLo[block] = 0
+            self._dirtyHi[block] = _BLOCK_SIZE - 1
+        self._needFlush = True
+
+    def _markClean(self):
+        for block in range(_BLOCKS):
+            self._dirtyLo[block] = _BLOCK_SIZE
+            self._dirtyHi[block] = 0
+        self._needFlush = False
+
     # ---------------------------------------------------------
     # Základní operace
     # ---------------------------------------------------------
@@ -173,65 +215,229 @@ class Display:
 
         if 0 <= x < self.cols and 0 <= y < self.rows:
             value = max(0, min(255, color))
-            idx = self._pixelIndex(x, y)
+            idx = self._index[y * self.cols + x]
             self._flushbuf[1 + idx] = value
-            self._needFlush = True
+            self._markDirty(idx)
 
     def fill(self, color=None):
         if color is None:
             color = self.default_brightness
         value = max(0, min(255, color))
 
-        for i in range(144):
-            self._flushbuf[1 + i] = value
-        self._needFlush = True
+        self._fillRange(0, 144, value)
+        self._markAll()
         
         self.flush()
 
     def clear(self):
-        for i in range(144):
-            self._flushbuf[1 + i] = 0
-        self._needFlush = True
+        self._fillRange(0, 144, 0)
+        self._markAll()
         self.flush()
 
-    def _bitmap(self, x0, y0, size, bitmap, color=None):
+    # ---------------------------------------------------------
+    # Hromadné operace (kopie řezů framebufferu)
+    # ---------------------------------------------------------
+    def _fillRange(self, start, n, value):
+        """
+        Vyplní n bajtů framebufferu od indexu start hodnotou value.
+
+        Zapíše se jen první bajt, zbytek se doplní zdvojováním kopií řezů
+        (1, 2, 4 … bajty), tj. 144 bajtů na 8 kopií bez smyčky po bajtech.
+        """
+        fb = self._fbView
+        s = 1 + start
+        fb[s] = value
+        done = 1
+        while done < n:
+            k = min(done, n - done)
+            fb[s + done:s + done + k] = fb[s:s + k]
+            done += k
+
+    def _fillRun(self, x, y0, y1, value):
+        """
+        Vyplní sloupec x v řádcích y0–y1 (oba v rozsahu displeje).
+
+        Pixely jednoho sloupce leží ve framebufferu za sebou (vlevo od středu
+        v pořadí y sestupně, vpravo vzestupně), takže jde o jeden úsek.
+        """
+        cols = self.cols
+        if x > 8:
+            start = self._index[y0 * cols + x]
+        else:
+            start = self._index[y1 * cols + x]
+        n = y1 - y0 + 1
+        self._fillRange(start, n, value)
+        block = start >> 4
+        lo = start & 0x0F
+        hi = lo + n - 1
+        if lo < self._dirtyLo[block]:
+            self._dirtyLo[block] = lo
+        if hi > self._dirtyHi[block]:
+            self._dirtyHi[block] = hi
+        self._needFlush = True
+
+    def _color(self, color):
         if color is None:
             color = self.default_brightness
+        return max(0, min(255, color))
+
+    def rect(self, x, y, w, h, color=None, filled=True, flush=True):
+        """
+        Vykreslí obdélník s levým horním rohem (x, y), oříznutý na displej.
+
+        Vyplněný obdélník je jeden úsek framebufferu na sloupec,
+        obrys tvoří dva sloupce a dvě vodorovné čáry.
+        """
+        value = self._color(color)
+        x0 = max(0, x)
+        x1 = min(self.cols - 1, x + w - 1)
+        y0 = max(0, y)
+        y1 = min(self.rows - 1, y + h - 1)
+        if x0 <= x1 and y0 <= y1:
+            if filled:
+                for cx in range(x0, x1 + 1):
+                    self._fillRun(cx, y0, y1, value)
+            else:
+                self.hline(x, y, w, value, flush=False)
+                self.hline(x, y + h - 1, w, value, flush=False)
+                self.vline(x, y, h, value, flush=False)
+                self.vline(x + w - 1, y, h, value, flush=False)
+        if flush:
+            self.flush()
 
-        for iy in range(size):
-            line = bitmap[iy]
-            for ix in range(size):
-                if line & (1 << ix):
-                    self.pixel(x0 + ix, y0 + iy, color)
-                else:
-                    self.pixel(x0 + ix, y0 + iy, 0)
+    def hline(self, x, y, w, color=None, flush=True):
+        """Vykreslí vodorovnou čáru délky w od (x, y)."""
+        value = self._color(color)
+        if 0 <= y < self.rows:
+            fb = self._flushbuf
+            row = y * self.cols
+            for cx in range(max(0, x), min(self.cols, x + w)):
+                idx = self._index[row + cx]
+                fb[1 + idx] = value
+                self._markDirty(idx)
+        if flush:
+            self.flush()
+
+    def vline(self, x, y, h, color=None, flush=True):
+        """Vykreslí svislou čáru délky h od (x, y) – jeden úsek framebufferu."""
+        value = self._color(color)
+        y0 = max(0, y)
+        y1 = min(self.rows - 1, y + h - 1)
+        if 0 <= x < self.cols and y0 <= y1:
+            self._fillRun(x, y0, y1, value)
+        if flush:
+            self.flush()
+
+    def line(self, x0, y0, x1, y1, color=None, flush=True):
+        """Vykreslí úsečku (Bresenham, indexy z předpočítané tabulky)."""
+        value = self._color(color)
+        if x0 == x1:
+            self.vline(x0, min(y0, y1), abs(y1 - y0) + 1, value, flush)
+            return
+        if y0 == y1:
+            self.hline(min(x0, x1), y0, abs(x1 - x0) + 1, value, flush)
+            return
+
+        fb = self._flushbuf
+        index = self._index
+        cols = self.cols
+        rows = self.rows
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            if 0 <= x0 < cols and 0 <= y0 < rows:
+                idx = index[y0 * cols + x0]
+                fb[1 + idx] = value
+                self._markDirty(idx)
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+        if flush:
+            self.flush()
+
+    def row(self, y, color=None, flush=True):
+        """Nastaví celý řádek y na jednu hodnotu jasu."""
+        self.hline(0, y, self.cols, color, flush)
+
+    def column(self, x, color=None, flush=True):
+        """Nastaví celý sloupec x na jednu hodnotu jasu (jeden úsek)."""
+        self.vline(x, 0, self.rows, color, flush)
+
+    def blitFrame(self, src, flush=True):
+        """
+        Zkopíruje celý snímek (144 bajtů v pořadí framebufferu, viz snapshot())
+        do framebufferu jedinou kopií řezu.
+        """
+        if len(src) != 144:
+            raise ValueError("Snímek musí mít 144 bajtů")
+        self._fbView[1:] = src
+        self._markAll()
+        if flush:
+            self.flush()
+
+    def _bitmap(self, x0, y0, size, bitmap, color=None):
+        self.blit(bitmap[:size], x0, y0, color, width=size, flush=False)
 
     # ---------------------------------------------------------
-    # Ultra-fast bitmapa
+    # Sprity (předpřeložené bitmapy)
     # ---------------------------------------------------------
-    def _bitmap_ultra_fast(self, icon, pos, color=None):
-        if color is None:
-            color = self.default_brightness
+    def _drawSprite(self, sprite, color, transparent):
+        on_list, off_list, spans = sprite
+        fb = self._flushbuf
 
-        if pos == "A":
-            on_list  = self._ICON_FB_A_ON [icon]
-            off_list = self._ICON_FB_A_OFF[icon]
-        elif pos == "B":
-            on_list  = self._ICON_FB_B_ON [icon]
-            off_list = self._ICON_FB_B_OFF[icon]
-        else:
-            on_list  = self._ICON_FB_C_ON [icon]
-            off_list = self._ICON_FB_C_OFF[icon]
+        if not transparent:
+            for i in off_list:
+                fb[i] = 0
 
-        fb = self._flushbuf
+        for i in on_list:
+            fb[i] = color
 
-        for idx in off_list:
-            fb[1 + idx] = 0
+        if spans:
+            self._markSpans(spans)
 
-        for idx in on_list:
-            fb[1 + idx] = color
+    def blit(self, bitmap, x, y, color=None, transparent=False, width=5, flush=True):
+        """
+        Vykreslí bitmapu na libovolnou pozici (x, y) = levý horní roh.
 
-        self._needFlush = True
+        Bitmapa je posloupnost řádků, bit ix řádku je sloupec x + ix.
+        Pixely mimo displej se oříznou. Při transparent=True se zhasnuté
+        pixely bitmapy nekreslí (zůstane pod nimi původní obsah).
+
+        Bitmapa se pro danou pozici přeloží jednou a uloží do cache,
+        proto by měla být neměnná (tuple, bytes); seznam se převede na tuple.
+        """
+        color = self._color(color)
+        if isinstance(bitmap, list):
+            bitmap = tuple(bitmap)
+        self._drawSprite(self._sprites.get(bitmap, bitmap, x, y, width), color, transparent)
+        if flush:
+            self.flush()
+
+    def glyph(self, name, x, y, color=None, transparent=False, flush=True):
+        """Vykreslí piktogram (znak, šipku …) 5×5 na libovolnou pozici."""
+        color = self._color(color)
+        self._drawSprite(self._sprites.get(name, PICTOGRAMS[name], x, y), color, transparent)
+        if flush:
+            self.flush()
+
+    # ---------------------------------------------------------
+    # Ultra-fast bitmapa
+    # ---------------------------------------------------------
+    def _bitmap_ultra_fast(self, icon, pos, color=None):
+        if color is None:
+            color = self.default_brightness
+
+        sprite = self._sprites.get(icon, PICTOGRAMS[icon], _ICON_X[pos], 0)
+        self._drawSprite(sprite, color, False)
 
     # ---------------------------------------------------------
     # Ikony A/B/C
@@ -251,20 +457,452 @@ class Display:
         if flush:
             self.flush()
 
-    def flush(self):
-        if not self._needFlush:
+    def setScheduler(self, scheduler):
+        """
+        Odesílá snímky přes prioritní plánovač (BusScheduler) místo přímého zápisu.
+
+        Snímek se zařadí jako přenos třídy DISPLAY; pokud se v ticku nevejde
+        do rozpočtu, odloží se a odešle se později s nejnovějším obsahem.
+        None vrátí přímý zápis. Nelze kombinovat s double bufferingem.
+
+        Plánovač musí řídit sběrnici displeje: na pico:ed je displej na
+        interní sběrnici, plánovač robota (sběrnice robota) proto použít nejde.
+
+        Raises:
+            ValueError: plánovač řídí jinou sběrnici, nebo je zapnutý double buffering
+        """
+        if scheduler is None:
+            self._scheduler = None
+            return
+        if scheduler.i2c().hw() is not self._i2c.hw():
+            raise ValueError("Plánovač neřídí sběrnici displeje")
+        if self._doubleBuffer:
+            raise ValueError("Plánovač nelze použít s double bufferingem")
+        self._scheduler = scheduler
+
+    # ---------------------------------------------------------
+    # Snímky čipu (banky)
+    # ---------------------------------------------------------
+    def _selectBank(self, bank):
+        """Vybere banku čipu (zapíše jen při změně; sběrnice už musí být zamčená)."""
+        if self._bank != bank:
+            self._bankCmd[1] = bank
+            self._i2c.write(_ADDR, self._bankCmd)
+            self._bank = bank
+
+    def _enableFrame(self, frame):
+        """Při prvním použití snímku zapne všech jeho 144 LED."""
+        if not (self._enabledFrames >> frame) & 1:
+            self._selectBank(frame)
+            self._i2c.write(_ADDR, _LED_ENABLE)
+            self._enabledFrames |= 1 << frame
+
+    def _showFrame(self, frame):
+        """Zobrazí snímek (jeden zápis registru) a vrátí se do kreslicí banky."""
+        if self._shownFrame != frame:
+            self._selectBank(_FUNCTION_BANK)
+            self._frameCmd[1] = frame
+            self._i2c.write(_ADDR, self._frameCmd)
+            self._shownFrame = frame
+        self._selectBank(self._drawFrame)
+
+    def setDoubleBuffer(self, enabled=True):
+        """
+        Zapne/vypne double buffering.
+
+        Framebuffer se zapisuje do skrytého snímku (0 nebo 1) a po dokončení
+        zápisu se zobrazí jediným zápisem registru – rozpracovaný snímek
+        tak nikdy není vidět. Zadní snímek se dorovnává o změny
+        z předchozího flush(), takže zůstává částečné překreslení.
+        """
+        if enabled == self._doubleBuffer:
             return
-        while not self._i2c.try_lock():
-            pass
+        if enabled and self._scheduler is not None:
+            raise ValueError("Double buffering nelze použít s plánovačem")
+        with self._i2c:
+            self._doubleBuffer = enabled
+            if enabled:
+                self._drawFrame = 1 - self._lastFrame
+                self._enableFrame(self._drawFrame)
+                # zadní snímek má neznámý obsah
+                self._markAll()
+            else:
+                self._drawFrame = 0
+            self._selectBank(self._drawFrame)
+
+    def storeScreen(self, slot):
+        """
+        Nahraje aktuální framebuffer do snímku čipu slot (2–7).
+
+        Uloženou obrazovku (ikonu, číslo …) pak zobrazí showScreen()
+        jediným zápisem registru, bez přenosu 144 bajtů.
+        """
+        if not Display.FIRST_SCREEN <= slot <= Display.LAST_SCREEN:
+            raise ValueError("Obrazovku lze uložit jen do snímku 2–7")
+        with self._i2c:
+            self._enableFrame(slot)
+            self._selectBank(slot)
+            self._i2c.write(_ADDR, self._flushbuf)
+            self._selectBank(self._drawFrame)
+
+    def showScreen(self, slot):
+        """
+        Zobrazí obrazovku uloženou storeScreen().
+
+        Zůstane zobrazená do nejbližšího flush() se změnami,
+        ten opět zobrazí živý framebuffer.
+        """
+        if not Display.FIRST_SCREEN <= slot <= Display.LAST_SCREEN:
+            raise ValueError("Obrazovka může být jen ve snímku 2–7")
+        with self._i2c:
+            self._showFrame(slot)
+
+    # ---------------------------------------------------------
+    # Animace na čipu (autoplay / dýchání)
+    # ---------------------------------------------------------
+    def _writeFunction(self, reg, value):
+        """Zapíše funkční registr čipu (sběrnice už musí být zamčená)."""
+        self._selectBank(_FUNCTION_BANK)
+        self._i2c.write(_ADDR, bytes((reg, value)))
+
+    @staticmethod
+    def _exponent(value, unit):
+        """Vrátí nejmenší n (0–7), pro které unit · 2^n dosáhne value."""
+        n = 0
+        while n < 7 and (unit << n) < value:
+            n += 1
+        return n
+
+    def _writeBreath(self, fadeInMs, fadeOutMs, offMs):
+        fadeIn = self._exponent(fadeInMs, _FADE_UNIT_MS)
+        fadeOut = self._exponent(fadeOutMs, _FADE_UNIT_MS)
+        off = self._exponent(offMs * 1000, _OFF_UNIT_US)
+        self._writeFunction(_REG_BREATH1, (fadeOut << 4) | fadeIn)
+        self._writeFunction(_REG_BREATH2, _BREATH_ENABLE | off)
+
+    def snapshot(self):
+        """Vrátí kopii framebufferu (144 bajtů) – snímek pro playAnimation()."""
+        return bytes(self._flushbuf[1:])
+
+    def playAnimation(self, frames, delayMs=110, loops=0, breath=False,
+                      fadeInMs=208, fadeOutMs=208, offMs=0):
+        """
+        Nahraje až 8 snímků do čipu a spustí jejich přehrávání (autoplay).
+
+        Animace pak běží na čipu bez práce procesoru i bez provozu na sběrnici.
+        Snímky se ukládají na konec paměti čipu (8 snímků → 0–7, 2 snímky → 6, 7),
+        přepíší tedy uložené obrazovky ve stejných snímcích.
+        Během animace flush() nic neodesílá, změny se projeví po stopAnimation().
+
+        Args:
+            frames: seznam snímků, každý 144 bajtů (viz snapshot())
+            delayMs: doba jednoho snímku (krok 11 ms, 11–704 ms)
+            loops: počet opakování 1–7, 0 = nekonečně
+            breath: zapne dýchání (plynulý náběh a doběh jasu každého snímku)
+            fadeInMs, fadeOutMs: doba náběhu/doběhu (26 ms · 2^n, nejvýše 3328 ms)
+            offMs: doba zhasnutí mezi nádechy (3,5 ms · 2^n, nejvýše 448 ms)
+        """
+        count = len(frames)
+        if not 1 <= count <= 8:
+            raise ValueError("Animace musí mít 1–8 snímků")
+        if not 0 <= loops <= 7:
+            raise ValueError("Počet opakování musí být 0–7")
+        first = 8 - count
+        step = max(1, min(64, (delayMs + _AUTOPLAY_STEP_MS // 2) // _AUTOPLAY_STEP_MS))
+
+        buf = bytearray(145)
+        buf[0] = 0x24
+        with self._i2c:
+            for i in range(count):
+                frame = first + i
+                buf[1:] = frames[i]
+                self._enableFrame(frame)
+                self._selectBank(frame)
+                self._i2c.write(_ADDR, buf)
+
+            if first < 2:
+                # živé snímky 0/1 jsou přepsané – po skončení se pošlou celé
+                self._markAll()
+                self._lastFrame = -1
+
+            if breath:
+                self._writeBreath(fadeInMs, fadeOutMs, offMs)
+            else:
+                self._writeFunction(_REG_BREATH2, 0)
+            self._writeFunction(_REG_AUTOPLAY1, (loops << 4) | (count & 0x07))
+            self._writeFunction(_REG_AUTOPLAY2, step & 0x3F)
+            self._writeFunction(_REG_CONFIG, _MODE_AUTOPLAY | first)
+            self._animating = True
+            self._selectBank(self._drawFrame)
+
+    def breathe(self, fadeInMs=208, fadeOutMs=208, offMs=0):
+        """
+        Zapne dýchání zobrazeného obrazu (plynulý náběh a doběh jasu na čipu).
+
+        Obraz se nejdřív odešle, během dýchání flush() nic neposílá.
+        Časy viz playAnimation().
+        """
+        if self._needFlush:
+            self._framesRequested += 1
+            self._send()
+        with self._i2c:
+            self._writeBreath(fadeInMs, fadeOutMs, offMs)
+            self._animating = True
+            self._selectBank(self._drawFrame)
+
+    def stopAnimation(self):
+        """Zastaví animaci i dýchání, vrátí režim obrázku a zobrazí framebuffer."""
+        with self._i2c:
+            self._writeFunction(_REG_BREATH2, 0)
+            self._writeFunction(_REG_CONFIG, _MODE_PICTURE)
+            self._animating = False
+            # zobrazený snímek je neznámý – vynutí zápis registru
+            self._shownFrame = -1
+            if self._lastFrame < 0:
+                # živé snímky byly přepsané – celý snímek pošle a zobrazí flush()
+                self._lastFrame = self._drawFrame
+                self._selectBank(self._drawFrame)
+            else:
+                self._showFrame(self._lastFrame)
+        self.flush()
+
+    def isAnimating(self):
+        """Vrací True, pokud na čipu běží animace nebo dýchání."""
+        return self._animating
+
+    def _writeSpan(self, lo, hi):
+        """
+        Zapíše bajty framebufferu lo–hi jedním zápisem s auto-inkrementem.
+
+        Bajt před úsekem se dočasně přepíše adresou registru 0x24 + lo,
+        takže se odesílá přímo z flush bufferu bez kopírování.
+        """
+        buf = self._flushbuf
+        saved = buf[lo]
+        buf[lo] = 0x24 + lo
         try:
-            self._i2c.writeto(_ADDR, self._flushbuf)
+            self._i2c.write_span(_ADDR, buf, lo, hi + 2)
         finally:
-            self._i2c.unlock()
-            self._needFlush = False
+            buf[lo] = saved
+
+    def _writeDirty(self):
+        """
+        Odešle jen změněné úseky framebufferu (sběrnice už musí být zamčená).
+
+        Pokud minulý flush() šel do jiného snímku (double buffering),
+        přidají se k úsekům i jeho změny, aby snímek dohnal framebuffer.
+        """
+        dirtyLo = self._dirtyLo
+        dirtyHi = self._dirtyHi
+        lastLo = self._lastLo
+        lastHi = self._lastHi
+        stale = self._drawFrame != self._lastFrame
+        start = -1
+        end = -1
+        self._selectBank(self._drawFrame)
+        try:
+            for block in range(_BLOCKS):
+                lo = dirtyLo[block]
+                hi = dirtyHi[block]
+                if stale:
+                    lo, lastLo[block] = min(lo, lastLo[block]), lo
+                    hi, lastHi[block] = max(hi, lastHi[block]), hi
+                else:
+                    lastLo[block] = lo
+                    lastHi[block] = hi
+                if lo > hi:
+                    continue
+                base = block * _BLOCK_SIZE
+                if start >= 0 and base + lo - end <= _MERGE_GAP:
+                    end = base + hi
+                    continue
+                if start >= 0:
+                    self._writeSpan(start, end)
+                start = base + lo
+                end = base + hi
+            if start >= 0:
+                self._writeSpan(start, end)
+        finally:
+            self._markClean()
+
+        # zobrazení hotového snímku; při double bufferingu se kreslí do druhého
+        frame = self._drawFrame
+        self._lastFrame = frame
+        if self._doubleBuffer:
+            self._drawFrame = 1 - frame
+        self._showFrame(frame)
+
+    def _send(self):
+        """Odešle změněné úseky framebufferu hned (bez ohledu na režim max FPS)."""
+        if not self._needFlush or self._animating:
+            return
+        self._framesSent += 1
+        if self._scheduler is not None:
+            # plánovač odesílá buffer až později – zařadí se celý snímek,
+            # opakované zařazení se sloučí a odejde s nejnovějším obsahem
+            self._scheduler.submitWrite(_ADDR, self._flushbuf)
+            self._markClean()
+            return
+        with self._i2c:
+            self._writeDirty()
+
+    async def _sendAsync(self):
+        """Jako _send(), ale na uvolnění sběrnice čeká asynchronně."""
+        if not self._needFlush or self._animating:
+            return
+        if self._scheduler is not None:
+            self._send()
+            return
+        self._framesSent += 1
+        async with self._i2c:
+            self._writeDirty()
+
+    def flush(self):
+        """
+        Odešle změněné úseky framebufferu (celý snímek jen po fill/clear).
+
+        V režimu max FPS (setMaxFps) jen zaznamená požadavek – změny
+        z více volání se sloučí a odešle je jednou update() v dalším snímku.
+        """
+        if not self._needFlush:
+            return
+        self._framesRequested += 1
+        if not self._coalesce:
+            self._send()
+
+    async def flushAsync(self):
+        """Jako flush(), ale na uvolnění sběrnice čeká asynchronně."""
+        if not self._needFlush:
+            return
+        self._framesRequested += 1
+        if not self._coalesce:
+            await self._sendAsync()
 
     def redraw(self):
         self.flush()
 
+    # ---------------------------------------------------------
+    # Odložené vykreslování (snímky)
+    # ---------------------------------------------------------
+    def setFrameRate(self, fps):
+        """Nastaví, kolikrát za sekundu smí update() odeslat snímek (perioda běží od teď)."""
+        self._framePeriod.startTimer(timeout_ms=1000 // max(1, fps))
+
+    def setMaxFps(self, fps=None):
+        """
+        Zapne režim max FPS: kreslicí metody (iconA, fill, flush …) jen označí
+        změny a nejvýše fps snímků za sekundu odešle update() – volané
+        z hlavní smyčky (JoyCarRobot.update) nebo podle vlastní Period.
+
+        None vypne režim – flush() opět odesílá hned.
+        """
+        self._coalesce = bool(fps)
+        if fps:
+            self.setFrameRate(fps)
+
+    def framesRequested(self):
+        """Vrátí počet požadovaných snímků (flush() se změnami, změny vykreslené v update())."""
+        return self._framesRequested
+
+    def framesSent(self):
+        """Vrátí počet skutečně odeslaných snímků."""
+        return self._framesSent
+
+    def resetFrameStats(self):
+        """Vynuluje počítadla snímků."""
+        self._framesRequested = 0
+        self._framesSent = 0
+
+    def setSensorBar(self, pattern, bh=9, bl=1):
+        """
+        Zaznamená stav lišty senzorů (spodní řádek), nic nevykresluje ani neodesílá.
+
+        Bity vzoru: 0 = překážka vlevo, 1 = vlevo, 2 = střed, 3 = vpravo,
+        4 = překážka vpravo. Vykreslí se v nejbližším update().
+        """
+        self._sensorBar = pattern
+        self._sensorBarHigh = bh
+        self._sensorBarLow = bl
+
+    def _renderSensorBar(self):
+        """Vykreslí čekající stav lišty senzorů; vrací True, pokud něco vykreslila."""
+        pattern = self._sensorBar
+        if pattern < 0:
+            return False
+        fb = self._flushbuf
+        high = self._sensorBarHigh
+        low = self._sensorBarLow
+        for i, idx in enumerate(self._sensorBarIdx):
+            fb[1 + idx] = high if (pattern >> i) & 1 else low
+            self._markDirty(idx)
+        self._sensorBar = -1
+        return True
+
+    def scroll(self, text, y=0, color=None, periodMs=100, loop=False):
+        """
+        Spustí neblokující posuv textu (viz joycar.scroller.TextScroller).
+
+        Text posouvá update() – o jeden sloupec za periodMs. Posuv přepisuje
+        jen řádky y až y + 4 (y je 0–1), lišta senzorů (spodní řádek) zůstane.
+
+        Raises:
+            ValueError: text by zasáhl do lišty senzorů
+
+        Returns:
+            TextScroller (lze ho i posouvat ručně metodou step()).
+        """
+        self._scroller = TextScroller(self, text, y, color, periodMs, loop)
+        return self._scroller
+
+    def stopScroll(self):
+        """Zastaví posuv textu (text zůstane ve framebufferu)."""
+        self._scroller = None
+
+    def isScrolling(self):
+        """Vrací True, pokud běží posuv textu."""
+        return self._scroller is not None
+
+    def _isFrameDue(self):
+        """
+        Vykreslí čekající změny a vrátí True, pokud je čas odeslat snímek.
+
+        Změny vykreslené až zde (posuv textu, lišta senzorů) neprošly
+        flush(), proto se započítají jako požadavek na snímek tady.
+        """
+        rendered = False
+        scroller = self._scroller
+        if scroller is not None:
+            rendered = scroller.update()
+            if scroller.done():
+                self._scroller = None
+        if self._renderSensorBar():
+            rendered = True
+        if rendered:
+            self._framesRequested += 1
+        return self._needFlush and not self._animating and self._framePeriod.ready()
+
+    def update(self):
+        """
+        Vykreslí čekající změny a podle plánu snímků odešle framebuffer.
+
+        Volá se z hlavní smyčky (JoyCarRobot.update). Mezi dvěma snímky
+        (viz setFrameRate) se nic neodesílá, změny se jen hromadí.
+
+        Returns:
+            True, pokud byl odeslán snímek.
+        """
+        if not self._isFrameDue():
+            return False
+        self._send()
+        return True
+
+    async def updateAsync(self):
+        """Asynchronní varianta update()."""
+        if not self._isFrameDue():
+            return False
+        await self._sendAsync()
+        return True
+
     def sensors(self, 
                 obstacleLeft, farLeft, left,
                 midleLeft, midle35, midleRight,
@@ -314,4 +952,30 @@ class Display:
 # ---------------------------------------------------------
 # Globální instance
 # ---------------------------------------------------------
-display = Display()
+class _LazyDisplay:
+    """
+    Zástupce globálního displeje – Display() vytvoří až při prvním použití.
+
+    Do té doby se nesahá na sběrnici ani se nepřebírá internal_i2c
+    (rychlejší start, běh bez displeje). Metody se po prvním přístupu
+    uloží přímo do zástupce, další volání už nejdou přes __getattr__.
+    Ostatní atributy se čtou i nastavují vždy přímo na displeji
+    (display.default_brightness = 50 změní skutečný displej).
+    """
+
+    def __getattr__(self, name):
+        value = getattr(Display(), name)
+        # ukládají se jen metody třídy – hodnoty atributů by zastaraly
+        if callable(getattr(Display, name, None)):
+            object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(Display(), name, value)
+
+    def isCreated(self):
+        """Vrací True, pokud už displej vznikl (čip je inicializovaný)."""
+        return Display._instance is not None
+
+
+display = _LazyDisplay()
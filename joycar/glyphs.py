@@ -0,0 +1,56 @@
+"""
+glyphs.py – piktogramy 5×5 pro LED matici (číslice, písmena, šipky, křižovatky).
+
+Každý piktogram je n-tice 5 řádků; bit ix řádku iy je pixel (x0 + ix, y0 + iy).
+Text se čte od vyšších x k nižším (viz Display.number()), tedy od bitu 4 k bitu 0.
+
+Data jsou konstantní, sdílí je Display (ikony, sprity) i TextScroller.
+"""
+
+PICTOGRAMS = {
+    '>':  (0b00100, 0b00010, 0b11111, 0b00010, 0b00100),  # zatočení doprava
+    '<':  (0b00100, 0b01000, 0b11111, 0b01000, 0b00100),  # zatočení doleva
+    '^':  (0b00100, 0b00100, 0b10101, 0b01110, 0b00100),  # jedeme rovně
+    'v':  (0b00100, 0b01110, 0b10101, 0b00100, 0b00100),  # jedeme zpátky
+    'TL': (0b00100, 0b00100, 0b11100, 0b00000, 0b00000),  # rohová křižovatka doleva (turn to left)
+    'TR': (0b00100, 0b00100, 0b00111, 0b00000, 0b00000),  # rohová křižovatka doprava (turn to right)
+    'IT': (0b00100, 0b00100, 0b11111, 0b00000, 0b00000),  # intersection left-right (T)
+    'IL': (0b00100, 0b00100, 0b11100, 0b00100, 0b00100),  # intersection left-straight (T to left)
+    'IR': (0b00100, 0b00100, 0b00111, 0b00100, 0b00100),  # intersection right-straight (T to right)
+    'I+': (0b00100, 0b00100, 0b11111, 0b00100, 0b00100),  # intersection all directions (+)
+    '--': (0b00000, 0b00000, 0b11111, 0b00000, 0b00000),
+    ' -': (0b00000, 0b00000, 0b00111, 0b00000, 0b00000),
+    '- ': (0b00000, 0b00000, 0b11100, 0b00000, 0b00000),
+    '_':  (0b11111, 0b00000, 0b00000, 0b00000, 0b00000),
+    '.':  (0b00100, 0b00000, 0b00000, 0b00000, 0b00000),
+    '|':  (0b00100, 0b00100, 0b00100, 0b00100, 0b00100),
+    '/':  (0b10000, 0b01000, 0b00100, 0b00010, 0b00001),
+    '\\': (0b00001, 0b00010, 0b00100, 0b01000, 0b10000),
+    's':  (0b11100, 0b00010, 0b01110, 0b01000, 0b00111),
+    'x':  (0b10001, 0b01010, 0b00100, 0b01010, 0b10001),
+    ' ':  (0b00000, 0b00000, 0b00000, 0b00000, 0b00000),
+    ',':  (0b00100, 0b00010, 0b00000, 0b00000, 0b00000),
+    '0':  (0b01110, 0b01010, 0b01010, 0b01010, 0b01110),
+    '1':  (0b00100, 0b00100, 0b00100, 0b01100, 0b00100),
+    '2':  (0b01110, 0b01000, 0b01110, 0b00010, 0b01110),
+    '3':  (0b01110, 0b00010, 0b00110, 0b00010, 0b01110),
+    '4':  (0b00010, 0b00010, 0b01110, 0b01010, 0b01010),
+    '5':  (0b01110, 0b00010, 0b01110, 0b01000, 0b01110),
+    '6':  (0b01110, 0b01010, 0b01110, 0b01000, 0b01110),
+    '7':  (0b00010, 0b00010, 0b00010, 0b00010, 0b01110),
+    '8':  (0b01110, 0b01010, 0b01110, 0b01010, 0b01110),
+    '9':  (0b01110, 0b00010, 0b01110, 0b01010, 0b01110),
+
+    'A':  (0b01010, 0b01010, 0b01110, 0b01010, 0b00100),
+    'B':  (0b01100, 0b01010, 0b01100, 0b01010, 0b01100),
+    'C':  (0b00110, 0b01000, 0b01000, 0b01000, 0b00110),
+    'D':  (0b01100, 0b01010, 0b01010, 0b01010, 0b01100),
+    'E':  (0b01110, 0b01000, 0b01100, 0b01000, 0b01110),
+    'F':  (0b01000, 0b01000, 0b01100, 0b01000, 0b01110),
+    'H':  (0b01010, 0b01010, 0b01110, 0b01010, 0b01010),
+    'I':  (0b01110, 0b00100, 0b00100, 0b00100, 0b01110),
+    'J':  (0b00100, 0b01010, 0b00010, 0b00010, 0b00010),
+    'V':  (0b00100, 0b01010, 0b01010, 0b01010, 0b01010),
+    'Y':  (0b00100, 0b00100, 0b00100, 0b01010, 0b01010),
+    'Z':  (0b01110, 0b01000, 0b00100, 0b00010, 0b01110),
+}
@@ -0,0 +1,169 @@
+"""
+history.py – historie čtení senzorů s pevnou velikostí paměti.
+
+Tento modul poskytuje třídu SensorHistory, která:
+- ukládá posledních N surových čtení (array 'B') s časem (array 'H'),
+- přidává čtení v O(1) bez alokací,
+- drží odrušený (debounce) stav každého bitu,
+- umí většinové hlasování „n z posledních m“,
+- pamatuje si pro každý bit čas poslední změny a poslední 0 / 1.
+
+Paměť je daná při vytvoření:
+    size × 3 B (čtení + čas) + 3 × 8 × 4 B (časy po bitech).
+
+Použití (Sensors ji vytváří sám, viz Sensors.history):
+    history = SensorHistory(size=16, debounceCount=3)
+    history.append(data, ticks_ms())
+    history.countMatching(0x08, 0, 5)     # kolik z 5 čtení mělo bit 0x08 v nule
+    history.msSinceLow(0x1C)              # jak dávno byl některý bit v nule
+"""
+
+from array import array
+from adafruit_ticks import ticks_ms, ticks_diff
+
+# pro každý bajt seznam indexů jeho nastavených bitů – počítá se jednou
+SET_BITS = tuple(
+    tuple(bit for bit in range(8) if value & (1 << bit))
+    for value in range(256)
+)
+
+# čas „nikdy“ pro časy po bitech
+_NEVER = -1
+
+
+class SensorHistory:
+    """
+    Kruhový buffer čtení 8bitového vstupu s filtry.
+
+    Atributy:
+        _data (array 'B'): Surová čtení.
+        _time (array 'H'): Čas čtení v ms (dolních 16 bitů ticks_ms).
+        _head (int): Index, kam se zapíše další čtení.
+        _count (int): Počet platných čtení (nejvýše size).
+        _debounced (int): Odrušený stav (bit se změní po debounceCount shodných čteních).
+    """
+
+    def __init__(self, size: int = 16, debounceCount: int = 3) -> None:
+        if debounceCount > size:
+            raise ValueError("debounceCount nesmí být větší než size")
+        self._data = array("B", [0] * size)
+        self._time = array("H", [0] * size)
+        self._head = 0
+        self._count = 0
+        self._debounceCount = debounceCount
+        self._debounced = 0
+
+        self._edgeMs = array("l", [_NEVER] * 8)
+        self._lowMs = array("l", [_NEVER] * 8)
+        self._highMs = array("l", [_NEVER] * 8)
+
+    # ---------------------------------------------------------
+    # Zápis
+    # ---------------------------------------------------------
+
+    def append(self, data: int, timeMs: int) -> None:
+        """Přidá čtení (O(1), bez alokací)."""
+        data &= 0xFF
+        head = self._head
+        size = len(self._data)
+
+        if self._count:
+            previous = self._data[(head - 1) % size]
+            for bit in SET_BITS[data ^ previous]:
+                self._edgeMs[bit] = timeMs
+        else:
+            self._debounced = data
+
+        self._data[head] = data
+        self._time[head] = timeMs & 0xFFFF
+        self._head = (head + 1) % size
+        if self._count < size:
+            self._count += 1
+
+        for bit in SET_BITS[data]:
+            self._highMs[bit] = timeMs
+        for bit in SET_BITS[~data & 0xFF]:
+            self._lowMs[bit] = timeMs
+
+        self._updateDebounce()
+
+    def _updateDebounce(self) -> None:
+        """Bity, které mají posledních debounceCount čtení shodných, převezme do odrušeného stavu."""
+        n = self._debounceCount
+        if self._count < n:
+            return
+        ones = 0xFF
+        zeros = 0xFF
+        for age in range(n):
+            value = self.get(age)
+            ones &= value
+            zeros &= ~value
+        self._debounced = (self._debounced | ones) & ~(zeros & 0xFF)
+
+    def clear(self) -> None:
+        """Smaže historii."""
+        self._head = 0
+        self._count = 0
+        for arr in (self._edgeMs, self._lowMs, self._highMs):
+            for i in range(8):
+                arr[i] = _NEVER
+
+    # ---------------------------------------------------------
+    # Dotazy
+    # ---------------------------------------------------------
+
+    def size(self) -> int:
+        """Vrátí kapacitu historie."""
+        return len(self._data)
+
+    def count(self) -> int:
+        """Vrátí počet uložených čtení."""
+        return self._count
+
+    def get(self, age: int = 0) -> int:
+        """Vrátí čtení staré `age` kroků (0 = nejnovější)."""
+        if age >= self._count:
+            raise IndexError("Čtení už v historii není")
+        return self._data[(self._head - 1 - age) % len(self._data)]
+
+    def timeMs(self, age: int = 0) -> int:
+        """Vrátí čas čtení (dolních 16 bitů ticks_ms)."""
+        if age >= self._count:
+            raise IndexError("Čtení už v historii není")
+        return self._time[(self._head - 1 - age) % len(self._data)]
+
+    def debounced(self) -> int:
+        """Vrátí odrušený stav všech bitů."""
+        return self._debounced
+
+    def countMatching(self, mask: int, value: int, m: int) -> int:
+        """Vrátí, kolik z posledních m čtení splňuje (data & mask) == value."""
+        m = min(m, self._count)
+        matching = 0
+        for age in range(m):
+            if self.get(age) & mask == value:
+                matching += 1
+        return matching
+
+    def _msSince(self, times, mask: int):
+        """Vrátí ms od nejnovějšího času mezi bity masky (None = nikdy)."""
+        newest = _NEVER
+        for bit in SET_BITS[mask & 0xFF]:
+            t = times[bit]
+            if t != _NEVER and (newest == _NEVER or ticks_diff(t, newest) > 0):
+                newest = t
+        if newest == _NEVER:
+            return None
+        return ticks_diff(ticks_ms(), newest)
+
+    def msSinceEdge(self, mask: int):
+        """Vrátí ms od poslední změny některého bitu masky (None = beze změny)."""
+        return self._msSince(self._edgeMs, mask)
+
+    def msSinceLow(self, mask: int):
+        """Vrátí ms od posledního čtení, kdy byl některý bit masky v nule."""
+        return self._msSince(self._lowMs, mask)
+
+    def msSinceHigh(self, mask: int):
+        """Vrátí ms od posledního čtení, kdy byl některý bit masky v jedničce."""
+        return self._msSince(self._highMs, mask)
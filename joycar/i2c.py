@@ -4,6 +4,11 @@ i2c.py – bezpečný wrapper pro I2C komunikaci JoyCar robota.
 Tento modul poskytuje třídu I2C, která obaluje hardwarový i2c a zajišťuje:
 - bezpečné zamykání sběrnice pomocí context manageru,
 - jednotné API pro všechny I2C periferie robota,
+- dávkování transakcí (více zápisů/čtení pod jediným zámkem),
+- volitelné měření vytížení sběrnice (viz joycar.busstats),
+- volitelné předání dávek prioritnímu plánovači (viz joycar.scheduler),
+- asynchronní zámek pro asyncio (`async with i2c:`), který místo
+  aktivního čekání předá řízení ostatním úlohám,
 - kompatibilitu s fake hardwarem v lib_vsc_only.
 
 Použití:
@@ -11,10 +16,31 @@ Použití:
     from picoed import i2c as pico_i2c
 
     i2c = I2C(pico_i2c)
+
+Dávkování (jeden lock za celý tick superloopu):
+    i2c.begin_batch()
+    pca.writeRegister(...)            # zařadí se do fronty
+    i2c.batch_read(0x38, readbuf)     # výsledek přijde do readbuf
+    i2c.commit()                      # vše proběhne pod jedním zámkem
+
+Asyncio:
+    async with i2c:
+        i2c.readinto(0x38, buf)
+
+    i2c.begin_batch()
+    wheels.update()
+    await i2c.commit_async()
+
+Měření vytížení sběrnice:
+    stats = i2c.enable_stats()
+    ...
+    stats.report()
 """
 
+from time import monotonic_ns
 from adafruit_ticks import ticks_ms, ticks_diff
 from busio import I2C as BusIO_I2C
+from joycar.busstats import BusStats
 from utils.log import log
 
 
@@ -31,9 +57,31 @@ class I2C:
         i2c (BusIO_I2C): Podkladový I2C objekt.
     """
 
-    def __init__(self, i2c: BusIO_I2C) -> None:
+    # výchozí kapacita fronty dávkových transakcí
+    BATCH_SIZE = 16
+
+    # jak dlouho (ms) smí asynchronní zámek čekat na uvolnění sběrnice
+    ASYNC_LOCK_TIMEOUT_MS = 50
+
+    def __init__(self, i2c: BusIO_I2C, batchSize: int = BATCH_SIZE) -> None:
         self._hw_i2c = i2c
 
+        # předalokovaná fronta dávky (paralelní seznamy, žádné alokace při zařazení)
+        self._batching = False
+        self._batchCount = 0
+        self._batchAddr = [0] * batchSize
+        self._batchOut = [None] * batchSize
+        self._batchIn = [None] * batchSize
+
+        # plánovač, kterému se předávají dávkové přenosy (viz set_scheduler)
+        self._scheduler = None
+
+        # počet dávek (i dávek plánovače), jejichž odeslání selhalo
+        self._batchFailures = 0
+
+        # statistiky sběrnice (None = měření vypnuto, viz enable_stats)
+        self._stats = None
+
     # ---------------------------------------------------------
     # Context manager
     # ---------------------------------------------------------
@@ -64,23 +112,261 @@ class I2C:
         """Uvolní I2C lock."""
         self._hw_i2c.unlock()
 
+    # ---------------------------------------------------------
+    # Asynchronní lock (asyncio)
+    # ---------------------------------------------------------
+    async def __aenter__(self) -> "I2C":
+        await self.lock_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
+        self._unlock()
+        return False
+
+    async def lock_async(self) -> None:
+        """
+        Zajistí I2C lock bez aktivního čekání.
+
+        Dokud je sběrnice obsazená, předává řízení ostatním úlohám
+        (await asyncio.sleep(0)). Po ASYNC_LOCK_TIMEOUT_MS vyhodí TimeoutError.
+        """
+        if self._hw_i2c.try_lock():
+            return
+
+        import asyncio
+
+        start = ticks_ms()
+        while not self._hw_i2c.try_lock():
+            if ticks_diff(ticks_ms(), start) > I2C.ASYNC_LOCK_TIMEOUT_MS:
+                e = TimeoutError("I2C lock timeout")
+                log.exception(e)
+                raise e
+            await asyncio.sleep(0)
+
     # ---------------------------------------------------------
     # Veřejné metody — bez locku
     # ---------------------------------------------------------
+    def hw(self) -> BusIO_I2C:
+        """Vrátí podkladovou fyzickou sběrnici."""
+        return self._hw_i2c
+
     def scan(self) -> list[int]:
         """Vrátí seznam dostupných I2C adres."""
         return self._hw_i2c.scan()
 
     def read(self, addr: int, n: int) -> bytearray:
-        """Přečte n bajtů z adresy."""
+        """
+        Přečte n bajtů z adresy.
+
+        Pozor: při každém volání alokuje nový buffer.
+        V hlavní smyčce používej readinto() s předalokovaným bufferem.
+        """
         buffer = bytearray(n)
-        self._hw_i2c.readfrom_into(addr, buffer)
+        self.readinto(addr, buffer)
         return buffer
 
+    def readinto(self, addr: int, buf) -> None:
+        """Přečte z adresy tolik bajtů, kolik má buf (bez alokace)."""
+        self._hw_i2c.readfrom_into(addr, buf)
+
     def write(self, addr: int, buf: bytearray) -> None:
         """Zapíše buffer na adresu."""
         self._hw_i2c.writeto(addr, buf)
 
+    def write_span(self, addr: int, buf, start: int, end: int) -> None:
+        """Zapíše část bufferu buf[start:end] bez kopie (start/end jako v busio)."""
+        self._hw_i2c.writeto(addr, buf, start=start, end=end)
+
     def write_readinto(self, addr: int, write_buf: bytearray, read_buf: bytearray) -> None:
         """Zapíše a následně přečte data z adresy."""
-        self._hw_i2c.writeto_then_readfrom(addr, write_buf, read_buf)
\ No newline at end of file
+        self._hw_i2c.writeto_then_readfrom(addr, write_buf, read_buf)
+
+    # ---------------------------------------------------------
+    # Dávkování transakcí
+    # ---------------------------------------------------------
+    def begin_batch(self) -> None:
+        """
+        Zahájí dávku – zápisy periferií se místo okamžitého odeslání
+        řadí do fronty a odešlou se až při commit().
+        """
+        self._batching = True
+
+    def in_batch(self) -> bool:
+        """Vrací True, pokud je aktivní dávka."""
+        return self._batching
+
+    def pending(self) -> int:
+        """Vrátí počet transakcí čekajících ve frontě."""
+        return self._batchCount
+
+    def batch_failures(self) -> int:
+        """
+        Vrátí počet dávek, jejichž odeslání selhalo.
+
+        Periferie se stínovou kopií registrů (PCA9633) podle změny
+        této hodnoty poznají, že zařazené zápisy nemusely dojít do čipu.
+        """
+        return self._batchFailures
+
+    def note_batch_failure(self) -> None:
+        """Zaznamená selhání dávky (volá i plánovač při chybě přenosu)."""
+        self._batchFailures += 1
+
+    def set_scheduler(self, scheduler) -> None:
+        """
+        Předává dávkové přenosy plánovači (joycar.scheduler.BusScheduler).
+
+        Přenosy zařazené během dávky pak commit() neodešle, ale předá
+        plánovači; ten je odešle ve svém ticku podle priority zařízení.
+        None plánovač odpojí.
+        """
+        self._scheduler = scheduler
+
+    def _enqueue(self, addr: int, out_buf, in_buf) -> None:
+        """Zařadí transakci do fronty. Plná fronta se nejprve odešle."""
+        if self._scheduler is not None:
+            self._scheduler.submit(addr, out_buf, in_buf)
+            return
+        if self._batchCount == len(self._batchAddr):
+            self._runBatch()
+        i = self._batchCount
+        self._batchAddr[i] = addr
+        self._batchOut[i] = out_buf
+        self._batchIn[i] = in_buf
+        self._batchCount = i + 1
+
+    def batch_write(self, addr: int, buf) -> None:
+        """
+        Zařadí zápis do fronty.
+
+        Buffer se odešle až při commit(), volající ho do té doby nesmí měnit.
+        """
+        self._enqueue(addr, buf, None)
+
+    def batch_read(self, addr: int, buf) -> None:
+        """Zařadí čtení do předalokovaného bufferu (naplní se při commit())."""
+        self._enqueue(addr, None, buf)
+
+    def batch_write_readinto(self, addr: int, write_buf, read_buf) -> None:
+        """Zařadí zápis s následným čtením do předalokovaného bufferu."""
+        self._enqueue(addr, write_buf, read_buf)
+
+    def _runBatchLocked(self) -> int:
+        """Provede všechny transakce z fronty (sběrnice už musí být zamčená)."""
+        count = self._batchCount
+        try:
+            for i in range(count):
+                addr = self._batchAddr[i]
+                out_buf = self._batchOut[i]
+                in_buf = self._batchIn[i]
+                if in_buf is None:
+                    self.write(addr, out_buf)
+                elif out_buf is None:
+                    self.readinto(addr, in_buf)
+                else:
+                    self.write_readinto(addr, out_buf, in_buf)
+        except Exception:
+            self._batchFailures += 1
+            raise
+        finally:
+            # frontu vyprázdníme i při chybě, aby se transakce neopakovaly
+            for i in range(count):
+                self._batchOut[i] = None
+                self._batchIn[i] = None
+            self._batchCount = 0
+
+        return count
+
+    def _runBatch(self) -> int:
+        """Provede všechny transakce z fronty pod jediným zámkem."""
+        if self._batchCount == 0:
+            return 0
+        with self:
+            return self._runBatchLocked()
+
+    def commit(self) -> int:
+        """
+        Odešle celou dávku pod jediným zámkem a ukončí dávkový režim.
+
+        Returns:
+            Počet provedených transakcí.
+        """
+        self._batching = False
+        return self._runBatch()
+
+    async def commit_async(self) -> int:
+        """
+        Jako commit(), ale na uvolnění sběrnice čeká asynchronně.
+
+        Returns:
+            Počet provedených transakcí.
+        """
+        self._batching = False
+        if self._batchCount == 0:
+            return 0
+        async with self:
+            return self._runBatchLocked()
+
+    # ---------------------------------------------------------
+    # Měření vytížení sběrnice
+    # ---------------------------------------------------------
+    def enable_stats(self, stats: "BusStats | None" = None) -> BusStats:
+        """
+        Zapne měření sběrnice a vrátí objekt se statistikami.
+
+        Měřicí varianty metod nahradí původní metody jen na této instanci,
+        takže vypnuté měření nepřidává do přenosů žádnou práci navíc.
+        Měří se i asynchronní zámek (`async with i2c:`, commit_async()).
+        """
+        if stats is None:
+            stats = BusStats()
+        self._stats = stats
+        self._lock = self._lock_stats
+        self.lock_async = self._lock_async_stats
+        self.write = self._write_stats
+        self.write_span = self._write_span_stats
+        self.readinto = self._readinto_stats
+        self.write_readinto = self._write_readinto_stats
+        return stats
+
+    def disable_stats(self) -> None:
+        """Vypne měření sběrnice (vrátí původní metody)."""
+        if self._stats is None:
+            return
+        del self._lock
+        del self.lock_async
+        del self.write
+        del self.write_span
+        del self.readinto
+        del self.write_readinto
+        self._stats = None
+
+    def _lock_stats(self) -> None:
+        start = monotonic_ns()
+        I2C._lock(self)
+        self._stats.recordLockWait(monotonic_ns() - start)
+
+    async def _lock_async_stats(self) -> None:
+        start = monotonic_ns()
+        await I2C.lock_async(self)
+        self._stats.recordLockWait(monotonic_ns() - start)
+
+    def _write_stats(self, addr: int, buf) -> None:
+        start = monotonic_ns()
+        self._hw_i2c.writeto(addr, buf)
+        self._stats.recordTransfer(addr, len(buf), 0, monotonic_ns() - start)
+
+    def _write_span_stats(self, addr: int, buf, start: int, end: int) -> None:
+        t0 = monotonic_ns()
+        self._hw_i2c.writeto(addr, buf, start=start, end=end)
+        self._stats.recordTransfer(addr, end - start, 0, monotonic_ns() - t0)
+
+    def _readinto_stats(self, addr: int, buf) -> None:
+        start = monotonic_ns()
+        self._hw_i2c.readfrom_into(addr, buf)
+        self._stats.recordTransfer(addr, 0, len(buf), monotonic_ns() - start)
+
+    def _write_readinto_stats(self, addr: int, write_buf, read_buf) -> None:
+        start = monotonic_ns()
+        self._hw_i2c.writeto_then_readfrom(addr, write_buf, read_buf)
+        self._stats.recordTransfer(addr, len(write_buf), len(read_buf), monotonic_ns() - start)
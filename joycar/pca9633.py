@@ -3,13 +3,23 @@ pca9633.py – ovladač PWM driveru PCA9633 pro JoyCar robota.
 
 Tento modul poskytuje:
 - registry PCA9633,
-- třídu PCA9633 pro řízení 4 PWM kanálů motorů.
+- třídu PCA9633 pro řízení 4 PWM kanálů motorů,
+- hromadný (burst) zápis registrů pomocí auto-inkrementu čipu,
+- stínovou kopii registrů – zápis stejné hodnoty se na sběrnici vůbec nepošle,
+- čtení i zápis přes předalokované buffery (bez alokací v hlavní smyčce).
 
 Použití:
     pca = PCA9633(i2c)
     pca.writeRegister(PCA9633_registers.PWM0, 128)
+
+    # všechny 4 PWM kanály jedním 5bajtovým zápisem
+    pca.writePwm(0, 128, 0, 64)
+
+    # po chybě sběrnice nebo resetu čipu
+    pca.invalidate()
 """
 
+from joycar.buses import buses
 from joycar.i2c import I2C
 
 
@@ -24,6 +34,21 @@ class PCA9633_registers:
     GRPPWM = 0x06
     GRPFREQ = 0x07
     LEDOUT = 0x08
+    SUBADR1 = 0x09
+    SUBADR2 = 0x0A
+    SUBADR3 = 0x0B
+    ALLCALLADR = 0x0C
+
+    # počet registrů čipu
+    COUNT = 13
+
+    # příznaky auto-inkrementu v řídicím bajtu (bity 7:5)
+    AI_ALL = 0x80           # inkrement přes všechny registry
+    AI_BRIGHTNESS = 0xA0    # inkrement jen přes PWM0–PWM3 (pak zpět na PWM0)
+
+
+# bitová maska registrů PWM0–PWM3 ve stínové kopii
+_PWM_MASK = 0b111100
 
 
 class PCA9633:
@@ -33,31 +58,313 @@ class PCA9633:
     Umožňuje:
         - čtení registrů,
         - zápis registrů,
-        - řízení 4 PWM kanálů motorů.
+        - řízení 4 PWM kanálů motorů (i najednou jedním burst zápisem).
+
+    Ovladač si pamatuje, co do čipu naposledy zapsal (stínová kopie).
+    Zápis hodnoty, která už v čipu je, se na sběrnici nepošle.
+    Po chybě sběrnice nebo resetu čipu je nutné zavolat invalidate()
+    (další zápisy pak projdou vždy) nebo resync() (načte registry z čipu).
+    Selhání dávky (I2C.commit, plánovač) se pozná a stav se zapomene samo.
 
     Atributy:
         _i2c (I2C): Bezpečný I2C wrapper.
         _address (int): I2C adresa zařízení.
+        _regs (bytearray): Stínová kopie registrů (požadované hodnoty).
+        _known (int): Bitová maska registrů, jejichž stín odpovídá čipu.
+        _dirty (int): Bitová maska připravených, ale neodeslaných registrů.
+        _pwmFrame (bytearray): Řídicí bajt + hodnoty PWM0–PWM3 pro burst zápis.
+        _txbuf (bytearray): Předalokovaný buffer pro zápis (řídicí bajt + data).
+        _rxbuf (bytearray): Předalokovaný buffer pro čtení registrů.
     """
 
     def __init__(self, i2c: I2C, address=0x62):
         self._i2c = i2c
         self._address = address
+        buses.registerDevice(i2c, address)
+
+        self._regs = bytearray(PCA9633_registers.COUNT)
+        self._known = 0
+        self._dirty = 0
+        self._suppressed = 0
+        # počet selhaných dávek, o kterých už stínová kopie ví
+        self._batchFailures = i2c.batch_failures()
+
+        # [řídicí bajt, PWM0, PWM1, PWM2, PWM3] – rámec pro burst zápis kanálů
+        self._pwmFrame = bytearray(5)
+        self._pwmFrame[0] = PCA9633_registers.AI_BRIGHTNESS | PCA9633_registers.PWM0
+
+        # předalokované buffery a jejich výřezy (memoryview se vytvoří jen jednou);
+        # _txviews[n] je prvních n bajtů _txbuf
+        self._txbuf = bytearray(1 + PCA9633_registers.COUNT)
+        self._txview = memoryview(self._txbuf)
+        self._txviews = [self._txview[0:n] for n in range(2 + PCA9633_registers.COUNT)]
+        self._tx1 = self._txviews[1]
+        self._tx2 = self._txviews[2]
+        self._rxbuf = bytearray(PCA9633_registers.COUNT)
+        self._rx1 = memoryview(self._rxbuf)[0:1]
+
+        # [registr, hodnota] – vlastní rámec každého registru pro zápisy v dávce
+        # (dávka odesílá až při commit, sdílený _txbuf by se mezitím přepsal)
+        self._regFrames = [bytearray((reg, 0)) for reg in range(PCA9633_registers.COUNT)]
+
+    # ---------------------------------------------------------
+    # Stínová kopie registrů
+    # ---------------------------------------------------------
+
+    def _isCached(self, reg: int, value: int) -> bool:
+        """Vrací True, pokud čip prokazatelně už obsahuje danou hodnotu."""
+        failures = self._i2c.batch_failures()
+        if failures != self._batchFailures:
+            # dávka selhala → zařazené zápisy nemusely do čipu dojít
+            self._batchFailures = failures
+            self._known = 0
+        return (self._known >> reg) & 1 == 1 and self._regs[reg] == value
+
+    def _remember(self, reg: int, value: int) -> int:
+        """
+        Uloží hodnotu do stínové kopie a vrátí bitovou masku registru.
+
+        Registry mimo rozsah čipu se nestínují (maska 0).
+        """
+        if reg >= PCA9633_registers.COUNT:
+            return 0
+        self._regs[reg] = value
+        return 1 << reg
+
+    def _sendLocked(self, buf, mask: int) -> None:
+        """
+        Odešle jeden rámec (sběrnice už musí být zamčená) a označí
+        registry z masky jako shodné s čipem.
+
+        Při chybě se registry z masky označí jako neznámé a chyba se propaguje.
+        """
+        try:
+            self._i2c.write(self._address, buf)
+        except Exception:
+            self._known &= ~mask
+            raise
+        self._known |= mask
+        self._dirty &= ~mask
+
+    def _send(self, buf, mask: int) -> None:
+        """
+        Odešle jeden rámec (nebo ho při aktivní dávce zařadí do fronty).
+
+        Zařazený rámec se považuje za odeslaný; pokud dávka později selže,
+        pozná to _isCached() podle I2C.batch_failures() a stav čipu zapomene.
+        """
+        if self._i2c.in_batch():
+            self._i2c.batch_write(self._address, buf)
+            self._known |= mask
+            self._dirty &= ~mask
+            return
+        with self._i2c:
+            self._sendLocked(buf, mask)
+
+    def _queueRegister(self, reg: int, value: int, mask: int) -> None:
+        """
+        Zařadí zápis jednoho registru do dávky v jeho předalokovaném rámci.
+
+        Zapíše-li se tentýž registr v jedné dávce víckrát, odešle se
+        pokaždé poslední hodnota – v čipu tedy skončí správně.
+        """
+        if reg < PCA9633_registers.COUNT:
+            frame = self._regFrames[reg]
+            frame[1] = value
+        else:
+            # registr mimo rozsah čipu nemá předalokovaný rámec
+            frame = bytes((reg, value))
+        self._send(frame, mask)
+
+    def invalidate(self) -> None:
+        """
+        Zapomene stav čipu (např. po chybě sběrnice nebo resetu čipu).
+
+        Další zápisy se odešlou vždy, i když se hodnota nezměnila.
+        """
+        self._known = 0
+
+    def resync(self) -> None:
+        """
+        Načte všechny registry z čipu do stínové kopie.
+
+        Registry s připravenou (neodeslanou) hodnotou se nepřepíšou.
+        """
+        self.readRegistersInto(PCA9633_registers.MODE1, self._rxbuf)
+
+    def suppressedWrites(self) -> int:
+        """Vrátí počet zápisů, které se díky stínové kopii nemusely odeslat."""
+        return self._suppressed
+
+    # ---------------------------------------------------------
+    # Jednotlivé registry
+    # ---------------------------------------------------------
 
     def readRegister(self, reg: int) -> int:
-        """Přečte hodnotu z registru."""
-        readbuffer = bytearray(1)
+        """Přečte hodnotu z registru (a uloží ji do stínové kopie)."""
+        self._txbuf[0] = reg
         with self._i2c:
-            self._i2c.write_readinto(self._address, bytes([reg]), readbuffer)
-        return readbuffer[0]
+            self._i2c.write_readinto(self._address, self._tx1, self._rx1)
+        value = self._rxbuf[0]
+        if reg < PCA9633_registers.COUNT and not (self._dirty >> reg) & 1:
+            self._regs[reg] = value
+            self._known |= 1 << reg
+        return value
 
-    def writeRegister(self, reg: int, value: int) -> None:
-        """Zapíše hodnotu do registru."""
+    def readRegistersInto(self, startReg: int, buf) -> None:
+        """
+        Přečte po sobě jdoucí registry do bufferu volajícího (auto-inkrement).
+
+        Přečtené hodnoty se uloží i do stínové kopie.
+        """
+        self._txbuf[0] = PCA9633_registers.AI_ALL | startReg
         with self._i2c:
-            self._i2c.write(self._address, bytes([reg, value]))
+            self._i2c.write_readinto(self._address, self._tx1, buf)
+        for i in range(len(buf)):
+            reg = startReg + i
+            if reg < PCA9633_registers.COUNT and not (self._dirty >> reg) & 1:
+                self._regs[reg] = buf[i]
+                self._known |= 1 << reg
+
+    def writeRegister(self, reg: int, value: int) -> None:
+        """
+        Zapíše hodnotu do registru.
+
+        Pokud čip hodnotu už obsahuje, nic se neodešle.
+        Při aktivní dávce (I2C.begin_batch) se zápis pouze zařadí do fronty.
+        """
+        if self._isCached(reg, value):
+            self._suppressed += 1
+            return
+        mask = self._remember(reg, value)
+        if self._i2c.in_batch():
+            self._queueRegister(reg, value, mask)
+            return
+        self._txbuf[0] = reg
+        self._txbuf[1] = value
+        self._send(self._tx2, mask)
 
     def writeTwoRegisters(self, firstReg: int, firstValue: int, secondReg: int, secondValue: int) -> None:
-        """Zapíše hodnoty do dvou registrů."""
+        """
+        Zapíše hodnoty do dvou registrů.
+
+        Registry, které hodnotu už obsahují, se přeskočí.
+        Při aktivní dávce (I2C.begin_batch) se zápisy pouze zařadí do fronty.
+        """
+        if self._isCached(firstReg, firstValue):
+            self._suppressed += 1
+            self.writeRegister(secondReg, secondValue)
+            return
+        if self._isCached(secondReg, secondValue):
+            self._suppressed += 1
+            self.writeRegister(firstReg, firstValue)
+            return
+
+        firstMask = self._remember(firstReg, firstValue)
+        secondMask = self._remember(secondReg, secondValue)
+        if self._i2c.in_batch():
+            self._queueRegister(firstReg, firstValue, firstMask)
+            self._queueRegister(secondReg, secondValue, secondMask)
+            return
+        txbuf = self._txbuf
         with self._i2c:
-            self._i2c.write(self._address, bytes([firstReg, firstValue]))
-            self._i2c.write(self._address, bytes([secondReg, secondValue]))
+            txbuf[0] = firstReg
+            txbuf[1] = firstValue
+            self._sendLocked(self._tx2, firstMask)
+            txbuf[0] = secondReg
+            txbuf[1] = secondValue
+            self._sendLocked(self._tx2, secondMask)
+
+    # ---------------------------------------------------------
+    # Burst zápisy (auto-inkrement)
+    # ---------------------------------------------------------
+
+    def writeRegisters(self, startReg: int, values) -> None:
+        """
+        Zapíše po sobě jdoucí registry jediným rámcem.
+
+        Používá auto-inkrement přes všechny registry, takže lze
+        zapsat např. MODE1..LEDOUT najednou. Pokud čip všechny
+        hodnoty už obsahuje, nic se neodešle.
+
+        V dávce se registry zařadí jednotlivě (každý ve svém předalokovaném
+        rámci); pod společným zámkem dávky to na výsledku nic nemění.
+        """
+        count = len(values)
+        cached = True
+        for i in range(count):
+            if not self._isCached(startReg + i, values[i]):
+                cached = False
+                break
+        if cached:
+            self._suppressed += 1
+            return
+
+        if self._i2c.in_batch():
+            for i in range(count):
+                reg = startReg + i
+                self._queueRegister(reg, values[i], self._remember(reg, values[i]))
+            return
+
+        txbuf = self._txbuf
+        mask = 0
+        txbuf[0] = PCA9633_registers.AI_ALL | startReg
+        for i in range(count):
+            txbuf[1 + i] = values[i]
+            mask |= self._remember(startReg + i, values[i])
+        self._send(self._txviews[1 + count], mask)
+
+    def setPwm(self, reg: int, value: int) -> None:
+        """
+        Připraví hodnotu jednoho PWM kanálu (PWM0–PWM3) bez zápisu na sběrnici.
+
+        Připravené hodnoty se odešlou společně metodou commitPwm().
+        Hodnota, kterou už čip obsahuje, se neoznačí k odeslání.
+        """
+        if self._isCached(reg, value):
+            return
+        self._regs[reg] = value
+        self._known &= ~(1 << reg)
+        self._dirty |= 1 << reg
+
+    def commitPwm(self) -> None:
+        """
+        Odešle připravené hodnoty všech 4 PWM kanálů jedním 5bajtovým rámcem.
+
+        Pokud se od posledního odeslání žádný kanál nezměnil, nic nedělá.
+        """
+        if not self._dirty & _PWM_MASK:
+            return
+        self._send(self._fillPwmFrame(), _PWM_MASK)
+
+    async def commitPwmAsync(self) -> None:
+        """Jako commitPwm(), ale na uvolnění sběrnice čeká asynchronně."""
+        if not self._dirty & _PWM_MASK:
+            return
+        frame = self._fillPwmFrame()
+        if self._i2c.in_batch():
+            self._send(frame, _PWM_MASK)
+            return
+        async with self._i2c:
+            self._sendLocked(frame, _PWM_MASK)
+
+    def _fillPwmFrame(self) -> bytearray:
+        """Zkopíruje připravené hodnoty PWM0–PWM3 do burst rámce a vrátí ho."""
+        frame = self._pwmFrame
+        regs = self._regs
+        frame[1] = regs[PCA9633_registers.PWM0]
+        frame[2] = regs[PCA9633_registers.PWM1]
+        frame[3] = regs[PCA9633_registers.PWM2]
+        frame[4] = regs[PCA9633_registers.PWM3]
+        return frame
+
+    def writePwm(self, pwm0: int, pwm1: int, pwm2: int, pwm3: int) -> None:
+        """Nastaví a ihned odešle všechny 4 PWM kanály jedním rámcem (jen při změně)."""
+        self.setPwm(PCA9633_registers.PWM0, pwm0)
+        self.setPwm(PCA9633_registers.PWM1, pwm1)
+        self.setPwm(PCA9633_registers.PWM2, pwm2)
+        self.setPwm(PCA9633_registers.PWM3, pwm3)
+        if not self._dirty & _PWM_MASK:
+            self._suppressed += 1
+            return
+        self.commitPwm()
@@ -4,13 +4,15 @@ pcf8574.py – ovladač I/O expanderu PCF8574 pro JoyCar robota.
 Tento modul poskytuje třídu PCF8574, která umožňuje:
 - čtení vstupů (senzory),
 - zápis výstupů (pokud by byly potřeba),
-- bezpečnou komunikaci přes I2C wrapper.
+- bezpečnou komunikaci přes I2C wrapper,
+- čtení i zápis bez alokací (předalokovaný buffer).
 
 Použití:
     pcf = PCF8574(i2c)
     value = pcf.read()
 """
 
+from joycar.buses import buses
 from joycar.i2c import I2C
 
 
@@ -21,18 +23,42 @@ class PCF8574:
     Atributy:
         _i2c (I2C): Bezpečný I2C wrapper.
         _address (int): I2C adresa zařízení.
+        _buf (bytearray): Předalokovaný 1bajtový buffer pro čtení i zápis.
     """
 
     def __init__(self, i2c: I2C, address: int = 0x38) -> None:
         self._i2c = i2c
         self._address = address
+        self._buf = bytearray(1)
+        buses.registerDevice(i2c, address)
 
     def write(self, data: int) -> None:
-        """Zapíše jeden bajt do expanderu."""
+        """
+        Zapíše jeden bajt do expanderu.
+
+        Při aktivní dávce (I2C.begin_batch) se zápis pouze zařadí do fronty.
+        """
+        if self._i2c.in_batch():
+            # dávka odesílá až později → rámec musí mít vlastní buffer
+            self._i2c.batch_write(self._address, bytes([data & 0xFF]))
+            return
+        self._buf[0] = data & 0xFF
         with self._i2c:
-            self._i2c.write(self._address, bytes([data & 0xFF]))
+            self._i2c.write(self._address, self._buf)
 
     def read(self) -> int:
         """Přečte jeden bajt z expanderu."""
         with self._i2c:
-            return self._i2c.read(self._address, 1)[0]
+            self._i2c.readinto(self._address, self._buf)
+        return self._buf[0]
+
+    def readInto(self, buf) -> None:
+        """Přečte z expanderu tolik bajtů, kolik má buf volajícího."""
+        with self._i2c:
+            self._i2c.readinto(self._address, buf)
+
+    async def readAsync(self) -> int:
+        """Přečte jeden bajt z expanderu, na sběrnici čeká asynchronně."""
+        async with self._i2c:
+            self._i2c.readinto(self._address, self._buf)
+        return self._buf[0]
@@ -5,6 +5,7 @@ Tento modul poskytuje třídu JoyCarRobot, která:
 - vytváří senzory,
 - vytváří motory,
 - propojuje I2C periferie (PCF8574, PCA9633),
+- volitelně odesílá přenosy přes prioritní plánovač (BusScheduler),
 - poskytuje jednotné API pro řízení robota.
 
 Použití:
@@ -16,6 +17,14 @@ Použití:
     robot.update()
 """
 
+# Pokusíme se získat informaci o TYPE_CHECKING bez přímého "from typing import ..."
+# protože některé CircuitPython buildy modul typing vůbec nemají.
+try:
+    import typing as _typing  # type: ignore
+    TYPE_CHECKING = getattr(_typing, "TYPE_CHECKING", False)
+except Exception:
+    TYPE_CHECKING = False
+
 from joycar.display import display
 from joycar.i2c import I2C
 from joycar.pcf8574 import PCF8574
@@ -23,6 +32,10 @@ from joycar.pca9633 import PCA9633
 from joycar.sensors import Sensors
 from joycar.wheels import Wheels
 
+# plánovač je potřeba jen pro anotace (import jen při statické analýze)
+if TYPE_CHECKING:
+    from joycar.scheduler import BusScheduler
+
 class JoyCarRobot:
     """
     Hlavní třída robota JoyCar.
@@ -32,7 +45,9 @@ class JoyCarRobot:
         wheels (Wheels): Dvojice motorů robota.
     """
 
-    def __init__(self, i2c: I2C, wheelDiameter: float, wheelBase: float) -> None:
+    def __init__(self, i2c: I2C, wheelDiameter: float, wheelBase: float,
+                 scheduler: "BusScheduler | None" = None, sensorsIntPin=None,
+                 showSensors: bool = True, adaptivePolling: bool = False) -> None:
         """
         Inicializuje robot JoyCar.
 
@@ -40,18 +55,62 @@ class JoyCarRobot:
             i2c (I2C): I2C wrapper (řeší automatické zamykání)
             wheelDiameter (float): průměr kola v metrech
             wheelBase (float): vzdálenost mezi koly v metrech
+            scheduler (BusScheduler | None): prioritní plánovač přenosů
+            sensorsIntPin: pin připojený na INT výstup PCF8574 (režim přerušení senzorů)
+            showSensors (bool): zobrazovat senzory na displeji; False = běh bez displeje
+                    (displej se vytvoří, jen pokud ho použije uživatelský kód)
+            adaptivePolling (bool): perioda čtení senzorů podle rychlosti robota
+                    (viz Sensors.setAdaptivePolling); stojící robot pak čte
+                    jen každých 200 ms, proto je výchozí False
         """
+        self._i2c = i2c
+        self._scheduler = scheduler
+        if scheduler is not None:
+            i2c.set_scheduler(scheduler)
         pcf8574 = PCF8574(i2c)
         pca9633 = PCA9633(i2c)
 
-        self.sensors = Sensors(pcf8574)
+        self.sensors = Sensors(pcf8574, intPin=sensorsIntPin, showOnDisplay=showSensors)
         self.wheels = Wheels(pca9633, wheelDiameter, wheelBase)
 
+        # čím rychleji robot jede, tím častěji čte senzory
+        # (v režimu přerušení se změny čtou hned, perioda zůstane záložní)
+        if adaptivePolling:
+            self.sensors.setAdaptivePolling(self.wheels.commandedSpeed)
+
     def update(self) -> None:
-        """Periodická aktualizace robota (senzory + motory)."""
+        """
+        Periodická aktualizace robota (senzory + motory + displej).
+
+        Zápisy motorů se odešlou jako jedna dávka pod jediným zámkem I2C.
+        S plánovačem se dávka předá plánovači a ten v rámci ticku odešle
+        přednostně motory, zbytek podle rozpočtu času sběrnice.
+        Displej se odešle až nakonec a jen podle svého plánu snímků
+        (jen pokud už vznikl – bez displeje se na něj nesahá).
+        """
         self.sensors.update()
-        self.wheels.update()
-        display.updatePixels()        
+
+        self._i2c.begin_batch()
+        try:
+            self.wheels.update()
+        finally:
+            self._i2c.commit()
+        if self._scheduler is not None:
+            self._scheduler.tick()
+        if display.isCreated():
+            display.update()
+
+    async def updateAsync(self) -> None:
+        """
+        Asynchronní varianta update() pro asyncio.
+
+        Na sběrnici se čeká bez aktivního čekání. Pro běh senzorů, motorů
+        a displeje s různou frekvencí viz joycar.aio.
+        """
+        await self.sensors.updateAsync()
+        await self.wheels.updateAsync()
+        if display.isCreated():
+            await display.updateAsync()
 
     def stop(self) -> None:
         """Zastaví robota (oba motory)."""
@@ -0,0 +1,284 @@
+"""
+scheduler.py – plánovač I2C přenosů s prioritami a časovým rozpočtem.
+
+Tento modul poskytuje třídu BusScheduler, která:
+- řadí přenosy do tří prioritních tříd (bezpečnost/motory, senzory, displej),
+- v každém ticku superloopu odešle jen tolik přenosů, kolik se vejde
+  do časového rozpočtu (odhad z počtu bajtů a frekvence sběrnice),
+- přenosy nižší priority, na které nezbyl čas, odloží do dalšího ticku,
+- opakovaně zařazený buffer nezařadí znovu (slučování) – odešle se
+  jen jednou, a to s nejnovějším obsahem.
+
+Přenosy třídy SAFETY se odešlou vždy, bez ohledu na rozpočet.
+
+Plánovač je nadstavba nad joycar.i2c.I2C. Po I2C.set_scheduler() se
+dávkové zápisy periferií (begin_batch / batch_write / commit) neodesílají
+při commit(), ale zařadí se do plánovače podle adresy zařízení.
+
+Použití:
+    scheduler = BusScheduler(i2c, budgetUs=1500)
+    i2c.set_scheduler(scheduler)
+
+    # hlavní smyčka
+    i2c.begin_batch()
+    wheels.update()
+    i2c.commit()            # zařadí do plánovače
+    scheduler.tick()        # odešle, co se vejde do rozpočtu
+"""
+
+from joycar.i2c import I2C
+
+
+class BusScheduler:
+    """
+    Prioritní plánovač I2C přenosů s rozpočtem času na jeden tick.
+
+    Prioritní třídy (nižší číslo = vyšší priorita):
+        SAFETY  – motory, nouzové zastavení (odešle se vždy)
+        SENSORS – čtení senzorů
+        DISPLAY – displej a další kosmetika
+
+    Atributy:
+        _i2c (I2C): Bezpečný I2C wrapper.
+        _budgetUs (int): Rozpočet času sběrnice na jeden tick v µs.
+        _frequency (int): Frekvence sběrnice v Hz (pro odhad doby přenosu).
+        _priorities (dict): Adresa zařízení → prioritní třída.
+    """
+
+    SAFETY = 0
+    SENSORS = 1
+    DISPLAY = 2
+
+    CLASSES = 3
+
+    # výchozí priority zařízení JoyCar robota
+    DEFAULT_PRIORITIES = {
+        0x62: SAFETY,     # PCA9633 – motory
+        0x38: SENSORS,    # PCF8574 – senzory
+        0x74: DISPLAY,    # IS31FL3731 – LED matice
+    }
+
+    QUEUE_SIZE = 8
+
+    def __init__(self, i2c: I2C, budgetUs: int = 2000, frequency: int = 400_000,
+                 queueSize: int = QUEUE_SIZE) -> None:
+        self._i2c = i2c
+        self._budgetUs = budgetUs
+        self._frequency = frequency
+        self._priorities = dict(BusScheduler.DEFAULT_PRIORITIES)
+
+        # předalokované fronty – pro každou třídu paralelní seznamy
+        self._count = [0] * BusScheduler.CLASSES
+        self._addr = [[0] * queueSize for _ in range(BusScheduler.CLASSES)]
+        self._out = [[None] * queueSize for _ in range(BusScheduler.CLASSES)]
+        self._in = [[None] * queueSize for _ in range(BusScheduler.CLASSES)]
+
+        self._sent = 0
+        self._deferred = 0
+        self._coalesced = 0
+        self._lastTickUs = 0
+
+    # ---------------------------------------------------------
+    # Nastavení
+    # ---------------------------------------------------------
+
+    def i2c(self) -> I2C:
+        """Vrátí I2C wrapper sběrnice, kterou plánovač řídí."""
+        return self._i2c
+
+    def setPriority(self, addr: int, priority: int) -> None:
+        """Nastaví prioritní třídu zařízení na dané adrese."""
+        self._priorities[addr] = priority
+
+    def priority(self, addr: int) -> int:
+        """Vrátí prioritní třídu zařízení (neznámé zařízení = SENSORS)."""
+        return self._priorities.get(addr, BusScheduler.SENSORS)
+
+    def setBudget(self, budgetUs: int) -> None:
+        """Nastaví rozpočet času sběrnice na jeden tick v µs."""
+        self._budgetUs = budgetUs
+
+    def transferUs(self, addr: int, nwrite: int, nread: int = 0) -> int:
+        """
+        Odhadne dobu přenosu v µs.
+
+        START + adresa s ACK (9 bitů) + 9 bitů na každý bajt + STOP,
+        zápis s následným čtením má opakovaný START a adresu navíc.
+        """
+        bits = 11 + 9 * (nwrite + nread)
+        if nwrite and nread:
+            bits += 10
+        return (bits * 1_000_000 + self._frequency - 1) // self._frequency
+
+    # ---------------------------------------------------------
+    # Zařazení přenosů
+    # ---------------------------------------------------------
+
+    def submit(self, addr: int, out_buf, in_buf=None) -> None:
+        """
+        Zařadí přenos podle priority zařízení.
+
+        Stejný buffer pro stejnou adresu se zařadí jen jednou – odešle se
+        s obsahem, který bude mít v okamžiku odeslání.
+        Volající proto buffer smí měnit, dokud nebyl odeslán.
+        """
+        cls = self.priority(addr)
+        addrs = self._addr[cls]
+        outs = self._out[cls]
+        ins = self._in[cls]
+        count = self._count[cls]
+
+        for i in range(count):
+            if addrs[i] == addr and outs[i] is out_buf and ins[i] is in_buf:
+                self._coalesced += 1
+                return
+
+        if count == len(addrs):
+            # plná fronta třídy se odešle hned (jako plná dávka v I2C)
+            with self._i2c:
+                self._runHead(cls, count)
+            count = 0
+
+        addrs[count] = addr
+        outs[count] = out_buf
+        ins[count] = in_buf
+        self._count[cls] = count + 1
+
+    def submitWrite(self, addr: int, buf) -> None:
+        """Zařadí zápis bufferu na adresu."""
+        self.submit(addr, buf, None)
+
+    def submitRead(self, addr: int, buf) -> None:
+        """Zařadí čtení do předalokovaného bufferu."""
+        self.submit(addr, None, buf)
+
+    def submitWriteRead(self, addr: int, write_buf, read_buf) -> None:
+        """Zařadí zápis s následným čtením do předalokovaného bufferu."""
+        self.submit(addr, write_buf, read_buf)
+
+    def pending(self, priority: "int | None" = None) -> int:
+        """Vrátí počet čekajících přenosů (všech, nebo jen dané třídy)."""
+        if priority is None:
+            return sum(self._count)
+        return self._count[priority]
+
+    # ---------------------------------------------------------
+    # Odeslání
+    # ---------------------------------------------------------
+
+    def _cost(self, cls: int, i: int) -> int:
+        out_buf = self._out[cls][i]
+        in_buf = self._in[cls][i]
+        nwrite = 0 if out_buf is None else len(out_buf)
+        nread = 0 if in_buf is None else len(in_buf)
+        return self.transferUs(self._addr[cls][i], nwrite, nread)
+
+    def _runHead(self, cls: int, n: int) -> None:
+        """Provede prvních n přenosů třídy (sběrnice už musí být zamčená)."""
+        i2c = self._i2c
+        addrs = self._addr[cls]
+        outs = self._out[cls]
+        ins = self._in[cls]
+        count = self._count[cls]
+        try:
+            for i in range(n):
+                out_buf = outs[i]
+                in_buf = ins[i]
+                if in_buf is None:
+                    i2c.write(addrs[i], out_buf)
+                elif out_buf is None:
+                    i2c.readinto(addrs[i], in_buf)
+                else:
+                    i2c.write_readinto(addrs[i], out_buf, in_buf)
+        except Exception:
+            # zařazené zápisy nemusely dojít – periferie zapomenou stav čipu
+            i2c.note_batch_failure()
+            raise
+        finally:
+            # posun zbytku fronty na začátek (i při chybě, aby se přenosy neopakovaly)
+            rest = count - n
+            for i in range(rest):
+                addrs[i] = addrs[n + i]
+                outs[i] = outs[n + i]
+                ins[i] = ins[n + i]
+            for i in range(rest, count):
+                outs[i] = None
+                ins[i] = None
+            self._count[cls] = rest
+            self._sent += n
+
+    def tick(self, budgetUs: "int | None" = None) -> int:
+        """
+        Odešle čekající přenosy podle priority, dokud stačí rozpočet.
+
+        - třída SAFETY se odešle celá vždy,
+        - ostatní třídy v pořadí priority a FIFO; první přenos, který se
+          nevejde, a vše za ním se odloží do dalšího ticku,
+        - přenos delší než celý rozpočet se odešle, pokud je v ticku první
+          (jinak by se nikdy neodeslal).
+
+        Vše proběhne pod jediným zámkem sběrnice.
+
+        Returns:
+            Počet odeslaných přenosů.
+        """
+        if budgetUs is None:
+            budgetUs = self._budgetUs
+        if sum(self._count) == 0:
+            self._lastTickUs = 0
+            return 0
+
+        sentBefore = self._sent
+        spent = 0
+        with self._i2c:
+            count = self._count[BusScheduler.SAFETY]
+            for i in range(count):
+                spent += self._cost(BusScheduler.SAFETY, i)
+            self._runHead(BusScheduler.SAFETY, count)
+
+            for cls in range(BusScheduler.SENSORS, BusScheduler.CLASSES):
+                count = self._count[cls]
+                n = 0
+                while n < count:
+                    cost = self._cost(cls, n)
+                    if spent + cost > budgetUs and spent > 0:
+                        break
+                    spent += cost
+                    n += 1
+                self._runHead(cls, n)
+                if self._count[cls]:
+                    break
+
+        self._deferred += sum(self._count)
+        self._lastTickUs = spent
+        return self._sent - sentBefore
+
+    def flush(self) -> int:
+        """Odešle všechny čekající přenosy bez ohledu na rozpočet."""
+        sent = 0
+        with self._i2c:
+            for cls in range(BusScheduler.CLASSES):
+                count = self._count[cls]
+                self._runHead(cls, count)
+                sent += count
+        return sent
+
+    # ---------------------------------------------------------
+    # Statistiky
+    # ---------------------------------------------------------
+
+    def sent(self) -> int:
+        """Vrátí celkový počet odeslaných přenosů."""
+        return self._sent
+
+    def deferred(self) -> int:
+        """Vrátí, kolikrát byl přenos odložen do dalšího ticku."""
+        return self._deferred
+
+    def coalesced(self) -> int:
+        """Vrátí počet přenosů, které se sloučily s již čekajícím přenosem."""
+        return self._coalesced
+
+    def lastTickUs(self) -> int:
+        """Vrátí odhadovaný čas sběrnice spotřebovaný posledním tickem v µs."""
+        return self._lastTickUs
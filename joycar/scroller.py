@@ -0,0 +1,183 @@
+"""
+scroller.py – neblokující posuv textu po LED matici 17×7.
+
+Tento modul poskytuje třídu TextScroller, která:
+- při vytvoření jednou sestaví sloupcovou bitmapu celého textu
+  (jas každého pixelu, po sloupcích, v pořadí bajtů framebufferu),
+- v každém kroku posune text o jeden sloupec – každý sloupec displeje
+  je jediná kopie řezu (memoryview) do framebufferu, bez volání pixel(),
+- kroky řídí Period, takže update() lze volat v hlavní smyčce libovolně často.
+
+Využívá rozložení framebufferu IS31FL3731: pixely jednoho sloupce
+leží za sebou (vlevo od středu v pořadí y sestupně, vpravo vzestupně).
+
+Použití:
+    scroller = display.scroll("JOYCAR 12", periodMs=80)
+    while True:
+        robot.update()          # display.update() posouvá text a odesílá snímky
+"""
+
+from joycar.glyphs import PICTOGRAMS
+from utils.period import Period
+
+_COLS = 17
+_GLYPH_ROWS = 5
+# mezera mezi znaky a šířka mezery (ve sloupcích)
+_SPACING = 1
+_SPACE_WIDTH = 2
+
+
+class TextScroller:
+    """
+    Posuv textu zprava doleva (text se čte od vyšších x k nižším).
+
+    Atributy:
+        _colsLow (bytearray): Sloupce pro x ≤ 8 (y sestupně), h bajtů na sloupec.
+        _colsHigh (bytearray): Sloupce pro x > 8 (y vzestupně).
+        _offset (int): Index sloupce bitmapy zobrazeného na x = 16.
+        _steps (int): Počet kroků, než text celý odjede z displeje.
+    """
+
+    def __init__(self, display, text: str, y: int = 0, color=None,
+                 periodMs: int = 100, loop: bool = False) -> None:
+        """
+        Args:
+            display (Display): displej, do jehož framebufferu se kreslí
+            text (str): text (znaky bez piktogramu se vykreslí jako mezera)
+            y (int): horní řádek textu (0–1, text má 5 řádků; spodní řádek
+                patří liště senzorů)
+            color (int | None): jas textu 0–255 (None = display.default_brightness)
+            periodMs (int): doba jednoho kroku v ms
+            loop (bool): po odjetí textu začít znovu
+        """
+        # spodní řádek zůstává liště senzorů (Display.setSensorBar)
+        if not 0 <= y <= display.rows - _GLYPH_ROWS - 1:
+            raise ValueError("Text se na displej nad lištu senzorů nevejde")
+        if color is None:
+            color = display.default_brightness
+        color = max(0, min(255, color))
+        self._display = display
+        self._y = y
+        self._loop = loop
+        self._period = Period(timeout_ms=periodMs)
+
+        columns = self._columns(text)
+        # prázdné okraje: text přijede zprava a celý odjede vlevo
+        width = _COLS + len(columns) + _COLS
+        h = _GLYPH_ROWS
+        self._colsLow = bytearray(width * h)
+        self._colsHigh = bytearray(width * h)
+        for i, column in enumerate(columns):
+            base = (_COLS + i) * h
+            for row in range(h):
+                if column & (1 << row):
+                    self._colsHigh[base + row] = color
+                    self._colsLow[base + h - 1 - row] = color
+        self._viewLow = memoryview(self._colsLow)
+        self._viewHigh = memoryview(self._colsHigh)
+
+        # začátek úseku každého sloupce ve flush bufferu (za bajtem registru)
+        self._dst = [1 + self._runStart(x) for x in range(_COLS)]
+        self._spans = self._blockSpans()
+        self._steps = _COLS + len(columns)
+        self._offset = 0
+        self._render()
+
+    # ---------------------------------------------------------
+    # Sestavení bitmapy
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _columns(text: str) -> list:
+        """Vrátí sloupce textu v pořadí čtení (bit řádku = řádek)."""
+        columns = []
+        for ch in text:
+            rows = PICTOGRAMS.get(ch) or PICTOGRAMS.get(ch.upper())
+            if rows is None or not any(rows):
+                columns.extend([0] * (_SPACE_WIDTH + _SPACING))
+                continue
+            glyph = []
+            for bit in range(4, -1, -1):
+                column = 0
+                for row in range(_GLYPH_ROWS):
+                    if rows[row] & (1 << bit):
+                        column |= 1 << row
+                glyph.append(column)
+            # oříznutí prázdných sloupců (proporcionální písmo)
+            while not glyph[0]:
+                glyph.pop(0)
+            while not glyph[-1]:
+                glyph.pop()
+            columns.extend(glyph)
+            columns.extend([0] * _SPACING)
+        return columns
+
+    def _runStart(self, x: int) -> int:
+        """Vrátí index framebufferu prvního bajtu sloupce x v řádcích textu."""
+        pixelIndex = self._display._pixelIndex
+        if x > 8:
+            return pixelIndex(x, self._y)
+        return pixelIndex(x, self._y + _GLYPH_ROWS - 1)
+
+    def _blockSpans(self) -> tuple:
+        """Úseky framebufferu, které posuv mění (pro částečné překreslení)."""
+        spans = {}
+        for x in range(_COLS):
+            start = self._runStart(x)
+            block = start >> 4
+            lo = start & 0x0F
+            hi = lo + _GLYPH_ROWS - 1
+            if block in spans:
+                lo = min(lo, spans[block][0])
+                hi = max(hi, spans[block][1])
+            spans[block] = (lo, hi)
+        return tuple((block, lo, hi) for block, (lo, hi) in sorted(spans.items()))
+
+    # ---------------------------------------------------------
+    # Posuv
+    # ---------------------------------------------------------
+
+    def _render(self) -> None:
+        """Zkopíruje viditelné sloupce do framebufferu."""
+        display = self._display
+        fb = display._flushbuf
+        h = _GLYPH_ROWS
+        dst = self._dst
+        for x in range(_COLS):
+            src = (self._offset + 16 - x) * h
+            view = self._viewHigh if x > 8 else self._viewLow
+            start = dst[x]
+            fb[start:start + h] = view[src:src + h]
+        display._markSpans(self._spans)
+
+    def step(self) -> None:
+        """Posune text o jeden sloupec doleva a vykreslí ho (bez flush)."""
+        if self._offset >= self._steps:
+            if not self._loop:
+                return
+            self._offset = 0
+        else:
+            self._offset += 1
+        self._render()
+
+    def update(self) -> bool:
+        """
+        Posune text, pokud uplynula perioda kroku.
+
+        Returns:
+            True, pokud se text posunul.
+        """
+        if self.done() or not self._period.ready():
+            return False
+        self.step()
+        return True
+
+    def done(self) -> bool:
+        """Vrací True, pokud text (bez opakování) celý odjel z displeje."""
+        return not self._loop and self._offset >= self._steps
+
+    def reset(self) -> None:
+        """Vrátí text na začátek."""
+        self._offset = 0
+        self._period.restart()
+        self._render()
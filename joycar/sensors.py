@@ -2,19 +2,62 @@
 sensors.py – čtení senzorů JoyCar robota přes PCF8574.
 
 Tento modul poskytuje třídu Sensors, která:
-- periodicky čte data z PCF8574,
+- periodicky čte data z PCF8574 (perioda se může řídit rychlostí robota),
+- nebo (režim přerušení) čte PCF8574 jen když jeho výstup INT hlásí změnu,
 - interpretuje jednotlivé bity jako senzory,
-- předává stav senzorů metodě Display.senzors().
+- dekóduje stav čáry a překážek jediným pohledem do předpočítané tabulky,
+- předává stav senzorů liště senzorů na displeji (bez přenosu po sběrnici),
+- hlásí změny senzorů odběratelům (callbacky) a jako masky událostí,
+- uchovává historii čtení s odrušením, hlasováním a časy změn (SensorHistory).
 
 POZOR:
-    Display.senzors() pouze zapisuje do bufferu displeje.
-    Aby se změny skutečně zobrazily, je nutné pravidelně volat:
+    Sensors jen zaznamená stav lišty senzorů (Display.setSensorBar).
+    Vykreslení a odeslání na displej provádí display.update()
+    podle vlastního plánu snímků – typicky v hlavní smyčce robota
+    (JoyCarRobot.update to dělá sám).
 
-        display.updatePixels()
+Režim přerušení:
+    PCF8574 stáhne výstup INT do nuly, jakmile se některý vstup změní,
+    a uvolní ho při dalším čtení. Se zadaným intPin čte update() expander
+    jen při INT v nule (reakce do jednoho průchodu smyčkou). Pomalé
+    záložní čtení (fallbackMs) zůstává pro případ ztraceného přerušení.
 
-    typicky v hlavní smyčce robota.
+        sensors = Sensors(pcf8574, intPin=board.P1)
+
+Adaptivní perioda čtení:
+    Perioda se přizpůsobí zadané rychlosti tak, aby robot mezi dvěma
+    čteními neujel víc než maxTravelM; stojící robot čte jen každých maxMs.
+
+        sensors.setAdaptivePolling(wheels.commandedSpeed, maxTravelM=0.01)
+        sensors.pollPeriodMs(), sensors.readRate(), sensors.missedDeadlines()
+
+Události (změny senzorů):
+    def onObstacle(bit, active, timeMs):
+        ...
+    sensors.subscribe(Sensors.ObstacleLeft | Sensors.ObstacleRight, onObstacle,
+                      edge=Sensors.ACTIVATED)
+
+    # nebo bez callbacků – masky změn od posledního vyzvednutí
+    if sensors.takeActivated(Sensors.LineMiddle):
+        ...
+
+Dekódovaný stav (Sensors.DECODE, jeden záznam pro každou kombinaci 7 bitů):
+    if sensors.isLineLost():
+        ...
+    turn = sensors.linePosition()       # -2 (čára vlevo) … +2 (čára vpravo)
+    if sensors.obstacleSide() & Sensors.ObstacleLeft:
+        ...
+
+Historie čtení (pevná velikost, viz joycar.history):
+    sensors.debouncedActive(Sensors.ObstacleLeft)     # 3 shodná čtení
+    sensors.majorityActive(Sensors.LineMiddle, 3, 5)  # 3 z posledních 5
+    sensors.msSinceActive(Sensors.LineAll)            # jak dávno byla vidět čára
 """
 
+from array import array
+from adafruit_ticks import ticks_ms
+from digitalio import DigitalInOut, Pull
+from joycar.history import SensorHistory, SET_BITS
 from joycar.pcf8574 import PCF8574
 from utils.period import Period
 from joycar.display import display
@@ -34,12 +77,88 @@ class Sensors:
     # maska pro invertování čárových senzorů
     LineAll = 0x1C
 
-    def __init__(self, pcf8574: PCF8574) -> None:
+    # pole záznamu v tabulce DECODE
+    DecodePosition     = 0x0007   # pozice čáry + 2 (0 = úplně vlevo … 4 = úplně vpravo)
+    DecodeLost         = 0x0008   # žádný čárový senzor nevidí čáru
+    DecodeIntersection = 0x0010   # křižovatka (levý i pravý senzor na čáře)
+    # 0x0020 / 0x0040 = aktivní překážka vlevo / vpravo (stejné bity jako ObstacleLeft/Right)
+    DecodePatternShift = 7        # 5 bitů: pixely displeje (překážka L, L, M, P, překážka P)
+
+    # hrany pro subscribe(): senzor se aktivoval / deaktivoval / obojí
+    ACTIVATED = 0x01
+    DEACTIVATED = 0x02
+    BOTH = ACTIVATED | DEACTIVATED
+
+    # perioda čtení bez přerušení a záložní perioda v režimu přerušení (ms)
+    POLL_MS = 50
+    FALLBACK_MS = 500
+
+    def __init__(self, pcf8574: PCF8574, intPin=None, fallbackMs: int = FALLBACK_MS,
+                 historySize: int = 16, debounceCount: int = 3,
+                 showOnDisplay: bool = True) -> None:
+        """
+        Args:
+            pcf8574 (PCF8574): I/O expander se senzory
+            intPin: pin připojený na INT expanderu, nebo hotový objekt
+                    s atributem value (DigitalInOut) či count (countio.Counter);
+                    None = pravidelné čtení každých POLL_MS
+            fallbackMs (int): záložní perioda čtení v režimu přerušení
+            historySize (int): počet uchovávaných čtení
+            debounceCount (int): počet shodných čtení pro odrušený stav
+            showOnDisplay (bool): zobrazovat stav na liště displeje
+                    (False = displej se kvůli senzorům vůbec nevytvoří)
+        """
         self._pcf8574 = pcf8574
-        self._periodRead = Period(timeout_ms=50)
+        self._showSensors = showOnDisplay
+        self._int = None
+        self._intIsCounter = False
+        self._fallbackMs = fallbackMs
+        if intPin is None:
+            self._periodRead = Period(timeout_ms=Sensors.POLL_MS)
+        else:
+            self._setupInterrupt(intPin)
+            self._periodRead = Period(timeout_ms=fallbackMs)
         self._data = -1
+        self._state = 0
+
+        # odběratelé po bitech: bit → seznam (callback, hrany)
+        self._subscribers = [[] for _ in range(8)]
+        self._subscribedMask = 0
+        self._activated = 0
+        self._deactivated = 0
+        self._changeMs = 0
+
+        self.history = SensorHistory(historySize, debounceCount)
+
+        # adaptivní perioda čtení (viz setAdaptivePolling)
+        self._speedSource = None
+        self._maxTravelM = 0.01
+        self._minPeriodMs = 5
+        self._maxPeriodMs = 200
+        self._missed = 0
+
         self.updateSensorData()
 
+    def _setupInterrupt(self, intPin) -> None:
+        """Připraví vstup INT (aktivní v nule, open-drain → pull-up)."""
+        if hasattr(intPin, "count"):
+            self._int = intPin
+            self._intIsCounter = True
+        elif hasattr(intPin, "value"):
+            self._int = intPin
+        else:
+            self._int = DigitalInOut(intPin)
+            self._int.switch_to_input(pull=Pull.UP)
+
+    def _interruptPending(self) -> bool:
+        """Vrací True, pokud INT hlásí změnu vstupů."""
+        if self._intIsCounter:
+            if self._int.count == 0:
+                return False
+            self._int.count = 0
+            return True
+        return not self._int.value
+
     # ---------------------------------------------------------
     # Čtení dat
     # ---------------------------------------------------------
@@ -48,42 +167,149 @@ class Sensors:
         """
         Přečte data ze senzorů a aktualizuje stav.
 
-        Pokud se stav změnil, zavolá Display.senzors().
+        Pokud se stav změnil (a zobrazování je zapnuté), předá vzor liště
+        senzorů přes display.setSensorBar(); vykreslí ji až display.update().
         """
+        self._process(self._pcf8574.read())
+
+    async def updateSensorDataAsync(self) -> None:
+        """Jako updateSensorData(), ale na sběrnici čeká asynchronně."""
+        self._process(await self._pcf8574.readAsync())
+
+    def _process(self, raw: int) -> None:
+        """Zpracuje surový bajt z PCF8574 (uloží stav, při změně zobrazí)."""
         self._dataPrev = self._data
-        raw = self._pcf8574.read()
 
         # invertování čárových senzorů (0 = aktivní)
         self._data = raw ^ Sensors.LineAll
+        self.history.append(self._data, ticks_ms())
 
         if self._data != self._dataPrev:
-            self._showOnDisplay()
+            self._state = Sensors.DECODE[self._data & 0x7F]
+            if self._showSensors:
+                self._showOnDisplay()
+            if self._dataPrev >= 0:
+                self._dispatch(self._data, (self._data ^ self._dataPrev) & 0xFF)
+
+    def _dispatch(self, data: int, diff: int) -> None:
+        """
+        Zaznamená a rozešle změny bitů.
+
+        Bit v nule = aktivní senzor, takže 1→0 je aktivace a 0→1 deaktivace.
+        """
+        self._changeMs = ticks_ms()
+        self._activated |= diff & ~data
+        self._deactivated |= diff & data
+
+        if not diff & self._subscribedMask:
+            return
+        for bit in SET_BITS[diff]:
+            active = not (data >> bit) & 1
+            edge = Sensors.ACTIVATED if active else Sensors.DEACTIVATED
+            for callback, edges in self._subscribers[bit]:
+                if edges & edge:
+                    callback(1 << bit, active, self._changeMs)
+
+    # ---------------------------------------------------------
+    # Události
+    # ---------------------------------------------------------
+
+    def subscribe(self, mask: int, callback, edge: int = BOTH) -> None:
+        """
+        Zaregistruje callback pro změny senzorů v masce.
+
+        Callback se volá pro každý změněný bit zvlášť:
+            callback(bit, active, timeMs)
+        kde bit je maska senzoru (např. Sensors.ObstacleLeft), active
+        nový stav a timeMs čas čtení (ticks_ms).
+
+        Args:
+            mask (int): bity senzorů (lze kombinovat operátorem |)
+            edge (int): ACTIVATED, DEACTIVATED nebo BOTH
+        """
+        for bit in SET_BITS[mask & 0xFF]:
+            self._subscribers[bit].append((callback, edge))
+        self._subscribedMask |= mask & 0xFF
+
+    def unsubscribe(self, callback) -> None:
+        """Odebere callback ze všech bitů."""
+        mask = 0
+        for bit in range(8):
+            subscribers = [s for s in self._subscribers[bit] if s[0] != callback]
+            self._subscribers[bit] = subscribers
+            if subscribers:
+                mask |= 1 << bit
+        self._subscribedMask = mask
+
+    def takeActivated(self, mask: int) -> int:
+        """Vrátí bity z masky, které se od posledního vyzvednutí aktivovaly, a smaže je."""
+        bits = self._activated & mask
+        self._activated &= ~mask
+        return bits
+
+    def takeDeactivated(self, mask: int) -> int:
+        """Vrátí bity z masky, které se od posledního vyzvednutí deaktivovaly, a smaže je."""
+        bits = self._deactivated & mask
+        self._deactivated &= ~mask
+        return bits
+
+    def lastChangeMs(self) -> int:
+        """Vrátí čas (ticks_ms) posledního čtení, při kterém se stav změnil."""
+        return self._changeMs
 
     def _showOnDisplay(self) -> None:
         """
-        Předá stav senzorů metodě Display.senzors().
-
-        Display.senzors() pouze zapisuje do bufferu.
-        Pro skutečné vykreslení je nutné volat display.updatePixels().
-        """
-        display.sensors(
-            obstacleLeft   = self.areActive(Sensors.ObstacleLeft),
-            farLeft        = None,
-            left           = self.areActive(Sensors.LineLeft),
-            midleLeft      = None,
-            midle35        = self.areActive(Sensors.LineMiddle),
-            midleRight     = None,
-            right          = self.areActive(Sensors.LineRight),
-            farRight       = None,
-            obstacleRight  = self.areActive(Sensors.ObstacleRight),
-            bh = 9,
-            bl = 1
-        )
+        Předá vzor senzorů liště na displeji.
+
+        Jen zaznamená vzor – vykreslení i odeslání provede display.update().
+        """
+        display.setSensorBar(self._state >> Sensors.DecodePatternShift, 9, 1)
 
     # ---------------------------------------------------------
     # API pro logiku robota
     # ---------------------------------------------------------
 
+    def state(self) -> int:
+        """Vrátí dekódovaný záznam aktuálního stavu (viz Sensors.DECODE)."""
+        return self._state
+
+    def linePosition(self) -> int:
+        """
+        Vrátí odhad polohy čáry vůči středu robota.
+
+        -2 = jen levý senzor, -1 = levý a prostřední, 0 = střed
+        (i při ztrátě čáry a na křižovatce), +1 / +2 obdobně vpravo.
+        """
+        return (self._state & Sensors.DecodePosition) - 2
+
+    def isLineLost(self) -> bool:
+        """Vrací True, pokud žádný čárový senzor nevidí čáru."""
+        return self._state & Sensors.DecodeLost != 0
+
+    def isIntersection(self) -> bool:
+        """Vrací True, pokud levý i pravý senzor vidí čáru (křižovatka)."""
+        return self._state & Sensors.DecodeIntersection != 0
+
+    def obstacleSide(self) -> int:
+        """Vrátí masku aktivních překážek (Sensors.ObstacleLeft | Sensors.ObstacleRight)."""
+        return self._state & (Sensors.ObstacleLeft | Sensors.ObstacleRight)
+
+    def debouncedActive(self, sensor: int) -> bool:
+        """Vrátí True, pokud je senzor aktivní v odrušeném stavu (viz debounceCount)."""
+        return self.history.debounced() & sensor == 0
+
+    def majorityActive(self, sensor: int, n: int, m: int) -> bool:
+        """Vrátí True, pokud byl senzor aktivní alespoň v n z posledních m čtení."""
+        return self.history.countMatching(sensor, 0, m) >= n
+
+    def msSinceActive(self, sensor: int):
+        """Vrátí ms od posledního čtení, kdy byl některý bit senzoru aktivní (None = nikdy)."""
+        return self.history.msSinceLow(sensor)
+
+    def msSinceEdge(self, sensor: int):
+        """Vrátí ms od poslední změny některého bitu senzoru (None = beze změny)."""
+        return self.history.msSinceEdge(sensor)
+
     def getSensorData(self, mask: int) -> int:
         """Vrátí hodnotu bitů podle masky."""
         return self._data & mask
@@ -100,9 +326,135 @@ class Sensors:
         """
         Periodicky aktualizuje stav senzorů.
 
-        POZOR:
-            display.sensors() pouze zapisuje do bufferu.
-            Překreslení provádí display.updatePixels().
+        Změna stavu se na displeji projeví až v display.update().
         """
-        if self._periodRead.isTime():
+        if self._isReadDue():
             self.updateSensorData()
+
+    async def updateAsync(self) -> None:
+        """Asynchronní varianta update() pro asyncio úlohy."""
+        if self._isReadDue():
+            await self.updateSensorDataAsync()
+
+    def _isReadDue(self) -> bool:
+        """
+        Rozhodne, zda je čas číst expander.
+
+        Bez přerušení podle periody, v režimu přerušení při INT v nule
+        nebo po uplynutí záložní periody.
+        """
+        if self._int is not None and self._interruptPending():
+            self._periodRead.restart()
+            return True
+
+        period = self._periodRead
+        if self._speedSource is not None:
+            period.timeout_ms = self._adaptivePeriodMs()
+        # čtení o víc než polovinu periody později = zmeškaný termín
+        late = period.elapsed() * 2 > period.timeout_ms * 3
+        if not period.ready():
+            return False
+
+        if late:
+            self._missed += 1
+        return True
+
+    # ---------------------------------------------------------
+    # Adaptivní perioda čtení
+    # ---------------------------------------------------------
+
+    def setAdaptivePolling(self, speedSource, maxTravelM: float = 0.01,
+                           minMs: int = 5, maxMs: int = 200,
+                           withInterrupt: bool = False) -> None:
+        """
+        Zapne periodu čtení odvozenou od rychlosti robota.
+
+        V režimu přerušení se změny vstupů čtou hned a periodické čtení
+        je jen záložní; adaptivní perioda by vrátila provoz, který má
+        přerušení ušetřit. Proto se v tomto režimu použije, jen pokud
+        o to volající výslovně požádá (withInterrupt=True).
+
+        Args:
+            speedSource: funkce vracející rychlost v m/s (např. Wheels.commandedSpeed),
+                         None vrátí pevnou periodu
+            maxTravelM (float): nejvyšší dráha ujetá mezi dvěma čteními v metrech
+            minMs (int): nejkratší perioda (omezuje zátěž sběrnice)
+            maxMs (int): perioda stojícího robota
+            withInterrupt (bool): zkracovat podle rychlosti i záložní periodu
+                         v režimu přerušení
+        """
+        if self._int is not None and not withInterrupt:
+            speedSource = None
+        self._speedSource = speedSource
+        self._maxTravelM = maxTravelM
+        self._minPeriodMs = minMs
+        self._maxPeriodMs = maxMs
+        if speedSource is None:
+            self._periodRead.timeout_ms = Sensors.POLL_MS if self._int is None else self._fallbackMs
+
+    def _adaptivePeriodMs(self) -> int:
+        """Vrátí periodu, za kterou robot při aktuální rychlosti ujede maxTravelM."""
+        speed = abs(self._speedSource())
+        if speed <= 0:
+            return self._maxPeriodMs
+        periodMs = int(self._maxTravelM * 1000 / speed)
+        return max(self._minPeriodMs, min(self._maxPeriodMs, periodMs))
+
+    def pollPeriodMs(self) -> int:
+        """Vrátí aktuální periodu čtení v ms."""
+        return self._periodRead.timeout_ms
+
+    def readRate(self) -> float:
+        """Vrátí skutečnou frekvenci čtení v Hz (z časů uložených v historii)."""
+        n = self.history.count()
+        if n < 2:
+            return 0.0
+        spanMs = (self.history.timeMs(0) - self.history.timeMs(n - 1)) & 0xFFFF
+        if spanMs == 0:
+            return 0.0
+        return (n - 1) * 1000 / spanMs
+
+    def missedDeadlines(self) -> int:
+        """Vrátí počet čtení, která proběhla o víc než polovinu periody později."""
+        return self._missed
+
+
+def _buildDecodeTable() -> array:
+    """
+    Sestaví tabulku dekódovaných stavů pro všech 128 kombinací 7 bitů
+    (bity po invertování čárových senzorů, 0 = aktivní senzor).
+    """
+    table = array("H", [0] * 128)
+    for data in range(128):
+        obstacleLeft = not data & Sensors.ObstacleLeft
+        obstacleRight = not data & Sensors.ObstacleRight
+        left = not data & Sensors.LineLeft
+        middle = not data & Sensors.LineMiddle
+        right = not data & Sensors.LineRight
+
+        entry = 0
+        if left and right:
+            entry |= Sensors.DecodeIntersection
+            position = 0
+        elif left:
+            position = -1 if middle else -2
+        elif right:
+            position = 1 if middle else 2
+        else:
+            position = 0
+            if not middle:
+                entry |= Sensors.DecodeLost
+        entry |= position + 2
+
+        if obstacleLeft:
+            entry |= Sensors.ObstacleLeft
+        if obstacleRight:
+            entry |= Sensors.ObstacleRight
+
+        pattern = (obstacleLeft << 0) | (left << 1) | (middle << 2) | (right << 3) | (obstacleRight << 4)
+        table[data] = entry | (pattern << Sensors.DecodePatternShift)
+    return table
+
+
+# dekódovací tabulka: index = self._data & 0x7F
+Sensors.DECODE = _buildDecodeTable()
@@ -0,0 +1,200 @@
+"""
+sprites.py – překlad bitmap na indexy framebufferu s LRU cache.
+
+Tento modul poskytuje třídu SpriteCache, která:
+- přeloží bitmapu (řádky jako celá čísla, bit ix = sloupec x0 + ix)
+  na kompaktní pole indexů framebufferu array('B') pro libovolnou pozici,
+- pixely mimo displej při překladu ořízne,
+- přeložené sprity drží v cache s omezenou velikostí (LRU),
+- ke spritu předpočítá i změněné úseky pro částečné překreslení displeje.
+
+Vykreslení spritu je pak jen zápis hodnot na předpočítané indexy –
+stejně rychlé pro libovolnou pozici jako dřívější ikony A/B/C.
+
+Použití (Display ji vytváří sám, viz Display.blit()):
+    cache = SpriteCache(display._pixelIndex, cols=17, rows=7)
+    on, off, spans = cache.get("5", GLYPH_5, x=3, y=1)
+"""
+
+from array import array
+
+# prázdný sprite (celý mimo displej)
+_EMPTY = (array("B"), array("B"), ())
+
+
+def _posKey(x0: int, y0: int, width: int) -> int:
+    """
+    Vrátí klíč pozice a šířky spritu (celé číslo – bez alokace n-tice).
+
+    Stejné řádky bitmapy dávají při jiné šířce jiný sprite, proto je
+    šířka součástí klíče. Sprite smí být částečně mimo displej, y0 tedy
+    může být záporné – posune se o 128, aby si nepůjčovalo od x0.
+    Klíče různých pozic se nepřekrývají pro -128 ≤ y0 < 128 a šířku
+    0–255; jiné hodnoty vyhodí ValueError.
+    """
+    if not (-128 <= y0 < 128 and 0 <= width < 256):
+        raise ValueError("Pozice nebo šířka spritu mimo rozsah klíče")
+    return (x0 * 256 + y0 + 128) * 256 + width
+
+
+class SpriteCache:
+    """
+    LRU cache přeložených spritů.
+
+    Sprite je n-tice (rozsvícené, zhasnuté, úseky):
+        rozsvícené, zhasnuté – array('B') s pozicemi ve flush bufferu displeje
+                               (index framebufferu + 1, tj. za bajtem registru)
+        úseky                – n-tice (blok, lo, hi) pro sledování změn
+
+    Atributy:
+        _entries (dict): Klíč bitmapy → {pozice a šířka: [sprite, poslední použití]}.
+        _capacity (int): Nejvyšší počet uložených spritů.
+    """
+
+    CAPACITY = 48
+
+    def __init__(self, pixelIndex, cols: int = 17, rows: int = 7,
+                 capacity: int = CAPACITY, blockSize: int = 16) -> None:
+        """
+        Args:
+            pixelIndex: funkce (x, y) → index framebufferu
+            cols, rows: rozměr displeje (pro ořezání)
+            capacity (int): nejvyšší počet uložených spritů
+            blockSize (int): velikost bloku pro sledování změn
+        """
+        self._pixelIndex = pixelIndex
+        self._cols = cols
+        self._rows = rows
+        self._capacity = capacity
+        self._blockSize = blockSize
+        self._entries = {}
+        self._count = 0
+        self._clock = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # ---------------------------------------------------------
+    # Překlad
+    # ---------------------------------------------------------
+
+    def _blockSpans(self, indices) -> tuple:
+        """Vrátí změněné úseky po blocích jako n-tice (blok, lo, hi)."""
+        size = self._blockSize
+        spans = {}
+        for idx in indices:
+            block = idx // size
+            offset = idx % size
+            lo, hi = spans.get(block, (offset, offset))
+            spans[block] = (min(lo, offset), max(hi, offset))
+        return tuple((block, lo, hi) for block, (lo, hi) in sorted(spans.items()))
+
+    def compile(self, bitmap, x0: int, y0: int, width: int) -> tuple:
+        """Přeloží bitmapu na pozici (x0, y0); pixely mimo displej vynechá."""
+        on = []
+        off = []
+        for iy, line in enumerate(bitmap):
+            y = y0 + iy
+            if not 0 <= y < self._rows:
+                continue
+            for ix in range(width):
+                x = x0 + ix
+                if not 0 <= x < self._cols:
+                    continue
+                idx = self._pixelIndex(x, y)
+                if line & (1 << ix):
+                    on.append(idx)
+                else:
+                    off.append(idx)
+        spans = self._blockSpans(on + off)
+        return (array("B", [i + 1 for i in on]), array("B", [i + 1 for i in off]), spans)
+
+    # ---------------------------------------------------------
+    # Cache
+    # ---------------------------------------------------------
+
+    def get(self, key, bitmap, x0: int, y0: int, width: int = 5) -> tuple:
+        """
+        Vrátí přeložený sprite bitmapy na pozici (x0, y0).
+
+        Args:
+            key: hashovatelný klíč bitmapy (název glyfu, n-tice řádků …)
+            bitmap: řádky bitmapy (bit ix = sloupec x0 + ix)
+            width (int): šířka bitmapy v pixelech
+        """
+        if (x0 >= self._cols or y0 >= self._rows or x0 + width <= 0
+                or y0 + len(bitmap) <= 0):
+            return _EMPTY
+
+        self._clock += 1
+        pos = _posKey(x0, y0, width)
+        byPos = self._entries.get(key)
+        if byPos is not None:
+            entry = byPos.get(pos)
+            if entry is not None:
+                entry[1] = self._clock
+                self._hits += 1
+                return entry[0]
+        else:
+            byPos = {}
+            self._entries[key] = byPos
+
+        self._misses += 1
+        if self._count >= self._capacity:
+            self._evictOldest()
+            # vyřazení mohlo smazat i slovník této bitmapy
+            byPos = self._entries.setdefault(key, byPos)
+        sprite = self.compile(bitmap, x0, y0, width)
+        byPos[pos] = [sprite, self._clock]
+        self._count += 1
+        return sprite
+
+    def _evictOldest(self) -> None:
+        """Vyřadí nejdéle nepoužitý sprite."""
+        oldestKey = None
+        oldestPos = None
+        oldest = None
+        for key, byPos in self._entries.items():
+            for pos, entry in byPos.items():
+                if oldest is None or entry[1] < oldest:
+                    oldest = entry[1]
+                    oldestKey = key
+                    oldestPos = pos
+        if oldestKey is None:
+            return
+        byPos = self._entries[oldestKey]
+        del byPos[oldestPos]
+        if not byPos:
+            del self._entries[oldestKey]
+        self._count -= 1
+        self._evictions += 1
+
+    def clear(self) -> None:
+        """Smaže všechny přeložené sprity."""
+        self._entries = {}
+        self._count = 0
+
+    # ---------------------------------------------------------
+    # Statistiky
+    # ---------------------------------------------------------
+
+    def count(self) -> int:
+        """Vrátí počet uložených spritů."""
+        return self._count
+
+    def contains(self, key, x0: int, y0: int, width: int = 5) -> bool:
+        """Vrací True, pokud je sprite bitmapy na dané pozici (a šířce) v cache."""
+        byPos = self._entries.get(key)
+        return byPos is not None and _posKey(x0, y0, width) in byPos
+
+    def hits(self) -> int:
+        """Vrátí počet nalezení v cache."""
+        return self._hits
+
+    def misses(self) -> int:
+        """Vrátí počet překladů (sprite v cache nebyl)."""
+        return self._misses
+
+    def evictions(self) -> int:
+        """Vrátí počet spritů vyřazených kvůli kapacitě."""
+        return self._evictions
@@ -0,0 +1,301 @@
+"""
+trace.py – záznam a přehrávání I2C provozu.
+
+Tento modul poskytuje:
+- BusTrace – předalokovaný kruhový buffer s kompaktními binárními záznamy,
+- TracedBus – obal busio.I2C, který každý přenos zapíše do BusTrace,
+- TraceReplayer – přehrání záznamu do fake busio (offline reprodukce jízdy).
+
+Formát záznamu (little endian):
+    dt      u16   čas od předchozího záznamu v µs (nasycuje se na 65535)
+    addr    u8    I2C adresa
+    flags   u8    FLAG_READ (čtení), FLAG_RESTART (čtení po zápisu bez STOP)
+    length  u16   skutečná délka přenosu
+    payload       prvních min(length, maxPayload) bajtů dat
+
+Obal pracuje na úrovni busio, takže ho lze vložit pod joycar.i2c.I2C
+i pod CuteBotPro:
+    trace = BusTrace(4096)
+    i2c = I2C(TracedBus(pico_i2c, trace))
+    bot = CuteBotPro(i2c=TracedBus(busio_i2c, trace))
+    ...
+    trace.save("/trace.bin")
+
+Přehrání (na PC, s fake busio):
+    records = BusTrace.parse(open("trace.bin", "rb").read())
+    TraceReplayer(records).load(fake_i2c)
+"""
+
+from time import monotonic_ns
+
+# příznaky záznamu
+FLAG_READ = 0x01
+FLAG_RESTART = 0x02
+
+_HEADER = 6
+_MAGIC = b"JCT1"
+_DT_MAX = 0xFFFF
+
+
+class BusTrace:
+    """
+    Kruhový buffer binárních záznamů I2C přenosů s pevnou velikostí.
+
+    Když dojde místo, nejstarší záznamy se zahodí.
+    Zápis záznamu nic nealokuje.
+
+    Atributy:
+        _buf (bytearray): Kruhový buffer.
+        _head (int): Pozice, kam se zapíše další bajt.
+        _tail (int): Začátek nejstaršího záznamu.
+        _used (int): Počet obsazených bajtů.
+        _maxPayload (int): Maximální počet uložených bajtů dat jednoho přenosu.
+    """
+
+    def __init__(self, size: int = 4096, maxPayload: int = 32) -> None:
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._header = bytearray(_HEADER)
+        self._maxPayload = min(maxPayload, size - _HEADER)
+        self._head = 0
+        self._tail = 0
+        self._used = 0
+        self._count = 0
+        self._dropped = 0
+        self._last = monotonic_ns()
+
+    # ---------------------------------------------------------
+    # Zápis
+    # ---------------------------------------------------------
+
+    def _put(self, data, start: int, n: int) -> None:
+        """
+        Zapíše n bajtů data[start:start + n] na pozici head (s přetečením přes konec).
+
+        Celý buffer, který se vejde před konec, se zkopíruje jedním přiřazením
+        do _view; jinak se kopíruje po bajtech – řez zdroje by alokoval.
+        """
+        buf = self._buf
+        size = len(buf)
+        head = self._head
+        if start == 0 and n == len(data) and head + n <= size:
+            self._view[head:head + n] = data
+            head += n
+        else:
+            for i in range(start, start + n):
+                buf[head] = data[i]
+                head += 1
+                if head == size:
+                    head = 0
+        self._head = head % size
+        self._used += n
+
+    def _dropOldest(self) -> None:
+        """Zahodí nejstarší záznam."""
+        buf = self._buf
+        size = len(buf)
+        tail = self._tail
+        length = buf[(tail + 4) % size] | (buf[(tail + 5) % size] << 8)
+        n = _HEADER + min(length, self._maxPayload)
+        self._tail = (tail + n) % size
+        self._used -= n
+        self._count -= 1
+        self._dropped += 1
+
+    def record(self, addr: int, flags: int, data, start: int = 0, end=None) -> None:
+        """
+        Zapíše jeden přenos do bufferu.
+
+        Přenesená data jsou data[start:end] (start/end jako v busio);
+        kopírují se přímo z bufferu volajícího bez vytváření řezů.
+        """
+        now = monotonic_ns()
+        dt = (now - self._last) // 1000
+        self._last = now
+        if dt > _DT_MAX:
+            dt = _DT_MAX
+
+        if end is None:
+            end = len(data)
+        length = end - start
+        stored = min(length, self._maxPayload)
+        n = _HEADER + stored
+        while len(self._buf) - self._used < n:
+            self._dropOldest()
+
+        header = self._header
+        header[0] = dt & 0xFF
+        header[1] = dt >> 8
+        header[2] = addr & 0xFF
+        header[3] = flags
+        header[4] = length & 0xFF
+        header[5] = (length >> 8) & 0xFF
+        self._put(header, 0, _HEADER)
+        if stored:
+            self._put(data, start, stored)
+        self._count += 1
+
+    def clear(self) -> None:
+        """Smaže všechny záznamy."""
+        self._head = 0
+        self._tail = 0
+        self._used = 0
+        self._count = 0
+        self._dropped = 0
+        self._last = monotonic_ns()
+
+    # ---------------------------------------------------------
+    # Výstup
+    # ---------------------------------------------------------
+
+    def count(self) -> int:
+        """Vrátí počet uložených záznamů."""
+        return self._count
+
+    def dropped(self) -> int:
+        """Vrátí počet záznamů zahozených kvůli nedostatku místa."""
+        return self._dropped
+
+    def dump(self, stream) -> None:
+        """
+        Zapíše záznamy (od nejstaršího) do proudu – souboru nebo sériové linky.
+
+        Na začátku je hlavička: "JCT1", maxPayload (u8), počet záznamů (u16).
+        """
+        stream.write(_MAGIC)
+        stream.write(bytes([self._maxPayload, self._count & 0xFF, (self._count >> 8) & 0xFF]))
+        size = len(self._buf)
+        tail = self._tail
+        first = min(self._used, size - tail)
+        stream.write(self._view[tail:tail + first])
+        if first < self._used:
+            stream.write(self._view[0:self._used - first])
+
+    def save(self, path: str) -> None:
+        """Uloží záznamy do souboru (na CircuitPythonu musí být flash zapisovatelná)."""
+        with open(path, "wb") as f:
+            self.dump(f)
+
+    @staticmethod
+    def parse(data) -> list:
+        """
+        Rozparsuje výstup dump() na seznam záznamů
+        (dtUs, addr, flags, length, payload).
+        """
+        if bytes(data[0:4]) != _MAGIC:
+            raise ValueError("Neplatný formát I2C záznamu")
+        maxPayload = data[4]
+        count = data[5] | (data[6] << 8)
+        records = []
+        pos = 7
+        for _ in range(count):
+            dt = data[pos] | (data[pos + 1] << 8)
+            addr = data[pos + 2]
+            flags = data[pos + 3]
+            length = data[pos + 4] | (data[pos + 5] << 8)
+            stored = min(length, maxPayload)
+            pos += _HEADER
+            records.append((dt, addr, flags, length, bytes(data[pos:pos + stored])))
+            pos += stored
+        return records
+
+
+class TracedBus:
+    """
+    Obal busio.I2C, který každý přenos zapíše do BusTrace.
+
+    Poskytuje stejné API jako busio.I2C (try_lock, unlock, scan, writeto,
+    readfrom_into, writeto_then_readfrom), takže ho lze předat
+    joycar.i2c.I2C i CuteBotPro místo skutečné sběrnice.
+    """
+
+    def __init__(self, bus, trace: BusTrace) -> None:
+        self._bus = bus
+        self._trace = trace
+
+    def try_lock(self) -> bool:
+        return self._bus.try_lock()
+
+    def unlock(self) -> None:
+        self._bus.unlock()
+
+    def scan(self) -> list:
+        return self._bus.scan()
+
+    # Zaznamenává se jen skutečně přenesená část bufferu (start/end jako
+    # v busio) – zbytek bufferu volajícího na sběrnici nešel.
+
+    def writeto(self, addr: int, buf, *, start: int = 0, end=None) -> None:
+        if end is None:
+            end = len(buf)
+        self._bus.writeto(addr, buf, start=start, end=end)
+        self._trace.record(addr, 0, buf, start, end)
+
+    def readfrom_into(self, addr: int, buf, *, start: int = 0, end=None) -> None:
+        if end is None:
+            end = len(buf)
+        self._bus.readfrom_into(addr, buf, start=start, end=end)
+        self._trace.record(addr, FLAG_READ, buf, start, end)
+
+    def writeto_then_readfrom(self, addr: int, out_buf, in_buf, *, out_start: int = 0,
+                              out_end=None, in_start: int = 0, in_end=None) -> None:
+        if out_end is None:
+            out_end = len(out_buf)
+        if in_end is None:
+            in_end = len(in_buf)
+        self._bus.writeto_then_readfrom(addr, out_buf, in_buf, out_start=out_start,
+                                        out_end=out_end, in_start=in_start, in_end=in_end)
+        self._trace.record(addr, 0, out_buf, out_start, out_end)
+        self._trace.record(addr, FLAG_READ | FLAG_RESTART, in_buf, in_start, in_end)
+
+
+class TraceReplayer:
+    """
+    Přehraje záznam do fake busio.I2C.
+
+    Data všech čtení se vloží do fronty queue_read(), takže ovladače dostanou
+    stejné odpovědi jako při skutečné jízdě. Po běhu lze zápisy porovnat
+    se záznamem metodou verify().
+
+    U přenosů delších než maxPayload jsou chybějící bajty nulové.
+    """
+
+    def __init__(self, records: list) -> None:
+        self._records = records
+
+    def reads(self) -> list:
+        """Vrátí data všech čtení (doplněná nulami na skutečnou délku)."""
+        out = []
+        for _, _, flags, length, payload in self._records:
+            if flags & FLAG_READ:
+                out.append(payload + bytes(length - len(payload)))
+        return out
+
+    def writes(self) -> list:
+        """Vrátí všechny zápisy jako (addr, payload)."""
+        return [(addr, payload) for _, addr, flags, _, payload in self._records
+                if not flags & FLAG_READ]
+
+    def load(self, fake_i2c) -> int:
+        """Vloží data čtení do fronty fake sběrnice. Vrátí počet čtení."""
+        reads = self.reads()
+        for data in reads:
+            fake_i2c.queue_read(data)
+        return len(reads)
+
+    def verify(self, fake_i2c) -> int:
+        """
+        Porovná zápisy fake sběrnice (write_history) se záznamem.
+
+        Returns:
+            Index prvního rozdílného zápisu, nebo -1 pokud se shodují.
+        """
+        expected = self.writes()
+        actual = fake_i2c.write_history
+        for i in range(max(len(expected), len(actual))):
+            if i >= len(expected) or i >= len(actual):
+                return i
+            addr, payload = expected[i]
+            if actual[i][0] != addr or actual[i][1][0:len(payload)] != payload:
+                return i
+        return -1
@@ -27,7 +27,8 @@ class Wheel:
     # (uživatel si ji může později nakalibrovat)
     _PWM_PER_RPS = 200
 
-    def __init__(self, side: DirectionEnum, pca9633: PCA9633, diameter: float) -> None:
+    def __init__(self, side: DirectionEnum, pca9633: PCA9633, diameter: float,
+                 autoCommit: bool = True) -> None:
         """
         Inicializuje motor podle jeho strany (levý/pravý) a průměru kola.
 
@@ -35,9 +36,12 @@ class Wheel:
             side (DirectionEnum): strana motoru
             pca9633 (PCA9633): driver motoru
             diameter (float): průměr kola v metrech
+            autoCommit (bool): pokud False, kolo PWM jen připraví a odeslání
+                               (PCA9633.commitPwm) provede nadřazený objekt (Wheels)
         """
         self._side = side
         self._pca9633 = pca9633
+        self._autoCommit = autoCommit
         self._timer = Timer(startTimer=False)
         self._targetPwm = 0
         self._lastAppliedPwm = 0
@@ -93,6 +97,10 @@ class Wheel:
         rps = vMps / self._circumference
         self.setAngularSpeed(rps)
 
+    def commandedSpeed(self) -> float:
+        """Vrátí požadovanou obvodovou rychlost kola v m/s (odhad z cílového PWM)."""
+        return self._targetPwm / self._PWM_PER_RPS * self._circumference
+
     # ---------------------------------------------------------
     # Interní pomocné metody
     # ---------------------------------------------------------
@@ -123,13 +131,15 @@ class Wheel:
         return (self._lastAppliedPwm * self._targetPwm) < 0
 
     def _applyPwmRaw(self, pwm: int) -> None:
-        """Zapíše PWM přímo do driveru PCA9633."""
+        """Zapíše PWM do driveru PCA9633 (při autoCommit=False jen připraví)."""
         if pwm >= 0:
-            self._pca9633.writeTwoRegisters(self._regPwmBack, 0,
-                                            self._regPwmForw, pwm)
+            self._pca9633.setPwm(self._regPwmBack, 0)
+            self._pca9633.setPwm(self._regPwmForw, pwm)
         else:
-            self._pca9633.writeTwoRegisters(self._regPwmForw, 0,
-                                            self._regPwmBack, -pwm)
+            self._pca9633.setPwm(self._regPwmForw, 0)
+            self._pca9633.setPwm(self._regPwmBack, -pwm)
+        if self._autoCommit:
+            self._pca9633.commitPwm()
         self._lastAppliedPwm = pwm
 
     def _applyPwmSafely(self) -> None:
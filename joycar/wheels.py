@@ -6,6 +6,9 @@ Tento modul poskytuje třídu Wheels, která:
 - inicializuje PCA9633,
 - umožňuje řízení obou motorů současně,
 - podporuje diferenciální kinematiku (v, omega).
+
+Obě kola pouze připravují PWM hodnoty, Wheels je pak odešle jediným
+5bajtovým zápisem (PCA9633.commitPwm), takže se oba motory změní naráz.
 """
 
 from joycar import wheel
@@ -33,8 +36,8 @@ class Wheels:
         self._halfWheelBase = wheelBase / 2
 
         self._wheels = {
-            DirectionEnum.LEFT: Wheel(DirectionEnum.LEFT, pca9633, diameter),
-            DirectionEnum.RIGHT: Wheel(DirectionEnum.RIGHT, pca9633, diameter),
+            DirectionEnum.LEFT: Wheel(DirectionEnum.LEFT, pca9633, diameter, autoCommit=False),
+            DirectionEnum.RIGHT: Wheel(DirectionEnum.RIGHT, pca9633, diameter, autoCommit=False),
         }
 
         self._initMotorDriver()
@@ -48,11 +51,12 @@ class Wheels:
         return self._wheels[DirectionEnum.RIGHT]
 
     def _initMotorDriver(self) -> None:
-        """Inicializuje PCA9633 driver."""
+        """Inicializuje PCA9633 driver (a zastaví oba motory)."""
         self._pca9633.writeTwoRegisters(
             PCA9633_registers.MODE1, 0x00,
             PCA9633_registers.LEDOUT, 0xAA
         )
+        self._pca9633.writePwm(0, 0, 0, 0)
 
     # ---------------------------------------------------------
     # Diferenciální kinematika
@@ -73,6 +77,7 @@ class Wheels:
         # aplikace rychlostí
         self.left.setLinearSpeed(vLeft)
         self.right.setLinearSpeed(vRight)
+        self._pca9633.commitPwm()
 
     # ---------------------------------------------------------
 
@@ -89,21 +94,45 @@ class Wheels:
                 log.error(f"Chyba při zastavování kola {side}: {e}")
                 errors.append(e)
 
+        try:
+            self._pca9633.commitPwm()
+        except Exception as e:
+            log.error(f"Chyba při odeslání PWM: {e}")
+            errors.append(e)
+
         if errors:
             # propagujeme první chybu (nebo můžeš vytvořit vlastní)
             raise errors[0]
 
+    def commandedSpeed(self) -> float:
+        """Vrátí největší požadovanou rychlost kol v m/s (bez znaménka)."""
+        return max(abs(self.left.commandedSpeed()), abs(self.right.commandedSpeed()))
+
     def setSpeed(self, speeds: dict) -> None:
         for side, wheel in self._wheels.items():
             wheel.setSpeed(speeds[side])
+        self._pca9633.commitPwm()
 
     def stop(self) -> None:
         """Zastaví oba motory."""
         for wheel in self._wheels.values():
             wheel.stop()
+        self._pca9633.commitPwm()
 
     def update(self) -> None:
         """Periodicky aktualizuje oba motory."""
         for wheel in self._wheels.values():
             wheel.update()
+        self._pca9633.commitPwm()
+
+    async def updateAsync(self) -> None:
+        """
+        Asynchronní varianta update().
+
+        Kola jen připraví PWM, rámec se odešle pod asynchronním zámkem,
+        takže čekání na sběrnici nepřipraví o čas ostatní úlohy.
+        """
+        for wheel in self._wheels.values():
+            wheel.update()
+        await self._pca9633.commitPwmAsync()
 
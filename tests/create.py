@@ -1,4 +1,4 @@
-"""create.py – pomocná funkce pro vytváření Wheels objektu v testech."""
+"""create.py – pomocné funkce pro vytváření objektů robota v testech."""
 
 from joycar.i2c import I2C
 from joycar.pca9633 import PCA9633
@@ -18,4 +18,9 @@ def createSensors(hw_i2c):
 
 def createRobot(hw_i2c):
     from joycar.robot import JoyCarRobot
-    return JoyCarRobot(I2C(hw_i2c), wheelDiameter=0.06, wheelBase=0.12)
\ No newline at end of file
+    return JoyCarRobot(I2C(hw_i2c), wheelDiameter=0.06, wheelBase=0.12)
+
+def createDisplay(hw_i2c):
+    """Vytvoří samostatný Display na fake sběrnici (ne sdílenou instanci)."""
+    from joycar.display import Display
+    return Display(hw_i2c)
@@ -0,0 +1,133 @@
+"""
+Testy asynchronní vrstvy ovladačů (asyncio).
+
+Ověřujeme, že:
+    - asynchronní zámek při obsazené sběrnici předává řízení jiným úlohám,
+    - asynchronní čtení senzorů a zápis motorů funguje stejně jako blokující,
+    - sada úloh joycar.aio běží souběžně a po zrušení robota zastaví,
+    - úloha senzorů respektuje režim přerušení (bez změn vstupů nečte).
+"""
+
+import asyncio
+import unittest
+import board
+import digitalio
+from adafruit_ticks import advance_ticks
+from busio import I2C as FakeI2C
+from joycar import I2C, Sensors
+from joycar.robot import JoyCarRobot
+from joycar.aio import run
+from _fake.hardware.i2c_devices import PCA9633Model, PCF8574Model
+from tests.create import createSensors, createWheels
+
+
+class BusyI2C(FakeI2C):
+    """FakeI2C, jehož zámek je prvních `busy` pokusů obsazený."""
+
+    def __init__(self, busy):
+        super().__init__()
+        self.busy = busy
+
+    def try_lock(self):
+        if self.busy > 0:
+            self.busy -= 1
+            return False
+        return True
+
+
+class TestAsync(unittest.TestCase):
+    """Testy asynchronních metod a úloh."""
+
+    def tearDown(self):
+        digitalio.reset()
+
+    def test_async_lock_yields(self):
+        """Během čekání na zámek běží jiná úloha."""
+        hw = BusyI2C(busy=3)
+        i2c = I2C(hw)
+        steps = []
+
+        async def other():
+            for _ in range(3):
+                steps.append("other")
+                await asyncio.sleep(0)
+
+        async def locker():
+            async with i2c:
+                steps.append("locked")
+
+        async def main():
+            await asyncio.gather(locker(), other())
+
+        asyncio.run(main())
+        self.assertLess(steps.index("other"), steps.index("locked"))
+        self.assertEqual(hw.busy, 0)
+
+    def test_sensors_and_wheels_async(self):
+        """Asynchronní čtení senzorů a zápis motorů."""
+        hw = FakeI2C()
+        pca = hw.attach(PCA9633Model())
+        pcf = hw.attach(PCF8574Model(pins=0xFF & ~Sensors.ObstacleRight))
+        sensors = createSensors(hw)
+        wheels = createWheels(hw)
+
+        async def main():
+            await sensors.updateSensorDataAsync()
+            wheels.left.setSpeed(100)
+            wheels.right.setSpeed(100)
+            await wheels.updateAsync()
+
+        asyncio.run(main())
+        self.assertTrue(sensors.areActive(Sensors.ObstacleRight))
+        self.assertGreater(pca.pwm(1), 0)
+        self.assertGreater(pca.pwm(3), 0)
+        self.assertGreater(pcf.reads, 1)
+
+    def test_task_set(self):
+        """Úlohy běží souběžně, po zrušení se robot zastaví."""
+        hw = FakeI2C()
+        pca = hw.attach(PCA9633Model())
+        pcf = hw.attach(PCF8574Model())
+        robot = JoyCarRobot(I2C(hw), wheelDiameter=0.06, wheelBase=0.12)
+        robot.wheels.setSpeed({"left": 100, "right": 100})
+        reads = pcf.reads
+
+        # bez přerušení se čte podle periody odvozené od rychlosti (~106 ms)
+        asyncio.run(_runFor(robot, 350))
+        self.assertGreaterEqual(pcf.reads - reads, 3)
+        self.assertEqual([pca.pwm(ch) for ch in range(4)], [0, 0, 0, 0])
+
+    def test_sensors_task_interrupt_mode(self):
+        """V režimu přerušení úloha senzorů čte jen po změně vstupů."""
+        hw = FakeI2C()
+        hw.attach(PCA9633Model())
+        pcf = hw.attach(PCF8574Model(intPin=board.P1))
+        robot = JoyCarRobot(I2C(hw), wheelDiameter=0.06, wheelBase=0.12,
+                            sensorsIntPin=board.P1, showSensors=False)
+        robot.wheels.setSpeed({"left": 100, "right": 100})
+        reads = pcf.reads
+
+        asyncio.run(_runFor(robot, 30))
+        self.assertEqual(pcf.reads, reads)
+
+        pcf.pins = 0xFF & ~Sensors.ObstacleLeft
+        asyncio.run(_runFor(robot, 30))
+        self.assertEqual(pcf.reads, reads + 1)
+        self.assertTrue(robot.sensors.areActive(Sensors.ObstacleLeft))
+
+
+async def _runFor(robot, ms):
+    """Spustí úlohy robota na ms kroků, v každém posune simulovaný čas o 1 ms."""
+    task = asyncio.create_task(run(robot, sensorsMs=1, wheelsMs=2, displayMs=5))
+    for _ in range(ms):
+        advance_ticks(1)
+        await asyncio.sleep(0.001)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Testy správce I2C sběrnic.
+
+Ověřujeme, že:
+    - frekvenci sběrnice určuje nejpomalejší zaregistrované zařízení,
+    - wrapper sběrnice je sdílený,
+    - pomalé zařízení nejde přidat na už rozběhnutou rychlou sběrnici,
+    - vytížení sběrnice odpovídá času přenosů,
+    - displej používá interní sběrnici ze správce,
+    - do vytížení sběrnice displeje se počítá i provoz displeje,
+    - zapnutí měření neotevře sběrnici, kterou zatím nikdo nepoužil,
+    - výchozí sběrnice se definují až při prvním použití správce,
+    - ovladače se na sběrnici správce zaregistrují samy.
+"""
+
+import unittest
+import board
+from busio import I2C as FakeI2C
+from joycar.buses import BusManager, buses, DISPLAY_BUS, ROBOT_BUS
+from joycar.i2c import I2C
+from joycar.display import Display, display
+from joycar.pcf8574 import PCF8574
+from joycar.pca9633 import PCA9633
+
+
+class TestBusManager(unittest.TestCase):
+    """Testy třídy BusManager."""
+
+    def test_frequency_from_devices(self):
+        """Frekvence = minimum z horní meze sběrnice a limitů zařízení."""
+        manager = BusManager()
+        manager.define("a", board.SCL, board.SDA, maxFrequency=800_000)
+        self.assertEqual(manager.frequency("a"), 800_000)
+
+        manager.register("a", 0x62)
+        self.assertEqual(manager.frequency("a"), 800_000)
+
+        manager.register("a", 0x38)
+        self.assertEqual(manager.frequency("a"), 100_000)
+        self.assertEqual(manager.hw("a").frequency, 100_000)
+
+    def test_shared_wrapper(self):
+        """i2c() vrací pro jednu sběrnici vždy stejný wrapper."""
+        manager = BusManager()
+        manager.define("a", board.SCL, board.SDA)
+        self.assertIs(manager.i2c("a"), manager.i2c("a"))
+        self.assertIs(manager.i2c("a").hw(), manager.hw("a"))
+
+    def test_slow_device_on_open_bus(self):
+        """Pomalé zařízení na otevřené rychlé sběrnici → ValueError."""
+        manager = BusManager()
+        manager.define("a", board.SCL, board.SDA)
+        manager.register("a", 0x74)
+        manager.hw("a")
+
+        with self.assertRaises(ValueError):
+            manager.register("a", 0x38)
+
+    def test_release_pins(self):
+        """Při otevření sběrnice se uvolní objekt, který drží piny."""
+        holder = FakeI2C()
+        released = []
+        holder.deinit = lambda: released.append(True)
+
+        manager = BusManager()
+        manager.define("a", board.I2C0_SCL, board.I2C0_SDA, release=holder)
+        self.assertEqual(released, [])
+        manager.hw("a")
+        self.assertEqual(released, [True])
+
+    def test_utilization(self):
+        """Vytížení = čas přenosů / uplynulý čas."""
+        manager = BusManager()
+        hw = FakeI2C(frequency=100_000)
+        hw.enable_timing()
+        manager.adopt("a", hw)
+        manager.register("a", 0x38)
+        manager.enableStats()
+
+        pcf = PCF8574(manager.i2c("a"))
+        for _ in range(10):
+            pcf.read()
+
+        # čas běží jen během přenosů → sběrnice je vytížená celou dobu
+        self.assertAlmostEqual(manager.utilization("a"), 1.0, delta=0.05)
+
+    def test_display_uses_manager(self):
+        """Displej běží na interní sběrnici správce na 650 kHz."""
+        fast_i2c = buses.hw(DISPLAY_BUS)
+        self.assertIs(display._i2c, buses.i2c(DISPLAY_BUS))
+        self.assertIs(display._i2c.hw(), fast_i2c)
+        self.assertEqual(fast_i2c.frequency, 650_000)
+        self.assertEqual(buses.devices(DISPLAY_BUS), [0x74])
+
+    def test_display_utilization(self):
+        """Zápisy displeje (i částečné) se započítají do vytížení jeho sběrnice."""
+        manager = BusManager()
+        hw = FakeI2C()
+        manager.adopt("d", hw)
+        manager.register("d", 0x74)
+        display = Display(manager.i2c("d"))
+        manager.enableStats()
+
+        hw.enable_timing()
+        display.fill(5)
+        display.pixel(3, 3, 9)
+        display.flush()
+
+        stats = manager.i2c("d")._stats
+        self.assertEqual(stats.device(0x74)[1], 145 + 2)
+        self.assertGreater(manager.utilization("d"), 0.0)
+
+    def test_stats_do_not_open_bus(self):
+        """enableStats() neotevře sběrnici; měření se zapne až při jejím použití."""
+        holder = FakeI2C()
+        released = []
+        holder.deinit = lambda: released.append(True)
+
+        manager = BusManager()
+        manager.define("a", board.I2C0_SCL, board.I2C0_SDA, release=holder)
+        manager.enableStats()
+        self.assertEqual(released, [])
+
+        pcf = PCF8574(manager.i2c("a"))
+        pcf.read()
+        self.assertEqual(released, [True])
+        self.assertEqual(manager.i2c("a")._stats.device(0x38)[0], 1)
+
+    def test_defaults_are_lazy(self):
+        """Vytvoření správce výchozí sběrnice nedefinuje, až první použití."""
+        calls = []
+
+        def defaults(manager):
+            calls.append(True)
+            manager.define("a", board.SCL, board.SDA)
+
+        manager = BusManager(defaults)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(manager.names(), ["a"])
+        self.assertEqual(manager.devices("a"), [])
+        self.assertEqual(calls, [True])
+
+    def test_drivers_register_themselves(self):
+        """PCF8574 a PCA9633 se zaregistrují na sběrnici, jejíž wrapper dostaly."""
+        i2c = buses.i2c(ROBOT_BUS)
+        PCF8574(i2c)
+        PCA9633(i2c)
+        self.assertIn(0x38, buses.devices(ROBOT_BUS))
+        self.assertIn(0x62, buses.devices(ROBOT_BUS))
+
+        # cizí wrapper správce nezná → nic se neregistruje
+        before = [buses.devices(name) for name in buses.names()]
+        PCF8574(I2C(FakeI2C()), address=0x20)
+        self.assertEqual([buses.devices(name) for name in buses.names()], before)
+
+
+if __name__ == "__main__":
+    unittest.main()
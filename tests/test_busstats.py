@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+from joycar import I2C, PCF8574, BusStats
+from busio import I2C as FakeI2C
+
+
+class TestBusStats(unittest.TestCase):
+    """
+    Testy měření vytížení I2C sběrnice.
+
+    Ověřujeme, že:
+        - zapnuté měření počítá transakce a bajty pro každé zařízení
+        - každé zamknutí sběrnice se zapíše do histogramu čekání
+        - po vypnutí měření I2C opět používá původní metody
+        - měří se i asynchronní zámek a commit_async()
+    """
+
+    def test_counts_per_device(self):
+        """Jeden zápis a jedno čtení PCF8574 → 2 transakce, 1 B zapsán, 1 B přečten."""
+        hw = FakeI2C()
+        i2c = I2C(hw)
+        stats = i2c.enable_stats()
+        pcf = PCF8574(i2c)
+
+        pcf.write(0xFF)
+        pcf.read()
+
+        self.assertEqual(stats.device(0x38)[:3], (2, 1, 1))
+        self.assertEqual(stats.lockWait()[0], 2)
+        self.assertEqual(sum(stats.lockHistogram()), 2)
+        self.assertEqual(sum(stats.transferHistogram()), 2)
+
+    def test_disable_restores_methods(self):
+        """Po disable_stats() se nic dalšího nezaznamená."""
+        hw = FakeI2C()
+        i2c = I2C(hw)
+        stats = i2c.enable_stats(BusStats(maxDevices=2))
+        i2c.disable_stats()
+
+        self.assertNotIn("write", i2c.__dict__)
+        self.assertNotIn("lock_async", i2c.__dict__)
+        PCF8574(i2c).write(0x00)
+        self.assertEqual(stats.device(0x38), (0, 0, 0, 0))
+
+    def test_async_path_measured(self):
+        """Čtení pod `async with` a commit_async() zapíšou čekání na zámek i přenosy."""
+        hw = FakeI2C()
+        i2c = I2C(hw)
+        stats = i2c.enable_stats()
+        pcf = PCF8574(i2c)
+
+        async def main():
+            await pcf.readAsync()
+            i2c.begin_batch()
+            pcf.write(0x0F)
+            await i2c.commit_async()
+
+        asyncio.run(main())
+
+        self.assertEqual(stats.lockWait()[0], 2)
+        self.assertEqual(stats.device(0x38)[:3], (2, 1, 1))
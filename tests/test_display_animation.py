@@ -0,0 +1,89 @@
+"""
+Testy animací přehrávaných čipem IS31FL3731.
+
+Ověřujeme, že:
+    - snímky se nahrají na konec paměti čipu a zapne se autoplay,
+    - doba snímku, počet opakování a dýchání se převedou na registry,
+    - během animace flush() nic neposílá,
+    - stopAnimation() vrátí režim obrázku s aktuálním framebufferem.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from _fake.hardware.i2c_devices import IS31FL3731Model
+from tests.create import createDisplay
+
+
+class TestDisplayAnimation(unittest.TestCase):
+    """Testy Display.playAnimation(), breathe() a stopAnimation()."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.led = self.hw.attach(IS31FL3731Model())
+        self.display = createDisplay(self.hw)
+        self.display.iconA("<", flush=False)
+        self.left = self.display.snapshot()
+        self.display.clear()
+        self.blank = self.display.snapshot()
+
+    def test_autoplay_registers(self):
+        """Dva snímky → snímky 6 a 7, krok 22 ms, 3 opakování."""
+        self.display.playAnimation([self.left, self.blank], delayMs=22, loops=3)
+        led = self.led
+        self.assertEqual(led.mode(), 1)
+        self.assertEqual(led.function[led.REG_CONFIG] & 0x07, 6)
+        self.assertEqual(led.function[led.REG_AUTOPLAY1], 0x32)
+        self.assertEqual(led.function[led.REG_AUTOPLAY2], 2)
+        self.assertEqual(led.pwm(6), self.left)
+        self.assertEqual(led.pwm(7), self.blank)
+        self.assertEqual(led.function[led.REG_BREATH2] & 0x10, 0)
+
+    def test_breath(self):
+        """Dýchání: náběh 52 ms (n=1), doběh 208 ms (n=3), zhasnutí 7 ms (n=1)."""
+        self.display.playAnimation([self.left], breath=True, fadeInMs=52, fadeOutMs=208, offMs=7)
+        led = self.led
+        self.assertEqual(led.function[led.REG_BREATH1], 0x31)
+        self.assertEqual(led.function[led.REG_BREATH2], 0x11)
+
+    def test_no_bus_traffic_while_animating(self):
+        """Během animace flush() ani update() nic neodesílají."""
+        self.display.playAnimation([self.left, self.blank])
+        writes = len(self.hw.write_history)
+        self.display.pixel(1, 1, 30)
+        self.display.flush()
+        self.assertFalse(self.display.update())
+        self.assertEqual(len(self.hw.write_history), writes)
+        self.assertTrue(self.display.isAnimating())
+
+    def test_stop_restores_picture(self):
+        """Po zastavení je zobrazený aktuální framebuffer v režimu obrázku."""
+        self.display.playAnimation([self.left, self.blank])
+        self.display.pixel(2, 2, 40)
+        self.display.stopAnimation()
+        self.assertEqual(self.led.mode(), 0)
+        self.assertEqual(self.led.pwm(), self.display.snapshot())
+        self.assertFalse(self.display.isAnimating())
+
+    def test_eight_frames_overwrite_live_frames(self):
+        """Osm snímků přepíše i živé snímky – po zastavení se pošlou celé."""
+        self.display.setDoubleBuffer(True)
+        self.display.pixel(3, 3, 9)
+        self.display.flush()
+        self.display.playAnimation([self.left] * 8)
+        self.assertEqual(self.led.function[self.led.REG_AUTOPLAY1] & 0x07, 0)
+        self.display.stopAnimation()
+        self.assertEqual(self.led.pwm(), self.display.snapshot())
+        self.display.pixel(4, 4, 9)
+        self.display.flush()
+        self.assertEqual(self.led.pwm(), self.display.snapshot())
+
+    def test_invalid_frames(self):
+        """Animace musí mít 1–8 snímků."""
+        with self.assertRaises(ValueError):
+            self.display.playAnimation([])
+        with self.assertRaises(ValueError):
+            self.display.playAnimation([self.blank] * 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
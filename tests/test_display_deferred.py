@@ -0,0 +1,71 @@
+"""
+Testy odloženého vykreslování displeje.
+
+Ověřujeme, že:
+    - změna senzorů nic neposílá na sběrnici displeje,
+    - display.update() odešle snímek až po uplynutí periody snímků,
+    - několik změn mezi snímky se odešle v jediném snímku.
+"""
+
+import unittest
+from adafruit_ticks import advance_ticks
+from busio import I2C as FakeI2C
+from joycar import Sensors
+from joycar.buses import buses, DISPLAY_BUS
+from joycar.display import display
+from _fake.hardware.i2c_devices import PCF8574Model
+from tests.create import createSensors
+
+IDLE = 0xFF ^ Sensors.LineAll
+
+fast_i2c = buses.hw(DISPLAY_BUS)
+
+
+class TestDisplayDeferred(unittest.TestCase):
+    """Testy Display.setSensorBar() a Display.update()."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.pcf = self.hw.attach(PCF8574Model(pins=IDLE))
+        self.sensors = createSensors(self.hw)
+        display.update()
+        display.setFrameRate(20)
+        self.writes = len(fast_i2c.write_history)
+
+    def test_sensor_change_does_not_touch_bus(self):
+        """Čtení senzorů se změnou stavu nezapíše nic na sběrnici displeje."""
+        self.pcf.pins = IDLE | Sensors.LineMiddle
+        self.sensors.updateSensorData()
+        self.assertEqual(len(fast_i2c.write_history), self.writes)
+
+    def test_update_respects_frame_period(self):
+        """Snímek se odešle až po uplynutí periody, a to jen jednou."""
+        for pins in (IDLE | Sensors.LineLeft, IDLE | Sensors.LineMiddle):
+            self.pcf.pins = pins
+            self.sensors.updateSensorData()
+            self.assertFalse(display.update())
+
+        self.assertEqual(len(fast_i2c.write_history), self.writes)
+        advance_ticks(50)
+        self.assertTrue(display.update())
+        writes = len(fast_i2c.write_history)
+        self.assertGreater(writes, self.writes)
+
+        # bez další změny se už nic neodesílá
+        advance_ticks(50)
+        self.assertFalse(display.update())
+        self.assertEqual(len(fast_i2c.write_history), writes)
+
+    def test_sensor_bar_pixels(self):
+        """Vzor se vykreslí do spodního řádku (aktivní = bh, neaktivní = bl)."""
+        display.setSensorBar(0b00100, bh=9, bl=1)
+        advance_ticks(50)
+        display.update()
+        frame = display._flushbuf
+        self.assertEqual(frame[1 + display._pixelIndex(8, 6)], 9)
+        self.assertEqual(frame[1 + display._pixelIndex(0, 6)], 1)
+        self.assertEqual(frame[1 + display._pixelIndex(16, 6)], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
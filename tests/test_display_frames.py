@@ -0,0 +1,100 @@
+"""
+Testy snímků IS31FL3731: double buffering a uložené obrazovky.
+
+Ověřujeme, že:
+    - při double bufferingu se zapisuje do skrytého snímku a pak se přepne,
+    - oba snímky po střídání odpovídají framebufferu (dorovnání zadního snímku),
+    - uloženou obrazovku zobrazí pár bajtů,
+    - double buffering nejde kombinovat s plánovačem.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from joycar import I2C, BusScheduler
+from _fake.hardware.i2c_devices import IS31FL3731Model
+from tests.create import createDisplay
+
+
+class TestDisplayFrames(unittest.TestCase):
+    """Testy Display.setDoubleBuffer(), storeScreen() a showScreen()."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.led = self.hw.attach(IS31FL3731Model())
+        self.display = createDisplay(self.hw)
+
+    def test_page_flip(self):
+        """Snímek se zapíše do zadní banky a pak se zobrazí."""
+        self.display.setDoubleBuffer(True)
+        for i in range(6):
+            shown = self.led.displayed_frame()
+            self.display.pixel(i, i % 7, 10 + i)
+            self.display.flush()
+            self.assertNotEqual(self.led.displayed_frame(), shown)
+            self.assertEqual(self.led.pwm(), bytes(self.display._flushbuf[1:]))
+
+    def test_back_frame_catches_up(self):
+        """Zadní snímek dostane i změny, které šly do předchozího snímku."""
+        self.display.setDoubleBuffer(True)
+        self.display.pixel(2, 2, 50)
+        self.display.flush()
+        self.display.pixel(12, 4, 60)
+        self.display.flush()
+
+        # třetí flush jde do snímku, který nezná pixel (12, 4)
+        writes = len(self.hw.write_history)
+        self.display.pixel(2, 3, 70)
+        self.display.flush()
+        self.assertEqual(self.led.pwm(), bytes(self.display._flushbuf[1:]))
+        # jen úseky s dorovnáním + přepnutí banky a snímku, ne celý snímek
+        total = sum(len(data) for _, data in self.hw.write_history[writes:])
+        self.assertLess(total, 20)
+
+    def test_disable_returns_to_frame_zero(self):
+        """Po vypnutí se kreslí i zobrazuje snímek 0 s aktuálním obsahem."""
+        self.display.setDoubleBuffer(True)
+        self.display.pixel(1, 1, 5)
+        self.display.flush()
+        self.display.pixel(3, 3, 6)
+        self.display.flush()
+        self.display.setDoubleBuffer(False)
+        self.display.pixel(4, 4, 7)
+        self.display.flush()
+        self.assertEqual(self.led.displayed_frame(), 0)
+        self.assertEqual(self.led.pwm(0), bytes(self.display._flushbuf[1:]))
+
+    def test_stored_screen(self):
+        """Uloženou obrazovku zobrazí jediný krátký zápis registru."""
+        self.display.iconB("8")
+        self.display.storeScreen(3)
+        stored = bytes(self.display._flushbuf[1:])
+        self.display.clear()
+
+        writes = len(self.hw.write_history)
+        self.display.showScreen(3)
+        sent = self.hw.write_history[writes:]
+        self.assertLessEqual(sum(len(data) for _, data in sent), 6)
+        self.assertEqual(self.led.displayed_frame(), 3)
+        self.assertEqual(self.led.pwm(), stored)
+
+        # další flush() se změnami vrátí živý framebuffer
+        self.display.pixel(0, 0, 1)
+        self.display.flush()
+        self.assertEqual(self.led.displayed_frame(), 0)
+
+    def test_invalid_slot(self):
+        """Snímky 0 a 1 patří živému framebufferu."""
+        with self.assertRaises(ValueError):
+            self.display.storeScreen(1)
+        with self.assertRaises(ValueError):
+            self.display.showScreen(8)
+
+    def test_scheduler_conflict(self):
+        """Double buffering a plánovač se vylučují."""
+        self.display.setDoubleBuffer(True)
+        with self.assertRaises(ValueError):
+            self.display.setScheduler(BusScheduler(I2C(self.hw)))
+
+
+if __name__ == "__main__":
+    unittest.main()
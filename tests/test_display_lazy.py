@@ -0,0 +1,88 @@
+"""
+Testy odloženého vytvoření displeje.
+
+Ověřujeme, že:
+    - zástupce displeje nic nevytvoří ani neodešle, dokud se nepoužije,
+    - senzory bez zobrazování displej nevytvoří,
+    - indexy ikon se počítají až pro skutečně vykreslené ikony,
+    - zástupce předává nastavení atributů a jejich hodnoty nezastarávají.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from joycar.buses import buses, DISPLAY_BUS
+from joycar.display import Display, _LazyDisplay
+from joycar import I2C, PCF8574, Sensors
+from _fake.hardware.i2c_devices import PCF8574Model
+
+fast_i2c = buses.hw(DISPLAY_BUS)
+
+
+class TestDisplayLazy(unittest.TestCase):
+    """Testy globálního zástupce displeje."""
+
+    def setUp(self):
+        self.saved = Display._instance
+        Display._instance = None
+        self.lazy = _LazyDisplay()
+        self.writes = len(fast_i2c.write_history)
+
+    def tearDown(self):
+        Display._instance = self.saved
+
+    def test_not_created_until_used(self):
+        """Bez použití displej nevznikne a na sběrnici nic nejde."""
+        self.assertFalse(self.lazy.isCreated())
+        self.assertEqual(len(fast_i2c.write_history), self.writes)
+
+        self.lazy.pixel(0, 0, 1)
+        self.assertTrue(self.lazy.isCreated())
+        self.assertGreater(len(fast_i2c.write_history), self.writes)
+
+    def test_headless_sensors(self):
+        """Senzory se showOnDisplay=False displej nevytvoří."""
+        hw = FakeI2C()
+        pcf = hw.attach(PCF8574Model())
+        sensors = Sensors(PCF8574(I2C(hw)), showOnDisplay=False)
+        for pins in (0xFF, 0xFF ^ Sensors.LineLeft):
+            pcf.pins = pins
+            sensors.updateSensorData()
+        self.assertIsNone(Display._instance)
+
+    def test_private_instance(self):
+        """Display(i2c) vytvoří samostatný displej a sdílenou instanci nechá být."""
+        hw = FakeI2C()
+        private = Display(hw)
+        self.assertIsNone(Display._instance)
+        self.assertIsNot(Display(FakeI2C()), private)
+        self.assertEqual(len(fast_i2c.write_history), self.writes)
+        self.assertGreater(len(hw.write_history), 0)
+
+    def test_icons_compiled_on_demand(self):
+        """Indexy se spočítají jen pro vykreslenou ikonu a pozici."""
+        self.lazy.iconA("5", flush=False)
+        sprites = Display._instance._sprites
+        self.assertEqual(sprites.count(), 1)
+        self.assertTrue(sprites.contains("5", 12, 0))
+
+    def test_attributes_forwarded(self):
+        """Přiřazení atributu přes zástupce změní displej, čtení je vždy aktuální."""
+        self.assertEqual(self.lazy.default_brightness, Display().default_brightness)
+
+        self.lazy.default_brightness = 50
+        self.assertEqual(Display().default_brightness, 50)
+        self.assertEqual(self.lazy.default_brightness, 50)
+
+        Display().default_brightness = 7
+        self.assertEqual(self.lazy.default_brightness, 7)
+        self.assertNotIn("default_brightness", vars(self.lazy))
+
+    def test_only_methods_cached(self):
+        """Do zástupce se ukládají jen metody displeje."""
+        self.lazy.pixel(0, 0, 1)
+        self.lazy.rows
+        self.assertEqual(set(vars(self.lazy)), {"pixel"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Testy režimu max FPS displeje (slučování snímků).
+
+Ověřujeme, že:
+    - v režimu max FPS kreslicí metody nic neodesílají,
+    - update() odešle sloučené změny jednou za periodu snímku,
+    - počítadla požadovaných a odeslaných snímků (i pro změny vykreslené
+      až v update() a při asynchronním odeslání),
+    - po vypnutí režimu flush() opět odesílá hned.
+"""
+
+import asyncio
+import unittest
+from busio import I2C as FakeI2C
+from adafruit_ticks import advance_ticks
+from _fake.hardware.i2c_devices import IS31FL3731Model
+from tests.create import createDisplay
+
+
+class TestDisplayMaxFps(unittest.TestCase):
+    """Testy Display.setMaxFps()."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.led = self.hw.attach(IS31FL3731Model())
+        self.display = createDisplay(self.hw)
+        self.display.setMaxFps(20)
+        self.display.resetFrameStats()
+        self.writes = len(self.hw.write_history)
+
+    def test_draw_calls_are_coalesced(self):
+        """Několik kreslicích volání = jeden odeslaný snímek."""
+        self.display.iconA("1")
+        self.display.iconB("2")
+        self.display.iconC("3")
+        self.display.pixel(8, 6, 9)
+        self.display.flush()
+        self.assertEqual(len(self.hw.write_history), self.writes)
+
+        advance_ticks(50)
+        self.assertTrue(self.display.update())
+        self.assertEqual(self.display.framesRequested(), 4)
+        self.assertEqual(self.display.framesSent(), 1)
+        self.assertEqual(self.led.pwm(), self.display.snapshot())
+
+    def test_rate_limited(self):
+        """Během jedné periody se odešle nejvýše jeden snímek."""
+        for i in range(10):
+            self.display.pixel(i, 0, 10)
+            self.display.flush()
+            advance_ticks(10)
+            self.display.update()
+        self.assertEqual(self.display.framesRequested(), 10)
+        self.assertEqual(self.display.framesSent(), 2)
+
+    def test_disable(self):
+        """Po vypnutí režimu flush() odesílá hned."""
+        self.display.setMaxFps(None)
+        self.display.pixel(1, 1, 1)
+        self.display.flush()
+        self.assertGreater(len(self.hw.write_history), self.writes)
+        self.assertEqual(self.display.framesSent(), 1)
+
+
+    def test_update_rendered_changes_are_requested(self):
+        """Lišta senzorů a posuv textu z update() se počítají jako požadavky."""
+        self.display.scroll("AB", periodMs=50)
+        for i in range(10):
+            self.display.setSensorBar(1 << (i % 5))
+            advance_ticks(50)
+            self.display.update()
+        self.assertEqual(self.display.framesSent(), 10)
+        self.assertGreaterEqual(self.display.framesRequested(), self.display.framesSent())
+
+    def test_async_counts_like_sync(self):
+        """updateAsync() počítá požadavky i odeslané snímky stejně jako update()."""
+        self.display.setSensorBar(0b00100)
+        advance_ticks(50)
+        self.assertTrue(asyncio.run(self.display.updateAsync()))
+        self.assertEqual(self.display.framesRequested(), 1)
+        self.assertEqual(self.display.framesSent(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
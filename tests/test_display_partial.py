@@ -0,0 +1,65 @@
+"""
+Testy částečného překreslení displeje.
+
+Ověřujeme, že:
+    - změna jednoho pixelu odešle jen 2 bajty (registr + hodnota),
+    - ikona odešle jen úseky, které zasahuje,
+    - obsah čipu po částečných zápisech odpovídá framebufferu,
+    - fill() stále odešle celý snímek.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from _fake.hardware.i2c_devices import IS31FL3731Model
+from tests.create import createDisplay
+
+
+class TestDisplayPartial(unittest.TestCase):
+    """Testy sledování změněných úseků v Display.flush()."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.led = self.hw.attach(IS31FL3731Model())
+        self.display = createDisplay(self.hw)
+        self.writes = len(self.hw.write_history)
+
+    def _sent(self):
+        return self.hw.write_history[self.writes:]
+
+    def test_single_pixel(self):
+        """Jeden pixel = jeden zápis se správným registrem."""
+        self.display.pixel(3, 2, 40)
+        self.display.flush()
+        idx = self.display._pixelIndex(3, 2)
+        self.assertEqual(self._sent(), [(0x74, bytes([0x24 + idx, 40]))])
+        self.assertEqual(self.display._flushbuf[0], 0x24)
+
+    def test_icon_smaller_than_frame(self):
+        """Ikona odešle méně než celý snímek."""
+        self.display.iconA("x")
+        total = sum(len(data) for _, data in self._sent())
+        self.assertLess(total, 145)
+
+    def test_device_matches_framebuffer(self):
+        """Po částečných zápisech má čip stejný obsah jako framebuffer."""
+        self.display.iconA("8", flush=False)
+        self.display.iconC("<", flush=False)
+        self.display.pixel(16, 0, 7)
+        self.display.pixel(0, 6, 9)
+        self.display.flush()
+        self.assertEqual(self.led.pwm(0), bytes(self.display._flushbuf[1:]))
+
+    def test_fill_sends_whole_frame(self):
+        """fill() odešle všech 144 bajtů jedním zápisem."""
+        self.display.fill(5)
+        self.assertEqual(len(self._sent()), 1)
+        self.assertEqual(len(self._sent()[0][1]), 145)
+
+    def test_nothing_to_send(self):
+        """Bez změn flush() nic neodešle."""
+        self.display.flush()
+        self.assertEqual(self._sent(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
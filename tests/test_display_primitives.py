@@ -0,0 +1,86 @@
+"""
+Testy hromadných operací framebufferu.
+
+Ověřujeme, že:
+    - fill/clear vyplní všech 144 bajtů a nepřepíší bajt registru,
+    - obdélník, čáry, řádek a sloupec odpovídají kreslení po pixelech,
+    - ořezání na okraji displeje,
+    - blitFrame zkopíruje celý snímek a kontroluje délku.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from tests.create import createDisplay
+
+
+class TestDisplayPrimitives(unittest.TestCase):
+    """Testy Display.rect/hline/vline/line/row/column/blitFrame."""
+
+    def setUp(self):
+        self.display = createDisplay(FakeI2C())
+
+    def _pixels(self, points, value):
+        """Framebuffer nakreslený po pixelech."""
+        self.display.fill(0)
+        for x, y in points:
+            self.display.pixel(x, y, value)
+        expected = self.display.snapshot()
+        self.display.fill(0)
+        return expected
+
+    def test_fill(self):
+        """fill() nastaví všech 144 bajtů, registr zůstane 0x24."""
+        self.display.fill(77)
+        self.assertEqual(self.display.snapshot(), bytes([77]) * 144)
+        self.assertEqual(self.display._flushbuf[0], 0x24)
+        self.display.clear()
+        self.assertEqual(self.display.snapshot(), bytes(144))
+
+    def test_filled_rect(self):
+        """Vyplněný obdélník přes obě poloviny displeje."""
+        points = [(x, y) for x in range(6, 12) for y in range(1, 5)]
+        expected = self._pixels(points, 40)
+        self.display.rect(6, 1, 6, 4, 40)
+        self.assertEqual(self.display.snapshot(), expected)
+
+    def test_rect_outline_clipped(self):
+        """Obrys přesahující okraj se ořízne."""
+        points = [(x, y) for x in range(14, 20) for y in range(-1, 3)
+                  if x in (14, 19) or y in (-1, 2)]
+        expected = self._pixels(points, 9)
+        self.display.rect(14, -1, 6, 4, 9, filled=False)
+        self.assertEqual(self.display.snapshot(), expected)
+
+    def test_lines(self):
+        """Vodorovná, svislá a šikmá čára = pixely Bresenhamova algoritmu."""
+        expected = self._pixels([(x, 3) for x in range(2, 15)], 5)
+        self.display.hline(2, 3, 13, 5)
+        self.assertEqual(self.display.snapshot(), expected)
+
+        self.display.fill(0)
+        expected = self._pixels([(10, y) for y in range(7)], 6)
+        self.display.column(10, 6)
+        self.assertEqual(self.display.snapshot(), expected)
+
+        self.display.fill(0)
+        expected = self._pixels([(0, 0), (1, 1), (2, 1), (3, 2), (4, 2)], 7)
+        self.display.line(0, 0, 4, 2, 7)
+        self.assertEqual(self.display.snapshot(), expected)
+
+    def test_row(self):
+        """row() nastaví celý řádek."""
+        expected = self._pixels([(x, 6) for x in range(17)], 3)
+        self.display.row(6, 3)
+        self.assertEqual(self.display.snapshot(), expected)
+
+    def test_blit_frame(self):
+        """blitFrame() zkopíruje celý snímek, jiná délka je chyba."""
+        frame = bytes(range(144))
+        self.display.blitFrame(frame)
+        self.assertEqual(self.display.snapshot(), frame)
+        with self.assertRaises(ValueError):
+            self.display.blitFrame(bytes(10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Testy posuvu textu (TextScroller, Display.scroll).
+
+Ověřujeme, že:
+    - text vjede zprava a po daném počtu kroků je na místě jako glyph(),
+    - posuv nemění lištu senzorů ani řádky mimo text,
+    - bez opakování text odjede a posuv skončí,
+    - update() posouvá podle periody,
+    - text nezasáhne do lišty senzorů a jas se ořízne na 0–255.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from adafruit_ticks import advance_ticks
+from joycar import TextScroller
+from tests.create import createDisplay
+
+
+class TestTextScroller(unittest.TestCase):
+    """Testy třídy TextScroller."""
+
+    def setUp(self):
+        self.display = createDisplay(FakeI2C())
+
+    def test_matches_glyph(self):
+        """Po 10 krocích je první znak tam, kam ho vykreslí glyph(..., x=6)."""
+        self.display.glyph("1", 6, 0, 20)
+        expected = self.display.snapshot()
+        self.display.fill(0)
+
+        scroller = TextScroller(self.display, "1", color=20)
+        self.assertEqual(self.display.snapshot(), bytes(144))
+        for _ in range(10):
+            scroller.step()
+        self.assertEqual(self.display.snapshot(), expected)
+
+    def test_keeps_other_rows(self):
+        """Řádky mimo text (lišta senzorů) se nemění."""
+        self.display.fill(7)
+        scroller = TextScroller(self.display, "HI", y=0, color=30)
+        for _ in range(12):
+            scroller.step()
+        frame = self.display.snapshot()
+        for x in range(17):
+            self.assertEqual(frame[self.display._pixelIndex(x, 5)], 7)
+            self.assertEqual(frame[self.display._pixelIndex(x, 6)], 7)
+
+    def test_scrolls_out(self):
+        """Bez opakování text celý odjede a posuv skončí."""
+        scroller = TextScroller(self.display, "12")
+        steps = 0
+        while not scroller.done():
+            scroller.step()
+            steps += 1
+        self.assertGreater(steps, 17)
+        self.assertEqual(self.display.snapshot(), bytes(144))
+
+    def test_loop(self):
+        """S opakováním posuv nikdy neskončí."""
+        scroller = TextScroller(self.display, "1", loop=True)
+        for _ in range(100):
+            scroller.step()
+        self.assertFalse(scroller.done())
+
+    def test_display_update_drives_scroll(self):
+        """self.display.update() posouvá text podle periody."""
+        scroller = self.display.scroll("8", periodMs=100)
+        advance_ticks(99)
+        self.assertFalse(scroller.update())
+        advance_ticks(1)
+        self.display.update()
+        self.assertEqual(scroller._offset, 1)
+        self.assertTrue(self.display.isScrolling())
+
+    def test_sensor_bar_row_reserved(self):
+        """y = 2 by text položilo přes lištu senzorů → ValueError."""
+        TextScroller(self.display, "1", y=1)
+        with self.assertRaises(ValueError):
+            TextScroller(self.display, "1", y=2)
+        with self.assertRaises(ValueError):
+            self.display.scroll("1", y=2)
+
+    def test_color_clamped(self):
+        """Jas mimo 0–255 se ořízne stejně jako v pixel()."""
+        scroller = TextScroller(self.display, "1", color=300)
+        for _ in range(10):
+            scroller.step()
+        self.assertEqual(max(self.display.snapshot()), 255)
+
+        self.display.fill(0)
+        scroller = TextScroller(self.display, "1", color=-5)
+        for _ in range(10):
+            scroller.step()
+        self.assertEqual(self.display.snapshot(), bytes(144))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Testy spritů displeje (Display.blit, Display.glyph, SpriteCache).
+
+Ověřujeme, že:
+    - sprite na libovolné pozici odpovídá kreslení po pixelech,
+    - pixely mimo displej se oříznou,
+    - průhledný sprite nemaže pozadí,
+    - cache opakovaně použije přeložený sprite a vyřadí nejdéle nepoužitý,
+    - klíč pozice je jedinečný i pro záporné souřadnice.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from joycar import SpriteCache
+from joycar.sprites import _posKey
+from tests.create import createDisplay
+
+ARROW = (0b00100, 0b01110, 0b10101, 0b00100, 0b00100)
+
+
+class TestDisplaySprites(unittest.TestCase):
+    """Testy vykreslování spritů."""
+
+    def setUp(self):
+        self.display = createDisplay(FakeI2C())
+
+    def _reference(self, bitmap, x0, y0, color, background=0):
+        """Framebuffer nakreslený po pixelech."""
+        self.display.fill(background)
+        for iy, line in enumerate(bitmap):
+            for ix in range(5):
+                if line & (1 << ix):
+                    self.display.pixel(x0 + ix, y0 + iy, color)
+                else:
+                    self.display.pixel(x0 + ix, y0 + iy, 0)
+        expected = self.display.snapshot()
+        self.display.fill(background)
+        return expected
+
+    def test_any_position(self):
+        """Sprite na libovolné pozici = kreslení po pixelech."""
+        for x, y in ((0, 0), (3, 1), (9, 2), (12, 0)):
+            expected = self._reference(ARROW, x, y, 20)
+            self.display.blit(ARROW, x, y, 20)
+            self.assertEqual(self.display.snapshot(), expected)
+
+    def test_clipping(self):
+        """Sprite přesahující okraj se ořízne, úplně mimo nic nekreslí."""
+        for x, y in ((-2, 0), (14, 4), (15, -3)):
+            expected = self._reference(ARROW, x, y, 20)
+            self.display.blit(ARROW, x, y, 20)
+            self.assertEqual(self.display.snapshot(), expected)
+
+        self.display.blit(ARROW, 17, 0, 20)
+        self.display.blit(ARROW, 0, -5, 20)
+        self.assertEqual(self.display.snapshot(), bytes(144))
+
+    def test_transparent(self):
+        """Průhledný sprite nechá pozadí pod zhasnutými pixely."""
+        self.display.fill(3)
+        self.display.blit(ARROW, 4, 1, 30, transparent=True)
+        frame = self.display.snapshot()
+        self.assertEqual(frame[self.display._pixelIndex(6, 1)], 30)
+        self.assertEqual(frame[self.display._pixelIndex(4, 1)], 3)
+
+    def test_glyph_matches_icon(self):
+        """glyph() na pozici A vykreslí totéž co iconA()."""
+        self.display.iconA("7")
+        expected = self.display.snapshot()
+        self.display.fill(0)
+        self.display.glyph("7", 12, 0)
+        self.assertEqual(self.display.snapshot(), expected)
+
+    def test_width_is_part_of_key(self):
+        """Stejné řádky s jinou šířkou dávají jiný sprite."""
+        self.display.blit((0b11,), 0, 0, 20, width=2)
+        self.display.fill(0)
+        self.display.blit((0b11,), 0, 0, 20, width=1)
+        frame = self.display.snapshot()
+        self.assertEqual(frame[self.display._pixelIndex(0, 0)], 20)
+        self.assertEqual(frame[self.display._pixelIndex(1, 0)], 0)
+
+    def test_position_keys_unique(self):
+        """Klíče pozic jsou jedinečné i pro sprity částečně mimo displej."""
+        keys = {_posKey(x, y, w)
+                for x in range(-8, 17) for y in range(-8, 7) for w in range(1, 9)}
+        self.assertEqual(len(keys), 25 * 15 * 8)
+        with self.assertRaises(ValueError):
+            _posKey(0, 0, 256)
+        with self.assertRaises(ValueError):
+            _posKey(0, -129, 5)
+
+
+class TestSpriteCache(unittest.TestCase):
+    """Testy LRU cache spritů."""
+
+    def setUp(self):
+        self.cache = SpriteCache(createDisplay(FakeI2C())._pixelIndex, capacity=2)
+
+    def test_hit(self):
+        """Stejná bitmapa na stejné pozici se přeloží jen jednou."""
+        first = self.cache.get(ARROW, ARROW, 1, 1)
+        self.assertIs(self.cache.get(ARROW, ARROW, 1, 1), first)
+        self.assertEqual((self.cache.hits(), self.cache.misses()), (1, 1))
+
+    def test_lru_eviction(self):
+        """Při plné cache se vyřadí nejdéle nepoužitý sprite."""
+        self.cache.get(ARROW, ARROW, 0, 0)
+        self.cache.get(ARROW, ARROW, 5, 0)
+        self.cache.get(ARROW, ARROW, 0, 0)
+        self.cache.get(ARROW, ARROW, 9, 0)
+
+        self.assertEqual(self.cache.count(), 2)
+        self.assertEqual(self.cache.evictions(), 1)
+        self.assertTrue(self.cache.contains(ARROW, 0, 0))
+        self.assertFalse(self.cache.contains(ARROW, 5, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Test časového modelu fake I2C sběrnice.
+
+Na skutečném robotu trvá každý přenos po I2C nějaký čas – např. celý
+snímek displeje (145 bajtů) při 650 kHz zabere přes 2 ms. Fake sběrnice
+se zapnutým časovým modelem tento čas přičte k adafruit_ticks.
+"""
+
+import unittest
+import time
+import adafruit_ticks as ticks
+from busio import I2C as FakeI2C
+
+
+class TestFakeBusTiming(unittest.TestCase):
+    """Testy účtování simulovaného času za přenosy."""
+
+    def test_display_frame_cost(self):
+        """
+        145 bajtů při 650 kHz:
+            START + adresa (9) + 145 × 9 + STOP = 1316 bitů ≈ 2025 µs
+        → simulovaný čas se posune o 2 ms.
+        """
+        ticks.set_ticks_ms(0)
+        hw = FakeI2C(frequency=650_000)
+        hw.enable_timing()
+
+        hw.writeto(0x74, bytearray(145))
+
+        self.assertEqual(hw.transaction_bits(0x74, 145), 1316)
+        self.assertAlmostEqual(hw.bus_time_us, 1316 * 1_000_000 / 650_000)
+        self.assertEqual(ticks.ticks_ms(), 2)
+
+    def test_small_frames_accumulate(self):
+        """
+        Krátké rámce se sčítají i pod 1 ms:
+        100 × 5bajtový zápis při 400 kHz = 100 × 56 bitů = 14 ms.
+        """
+        ticks.set_ticks_ms(0)
+        hw = FakeI2C(frequency=400_000)
+        hw.enable_timing()
+
+        for _ in range(100):
+            hw.writeto(0x62, bytes(5))
+
+        self.assertEqual(ticks.ticks_ms(), 14)
+        self.assertEqual(time.monotonic_ns(), 14_000_000)
+
+    def test_disabled_by_default(self):
+        """Bez enable_timing() se čas neposouvá."""
+        ticks.set_ticks_ms(0)
+        hw = FakeI2C()
+
+        hw.writeto(0x74, bytearray(145))
+
+        self.assertEqual(ticks.ticks_ms(), 0)
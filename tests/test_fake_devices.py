@@ -0,0 +1,115 @@
+"""
+Testy stavových modelů zařízení za fake I2C sběrnicí.
+
+Model dekóduje zápisy ovladače do svých registrů – testy tak kontrolují
+výsledný stav čipu, ne konkrétní bajty na sběrnici.
+"""
+
+import unittest
+import board
+import digitalio
+from busio import I2C as FakeI2C
+from _fake.hardware.i2c_devices import (
+    PCA9633Model, PCF8574Model, IS31FL3731Model, CuteBotProModel,
+)
+from tests.create import createWheels, createSensors
+from joycar.sensors import Sensors
+
+
+class TestFakeDevices(unittest.TestCase):
+    """Testy modelů PCA9633, PCF8574, IS31FL3731 a CuteBot Pro."""
+
+    def test_wheels_drive_pca9633_model(self):
+        """Jízda vpřed nastaví dopředné kanály obou kol, zpětné zůstanou 0."""
+        hw = FakeI2C()
+        pca = hw.attach(PCA9633Model())
+        wheels = createWheels(hw)
+
+        wheels.setVelocity(0.2, 0.0)
+
+        self.assertEqual(pca.pwm(0), 0)
+        self.assertGreater(pca.pwm(1), 0)
+        self.assertEqual(pca.pwm(2), 0)
+        self.assertGreater(pca.pwm(3), 0)
+
+        wheels.stop()
+        self.assertEqual([pca.pwm(ch) for ch in range(4)], [0, 0, 0, 0])
+
+    def test_pca9633_auto_increment_wraps(self):
+        """Auto-inkrement jen přes PWM registry se po PWM3 vrací na PWM0."""
+        hw = FakeI2C()
+        pca = hw.attach(PCA9633Model())
+
+        hw.writeto(0x62, bytes([0xA2, 1, 2, 3, 4, 5]))
+
+        self.assertEqual([pca.pwm(ch) for ch in range(4)], [5, 2, 3, 4])
+
+    def test_sensors_read_pcf8574_model(self):
+        """Senzory čtou piny modelu bez plnění fronty queue_read()."""
+        hw = FakeI2C()
+        pcf = hw.attach(PCF8574Model(pins=0xFF))
+        sensors = createSensors(hw)
+
+        for _ in range(50):
+            sensors.updateSensorData()
+        self.assertFalse(sensors.areActive(Sensors.ObstacleLeft))
+
+        pcf.pins = 0xFF & ~Sensors.ObstacleLeft
+        sensors.updateSensorData()
+        self.assertTrue(sensors.areActive(Sensors.ObstacleLeft))
+        self.assertEqual(pcf.reads, 52)
+
+    def test_is31fl3731_banks(self):
+        """Zápis do snímku a volba zobrazeného snímku přes funkční banku."""
+        hw = FakeI2C()
+        led = hw.attach(IS31FL3731Model())
+
+        hw.writeto(0x74, bytes([0xFD, 0x01]))
+        hw.writeto(0x74, bytes([0x24, 10, 20]))
+        hw.writeto(0x74, bytes([0xFD, 0x0B]))
+        hw.writeto(0x74, bytes([0x01, 0x01]))
+        hw.writeto(0x74, bytes([0x0A, 0x01]))
+
+        self.assertEqual(led.displayed_frame(), 1)
+        self.assertEqual(led.pwm()[0:3], bytes([10, 20, 0]))
+        self.assertTrue(led.is_awake())
+
+    def test_cutebot_pro_model(self):
+        """Ovladač CuteBotPro komunikuje s modelem desky."""
+        from cutebot_pro import CuteBotPro
+
+        hw = FakeI2C()
+        board = hw.attach(CuteBotProModel())
+        board.line_state = 0b0110
+        bot = CuteBotPro(i2c=hw)
+
+        bot.motor_control(2, 30, -20)
+        self.assertEqual((board.left_speed, board.right_speed), (30, -20))
+
+        bot.trackbit_state_value()
+        self.assertTrue(bot.get_grayscale_sensor_state(0b0110))
+        self.assertEqual(bot.read_versions(), "V 2.0.0")
+
+    def test_digitalio_reset(self):
+        """Po reset() nový vstup nevidí buzení z předchozího testu."""
+        digitalio.drive(board.P1, False)
+        io = digitalio.DigitalInOut(board.P1)
+        io.switch_to_input(pull=digitalio.Pull.UP)
+        self.assertFalse(io.value)
+
+        digitalio.reset()
+        io = digitalio.DigitalInOut(board.P1)
+        io.switch_to_input(pull=digitalio.Pull.UP)
+        self.assertTrue(io.value)
+
+    def test_scan_lists_attached_devices(self):
+        """Připojený model je vidět ve scan()."""
+        hw = FakeI2C()
+        hw.attach(CuteBotProModel())
+        hw.try_lock()
+        self.assertIn(0x10, hw.scan())
+        hw.unlock()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from joycar import PCA9633, I2C
+from busio import I2C as FakeI2C
+
+
+class CountingI2C(FakeI2C):
+    """FakeI2C, který navíc počítá zamknutí sběrnice."""
+
+    def __init__(self):
+        super().__init__()
+        self.lock_count = 0
+
+    def try_lock(self):
+        self.lock_count += 1
+        return True
+
+
+class TestI2CBatch(unittest.TestCase):
+    """
+    Testy dávkování I2C transakcí.
+
+    Ověřujeme, že:
+        - zápisy během dávky se neodešlou hned, ale až při commit()
+        - commit() provede všechny transakce pod jediným zámkem
+        - čtení v dávce naplní předalokovaný buffer volajícího
+    """
+
+    def test_batch_single_lock(self):
+        """
+        Dva zápisy přes writeTwoRegisters a jedno čtení
+        proběhnou při commit() pod jedním zámkem a ve správném pořadí.
+        """
+        hw = CountingI2C()
+        hw.queue_read([0x5A])
+        i2c = I2C(hw)
+        p = PCA9633(i2c)
+        readbuf = bytearray(1)
+
+        i2c.begin_batch()
+        p.writeTwoRegisters(0x02, 10, 0x03, 20)
+        i2c.batch_read(0x38, readbuf)
+
+        # nic se zatím neodeslalo
+        self.assertEqual(hw.write_history, [])
+        self.assertEqual(i2c.pending(), 3)
+
+        self.assertEqual(i2c.commit(), 3)
+
+        self.assertEqual(hw.lock_count, 1)
+        self.assertEqual(hw.write_history, [(0x62, bytes([0x02, 10])),
+                                            (0x62, bytes([0x03, 20]))])
+        self.assertEqual(readbuf[0], 0x5A)
+        self.assertFalse(i2c.in_batch())
+
+    def test_full_queue_flushes(self):
+        """Plná fronta se odešle automaticky a žádný zápis se neztratí."""
+        hw = CountingI2C()
+        i2c = I2C(hw, batchSize=2)
+
+        i2c.begin_batch()
+        for value in range(5):
+            i2c.batch_write(0x10, bytes([value]))
+        i2c.commit()
+
+        self.assertEqual([w[1][0] for w in hw.write_history], [0, 1, 2, 3, 4])
+        self.assertEqual(hw.lock_count, 3)
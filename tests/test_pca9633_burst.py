@@ -0,0 +1,48 @@
+import unittest
+from joycar import PCA9633, PCA9633_registers, I2C
+from busio import I2C as FakeI2C
+
+
+class TestPCA9633Burst(unittest.TestCase):
+    """
+    Testy hromadného (burst) zápisu do PCA9633.
+
+    Ověřujeme, že:
+        - writePwm() zapíše všechny 4 PWM kanály jediným 5bajtovým rámcem
+          s auto-inkrementem přes PWM registry (řídicí bajt 0xA2)
+        - setPwm() samo nic neodešle, až commitPwm()
+        - commitPwm() bez změny nic neodešle
+        - writeRegisters() použije auto-inkrement přes všechny registry (0x80)
+    """
+
+    def test_write_pwm_single_frame(self):
+        """writePwm(1, 2, 3, 4) → jediný zápis (0x62, [0xA2, 1, 2, 3, 4])."""
+        hw = FakeI2C()
+        p = PCA9633(I2C(hw))
+
+        p.writePwm(1, 2, 3, 4)
+
+        self.assertEqual(hw.write_history, [(0x62, bytes([0xA2, 1, 2, 3, 4]))])
+
+    def test_set_and_commit(self):
+        """Připravené kanály se odešlou až při commitPwm(), a to jen jednou."""
+        hw = FakeI2C()
+        p = PCA9633(I2C(hw))
+
+        p.setPwm(PCA9633_registers.PWM1, 100)
+        p.setPwm(PCA9633_registers.PWM3, 50)
+        self.assertEqual(hw.write_history, [])
+
+        p.commitPwm()
+        p.commitPwm()
+
+        self.assertEqual(hw.write_history, [(0x62, bytes([0xA2, 0, 100, 0, 50]))])
+
+    def test_write_registers_auto_increment(self):
+        """writeRegisters(MODE1, [..]) nastaví bit auto-inkrementu 0x80."""
+        hw = FakeI2C()
+        p = PCA9633(I2C(hw))
+
+        p.writeRegisters(PCA9633_registers.MODE1, [0x00, 0x05])
+
+        self.assertEqual(hw.write_history[-1], (0x62, bytes([0x80, 0x00, 0x05])))
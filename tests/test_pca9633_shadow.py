@@ -0,0 +1,129 @@
+import unittest
+from joycar import PCA9633, PCA9633_registers, I2C
+from busio import I2C as FakeI2C
+from tests.create import createWheels
+
+
+class FailingI2C(FakeI2C):
+    """FakeI2C, jehož zápisy po nastavení fail = True selžou."""
+
+    def __init__(self):
+        super().__init__()
+        self.fail = False
+
+    def writeto(self, addr, data, **kwargs):
+        if self.fail:
+            raise OSError(5)
+        super().writeto(addr, data, **kwargs)
+
+
+class TestPCA9633Shadow(unittest.TestCase):
+    """
+    Testy stínové kopie registrů PCA9633.
+
+    Ověřujeme, že:
+        - opakovaný zápis stejné hodnoty se na sběrnici nepošle
+        - invalidate() vynutí další zápis
+        - resync() převezme hodnoty z čipu
+        - po selhání dávky se stejný zápis odešle znovu
+        - kola jedoucí konstantní rychlostí negenerují žádný provoz
+    """
+
+    def test_redundant_write_suppressed(self):
+        """Druhý zápis stejné hodnoty se neodešle, po invalidate() ano."""
+        hw = FakeI2C()
+        p = PCA9633(I2C(hw))
+
+        p.writeRegister(PCA9633_registers.MODE1, 0x00)
+        p.writeRegister(PCA9633_registers.MODE1, 0x00)
+        self.assertEqual(len(hw.write_history), 1)
+        self.assertEqual(p.suppressedWrites(), 1)
+
+        p.invalidate()
+        p.writeRegister(PCA9633_registers.MODE1, 0x00)
+        self.assertEqual(len(hw.write_history), 2)
+
+    def test_write_pwm_only_on_change(self):
+        """writePwm() se stejnými hodnotami nic neodešle."""
+        hw = FakeI2C()
+        p = PCA9633(I2C(hw))
+
+        p.writePwm(0, 10, 0, 20)
+        p.writePwm(0, 10, 0, 20)
+        self.assertEqual(len(hw.write_history), 1)
+
+        p.writePwm(0, 11, 0, 20)
+        self.assertEqual(hw.write_history[-1], (0x62, bytes([0xA2, 0, 11, 0, 20])))
+
+    def test_resync(self):
+        """Po resync() se zápis hodnoty, kterou čip už má, neodešle."""
+        hw = FakeI2C()
+        hw.queue_read([0x00, 0x05, 0, 0, 0, 0, 0xFF, 0, 0xAA, 0, 0, 0, 0])
+        p = PCA9633(I2C(hw))
+
+        p.resync()
+        writes = len(hw.write_history)
+
+        p.writeRegister(PCA9633_registers.LEDOUT, 0xAA)
+        self.assertEqual(len(hw.write_history), writes)
+
+    def test_cruising_generates_no_traffic(self):
+        """Wheels při konstantní rychlosti po rozjezdu nic nezapisují."""
+        hw = FakeI2C()
+        wheels = createWheels(hw)
+
+        wheels.setVelocity(0.2, 0.0)
+        writes = len(hw.write_history)
+
+        for _ in range(10):
+            wheels.setVelocity(0.2, 0.0)
+            wheels.update()
+
+        self.assertEqual(len(hw.write_history), writes)
+
+    def test_failed_batch_resends(self):
+        """Rámec ztracený při selhání commit() se při dalším zápisu odešle znovu."""
+        hw = FailingI2C()
+        i2c = I2C(hw)
+        p = PCA9633(i2c)
+
+        hw.fail = True
+        i2c.begin_batch()
+        p.writePwm(0, 100, 0, 100)
+        with self.assertRaises(OSError):
+            i2c.commit()
+        self.assertEqual(i2c.batch_failures(), 1)
+
+        hw.fail = False
+        i2c.begin_batch()
+        p.writePwm(0, 100, 0, 100)
+        i2c.commit()
+        self.assertEqual(hw.write_history, [(0x62, bytes([0xA2, 0, 100, 0, 100]))])
+
+        # po úspěšném odeslání se stejný zápis už zase potlačí
+        p.writePwm(0, 100, 0, 100)
+        self.assertEqual(len(hw.write_history), 1)
+
+    def test_failed_scheduler_tick_resends(self):
+        """Selhání přenosu v plánovači stínovou kopii také zneplatní."""
+        from joycar.scheduler import BusScheduler
+
+        hw = FailingI2C()
+        i2c = I2C(hw)
+        scheduler = BusScheduler(i2c)
+        i2c.set_scheduler(scheduler)
+        p = PCA9633(i2c)
+
+        hw.fail = True
+        i2c.begin_batch()
+        p.writePwm(0, 50, 0, 50)
+        i2c.commit()
+        with self.assertRaises(OSError):
+            scheduler.tick()
+
+        hw.fail = False
+        i2c.begin_batch()
+        p.writePwm(0, 50, 0, 50)
+        i2c.commit()
+        scheduler.tick()
+        self.assertEqual(hw.write_history, [(0x62, bytes([0xA2, 0, 50, 0, 50]))])
@@ -0,0 +1,108 @@
+"""
+Testy prioritního plánovače I2C přenosů.
+
+Ověřujeme, že:
+    - motory (SAFETY) se odešlou vždy a jako první,
+    - displej se při vyčerpaném rozpočtu odloží do dalšího ticku,
+    - opakovaně zařazený buffer se odešle jen jednou,
+    - dávka robota s plánovačem se odešle až v ticku plánovače,
+    - displej přijme jen plánovač své vlastní sběrnice.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from joycar import I2C, BusScheduler
+from _fake.hardware.i2c_devices import IS31FL3731Model, PCA9633Model
+from tests.create import createDisplay
+
+
+class TestBusScheduler(unittest.TestCase):
+    """Testy třídy BusScheduler."""
+
+    def test_safety_goes_first(self):
+        """Přenos motorů zařazený až po displeji se odešle jako první."""
+        hw = FakeI2C()
+        scheduler = BusScheduler(I2C(hw))
+
+        scheduler.submitWrite(0x74, bytearray(10))
+        scheduler.submitWrite(0x62, bytes([0xA2, 1, 2, 3, 4]))
+        self.assertEqual(scheduler.tick(), 2)
+
+        self.assertEqual([addr for addr, _ in hw.write_history], [0x62, 0x74])
+
+    def test_display_deferred_when_budget_exhausted(self):
+        """Velký snímek displeje se nevejde za motory a počká na další tick."""
+        hw = FakeI2C()
+        scheduler = BusScheduler(I2C(hw), budgetUs=1000)
+        frame = bytearray(145)
+
+        scheduler.submitWrite(0x62, bytes([0xA2, 1, 2, 3, 4]))
+        scheduler.submitWrite(0x74, frame)
+        self.assertEqual(scheduler.tick(), 1)
+        self.assertEqual(scheduler.pending(BusScheduler.DISPLAY), 1)
+        self.assertEqual(scheduler.deferred(), 1)
+
+        # snímek je delší než celý rozpočet → odešle se, když je v ticku první
+        self.assertEqual(scheduler.tick(), 1)
+        self.assertEqual(hw.write_history[-1][0], 0x74)
+        self.assertEqual(scheduler.pending(), 0)
+
+    def test_coalescing(self):
+        """Tentýž buffer zařazený vícekrát se odešle jednou s posledním obsahem."""
+        hw = FakeI2C()
+        scheduler = BusScheduler(I2C(hw))
+        frame = bytearray(3)
+
+        for value in (1, 2, 3):
+            frame[1] = value
+            scheduler.submitWrite(0x74, frame)
+
+        self.assertEqual(scheduler.coalesced(), 2)
+        scheduler.tick()
+        self.assertEqual(hw.write_history, [(0x74, bytes([0, 3, 0]))])
+
+    def test_transfer_estimate(self):
+        """Odhad doby přenosu odpovídá počtu bitů při dané frekvenci."""
+        scheduler = BusScheduler(I2C(FakeI2C()), frequency=400_000)
+
+        # 11 + 9 * 5 = 56 bitů → 140 µs
+        self.assertEqual(scheduler.transferUs(0x62, 5), 140)
+
+    def test_batch_goes_through_scheduler(self):
+        """Dávka robota s plánovačem se odešle až v ticku plánovače."""
+        from joycar.robot import JoyCarRobot
+
+        hw = FakeI2C()
+        pca = hw.attach(PCA9633Model())
+        i2c = I2C(hw)
+        scheduler = BusScheduler(i2c)
+        robot = JoyCarRobot(i2c, wheelDiameter=0.06, wheelBase=0.12, scheduler=scheduler)
+
+        i2c.begin_batch()
+        robot.wheels.setSpeed({"left": 100, "right": 100})
+        self.assertEqual(i2c.commit(), 0)
+        self.assertEqual(scheduler.pending(BusScheduler.SAFETY), 1)
+        self.assertEqual(pca.pwm(3), 0)
+
+        scheduler.tick()
+        self.assertEqual(scheduler.pending(), 0)
+        self.assertGreater(pca.pwm(3), 0)
+
+    def test_display_requires_own_bus(self):
+        """Plánovač jiné sběrnice displej odmítne, plánovač jeho sběrnice přijme."""
+        hw = FakeI2C()
+        hw.attach(IS31FL3731Model())
+        display = createDisplay(hw)
+
+        with self.assertRaises(ValueError):
+            display.setScheduler(BusScheduler(I2C(FakeI2C())))
+
+        scheduler = BusScheduler(I2C(hw))
+        display.setScheduler(scheduler)
+        display.pixel(0, 0, 5)
+        display.flush()
+        self.assertEqual(scheduler.pending(BusScheduler.DISPLAY), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
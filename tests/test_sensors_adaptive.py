@@ -0,0 +1,116 @@
+"""
+Testy adaptivní periody čtení senzorů.
+
+Ověřujeme, že:
+    - stojící robot čte senzory jen s nejdelší periodou,
+    - v rychlosti se perioda zkrátí tak, aby robot mezi čteními neujel víc než limit,
+    - pozdní čtení se započítá jako zmeškaný termín,
+    - skutečná frekvence čtení se počítá z historie,
+    - v režimu přerušení zůstává záložní perioda i za jízdy,
+    - robot zapíná adaptivní periodu jen na vyžádání.
+"""
+
+import unittest
+import board
+import digitalio
+from adafruit_ticks import advance_ticks
+from busio import I2C as FakeI2C
+from _fake.hardware.i2c_devices import PCF8574Model
+from joycar import I2C, PCF8574, Sensors
+from joycar.robot import JoyCarRobot
+from tests.create import createSensors, createWheels
+
+
+class TestSensorsAdaptive(unittest.TestCase):
+    """Testy Sensors.setAdaptivePolling()."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.pcf = self.hw.attach(PCF8574Model())
+        self.sensors = createSensors(self.hw)
+        self.wheels = createWheels(self.hw)
+        self.sensors.setAdaptivePolling(self.wheels.commandedSpeed, maxTravelM=0.01,
+                                        minMs=5, maxMs=200)
+
+    def tearDown(self):
+        digitalio.reset()
+
+    def _run(self, ms, stepMs=1):
+        reads = self.pcf.reads
+        for _ in range(ms // stepMs):
+            advance_ticks(stepMs)
+            self.sensors.update()
+        return self.pcf.reads - reads
+
+    def test_idle_backs_off(self):
+        """Stojící robot čte jednou za 200 ms."""
+        self.assertEqual(self._run(1000), 5)
+        self.assertEqual(self.sensors.pollPeriodMs(), 200)
+
+    def test_fast_polls_faster(self):
+        """Při rychlosti v čte s periodou 10 mm / v."""
+        self.wheels.setSpeed({"left": 200, "right": 200})
+        speed = self.wheels.commandedSpeed()
+        self._run(1)
+
+        expected = int(0.01 * 1000 / speed)
+        self.assertEqual(self.sensors.pollPeriodMs(), max(5, expected))
+        self.assertGreater(self._run(1000), 1000 // 200)
+
+    def test_missed_deadline_and_rate(self):
+        """Pozdní průchod smyčkou = zmeškaný termín; frekvence z historie."""
+        self._run(400)
+        self.assertEqual(self.sensors.missedDeadlines(), 0)
+        self.assertAlmostEqual(self.sensors.readRate(), 5.0, delta=0.1)
+
+        advance_ticks(400)
+        self.sensors.update()
+        self.assertEqual(self.sensors.missedDeadlines(), 1)
+
+
+    def test_interrupt_mode_keeps_fallback(self):
+        """Jedoucí robot v režimu přerušení čte bez změn vstupů jen záložně."""
+        hw = FakeI2C()
+        pcf = hw.attach(PCF8574Model(intPin=board.P1))
+        robot = JoyCarRobot(I2C(hw), wheelDiameter=0.06, wheelBase=0.12,
+                            sensorsIntPin=board.P1, showSensors=False)
+        robot.wheels.setSpeed({"left": 200, "right": 200})
+        self.assertGreater(robot.wheels.commandedSpeed(), 0)
+
+        reads = pcf.reads
+        for _ in range(1000):
+            advance_ticks(1)
+            robot.update()
+        self.assertEqual(pcf.reads - reads, 2)
+        self.assertEqual(robot.sensors.pollPeriodMs(), 500)
+
+    def test_interrupt_mode_explicit_adaptive(self):
+        """S withInterrupt=True se záložní perioda zkracuje podle rychlosti."""
+        hw = FakeI2C()
+        hw.attach(PCF8574Model(intPin=board.P1))
+        sensors = Sensors(PCF8574(I2C(hw)), intPin=board.P1)
+
+        sensors.setAdaptivePolling(lambda: 1.0)
+        sensors.update()
+        self.assertEqual(sensors.pollPeriodMs(), Sensors.FALLBACK_MS)
+
+        sensors.setAdaptivePolling(lambda: 1.0, withInterrupt=True)
+        sensors.update()
+        self.assertEqual(sensors.pollPeriodMs(), 10)
+
+    def test_robot_adaptive_opt_in(self):
+        """Robot bez adaptivePolling čte i ve stoje s výchozí periodou."""
+        robot = JoyCarRobot(I2C(FakeI2C()), wheelDiameter=0.06, wheelBase=0.12,
+                            showSensors=False)
+        robot.update()
+        self.assertEqual(robot.sensors.pollPeriodMs(), Sensors.POLL_MS)
+
+        robot = JoyCarRobot(I2C(FakeI2C()), wheelDiameter=0.06, wheelBase=0.12,
+                            showSensors=False, adaptivePolling=True)
+        advance_ticks(Sensors.POLL_MS)
+        robot.update()
+        self.assertEqual(robot.sensors.pollPeriodMs(), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
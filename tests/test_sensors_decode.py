@@ -0,0 +1,81 @@
+"""
+Testy dekódovací tabulky senzorů (Sensors.DECODE).
+
+Ověřujeme, že:
+    - tabulka má záznam pro všech 128 kombinací,
+    - poloha čáry, ztráta čáry, křižovatka a překážky odpovídají bitům,
+    - vzor pro displej odpovídá aktivním senzorům.
+"""
+
+import unittest
+from busio import I2C as FakeI2C
+from joycar import Sensors
+from _fake.hardware.i2c_devices import PCF8574Model
+from tests.create import createSensors
+
+# surové hodnoty PCF8574: čárový senzor je aktivní v jedničce, překážka v nule
+IDLE = 0xFF ^ Sensors.LineAll
+
+
+class TestSensorsDecode(unittest.TestCase):
+    """Testy dekódovaného stavu senzorů."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.pcf = self.hw.attach(PCF8574Model(pins=IDLE))
+        self.sensors = createSensors(self.hw)
+
+    def _read(self, raw):
+        self.pcf.pins = raw
+        self.sensors.updateSensorData()
+
+    def test_table_size(self):
+        """Tabulka pokrývá 7 bitů PCF8574."""
+        self.assertEqual(len(Sensors.DECODE), 128)
+
+    def test_line_position(self):
+        """Poloha čáry -2 … +2 podle aktivních čárových senzorů."""
+        cases = [
+            (Sensors.LineLeft, -2),
+            (Sensors.LineLeft | Sensors.LineMiddle, -1),
+            (Sensors.LineMiddle, 0),
+            (Sensors.LineMiddle | Sensors.LineRight, 1),
+            (Sensors.LineRight, 2),
+        ]
+        for lines, position in cases:
+            self._read(IDLE | lines)
+            self.assertEqual(self.sensors.linePosition(), position)
+            self.assertFalse(self.sensors.isLineLost())
+            self.assertFalse(self.sensors.isIntersection())
+
+    def test_lost_and_intersection(self):
+        """Žádný senzor = ztráta čáry, levý i pravý = křižovatka."""
+        self._read(IDLE)
+        self.assertTrue(self.sensors.isLineLost())
+
+        self._read(IDLE | Sensors.LineAll)
+        self.assertTrue(self.sensors.isIntersection())
+        self.assertEqual(self.sensors.linePosition(), 0)
+
+    def test_obstacles_and_pattern(self):
+        """Překážky a vzor displeje souhlasí s areActive()."""
+        self._read((IDLE & ~Sensors.ObstacleRight) | Sensors.LineMiddle)
+
+        self.assertEqual(self.sensors.obstacleSide(), Sensors.ObstacleRight)
+        pattern = self.sensors.state() >> Sensors.DecodePatternShift
+        self.assertEqual(pattern, 0x04 | 0x10)
+
+    def test_table_matches_are_active(self):
+        """Pro každou kombinaci souhlasí tabulka s areActive()."""
+        for raw in range(128):
+            self._read(raw)
+            s = self.sensors
+            self.assertEqual(s.obstacleSide() & Sensors.ObstacleLeft != 0,
+                             s.areActive(Sensors.ObstacleLeft))
+            lost = not (s.areActive(Sensors.LineLeft) or s.areActive(Sensors.LineMiddle)
+                        or s.areActive(Sensors.LineRight))
+            self.assertEqual(s.isLineLost(), lost)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Testy událostí senzorů (subscribe / takeActivated / takeDeactivated).
+
+Ověřujeme, že:
+    - callback dostane aktivaci i deaktivaci se správným bitem a časem,
+    - filtr hran a masek funguje,
+    - bez změny se nic nevolá,
+    - masky událostí se vyzvednutím smažou.
+"""
+
+import unittest
+from adafruit_ticks import set_ticks_ms
+from busio import I2C as FakeI2C
+from joycar import Sensors
+from _fake.hardware.i2c_devices import PCF8574Model
+from tests.create import createSensors
+
+
+class TestSensorsEvents(unittest.TestCase):
+    """Testy odběru změn senzorů."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.pcf = self.hw.attach(PCF8574Model(pins=0xFF ^ Sensors.LineAll))
+        self.sensors = createSensors(self.hw)
+        self.events = []
+
+    def _record(self, bit, active, timeMs):
+        self.events.append((bit, active, timeMs))
+
+    def test_callback_edges(self):
+        """Aktivace i deaktivace překážky vlevo s časem čtení."""
+        self.sensors.subscribe(Sensors.ObstacleLeft, self._record)
+
+        set_ticks_ms(100)
+        self.pcf.pins &= ~Sensors.ObstacleLeft
+        self.sensors.updateSensorData()
+        set_ticks_ms(200)
+        self.pcf.pins |= Sensors.ObstacleLeft
+        self.sensors.updateSensorData()
+
+        self.assertEqual(self.events, [
+            (Sensors.ObstacleLeft, True, 100),
+            (Sensors.ObstacleLeft, False, 200),
+        ])
+
+    def test_edge_and_mask_filter(self):
+        """Callback jen na aktivaci a jen pro čárové senzory."""
+        self.sensors.subscribe(Sensors.LineLeft | Sensors.LineRight, self._record,
+                               edge=Sensors.ACTIVATED)
+
+        # čárové senzory jsou aktivní v jedničce (před invertováním)
+        self.pcf.pins |= Sensors.LineLeft | Sensors.LineRight
+        self.pcf.pins &= ~Sensors.ObstacleRight
+        self.sensors.updateSensorData()
+        self.pcf.pins &= ~Sensors.LineLeft
+        self.sensors.updateSensorData()
+
+        self.assertEqual(sorted(e[0] for e in self.events), [Sensors.LineLeft, Sensors.LineRight])
+
+    def test_no_change_no_callback(self):
+        """Opakované čtení beze změny nic nevolá."""
+        self.sensors.subscribe(0xFF, self._record)
+        for _ in range(5):
+            self.sensors.updateSensorData()
+        self.assertEqual(self.events, [])
+
+        self.sensors.unsubscribe(self._record)
+        self.pcf.pins = 0
+        self.sensors.updateSensorData()
+        self.assertEqual(self.events, [])
+
+    def test_take_masks(self):
+        """Masky událostí se hromadí do vyzvednutí."""
+        self.pcf.pins &= ~Sensors.ObstacleRight
+        self.sensors.updateSensorData()
+        self.pcf.pins |= Sensors.ObstacleRight
+        self.sensors.updateSensorData()
+
+        self.assertEqual(self.sensors.takeActivated(Sensors.ObstacleRight), Sensors.ObstacleRight)
+        self.assertEqual(self.sensors.takeActivated(Sensors.ObstacleRight), 0)
+        self.assertEqual(self.sensors.takeDeactivated(0xFF), Sensors.ObstacleRight)
+
+
+if __name__ == "__main__":
+    unittest.main()
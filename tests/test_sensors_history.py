@@ -0,0 +1,103 @@
+"""
+Testy historie čtení senzorů (SensorHistory a pomocné metody Sensors).
+
+Ověřujeme, že:
+    - kruhový buffer drží posledních N čtení a přetéká bez alokací,
+    - odrušení změní bit až po debounceCount shodných čteních,
+    - většinové hlasování n z m,
+    - časy od poslední změny a od posledního aktivního čtení.
+"""
+
+import unittest
+from adafruit_ticks import set_ticks_ms
+from busio import I2C as FakeI2C
+from joycar import Sensors
+from joycar.history import SensorHistory
+from _fake.hardware.i2c_devices import PCF8574Model
+from tests.create import createSensors
+
+IDLE = 0xFF ^ Sensors.LineAll
+
+
+class TestSensorHistory(unittest.TestCase):
+    """Testy třídy SensorHistory."""
+
+    def test_ring_wraps(self):
+        """Po přetečení zůstanou nejnovější čtení."""
+        h = SensorHistory(size=4, debounceCount=2)
+        for i in range(10):
+            h.append(i, i * 10)
+
+        self.assertEqual(h.count(), 4)
+        self.assertEqual([h.get(age) for age in range(4)], [9, 8, 7, 6])
+        self.assertEqual(h.timeMs(0), 90)
+        with self.assertRaises(IndexError):
+            h.get(4)
+
+    def test_debounce(self):
+        """Bit se v odrušeném stavu změní až po 3 shodných čteních."""
+        h = SensorHistory(size=8, debounceCount=3)
+        h.append(0x00, 0)
+        h.append(0x01, 1)
+        h.append(0x00, 2)
+        h.append(0x01, 3)
+        self.assertEqual(h.debounced() & 0x01, 0)
+
+        h.append(0x01, 4)
+        h.append(0x01, 5)
+        self.assertEqual(h.debounced() & 0x01, 0x01)
+
+    def test_count_matching(self):
+        """countMatching počítá jen posledních m čtení."""
+        h = SensorHistory(size=8)
+        for value in (0x08, 0x00, 0x00, 0x08, 0x00):
+            h.append(value, 0)
+        self.assertEqual(h.countMatching(0x08, 0, 5), 3)
+        self.assertEqual(h.countMatching(0x08, 0, 2), 1)
+
+
+class TestSensorsHistory(unittest.TestCase):
+    """Testy metod Sensors nad historií."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.pcf = self.hw.attach(PCF8574Model(pins=IDLE))
+        self.sensors = createSensors(self.hw)
+
+    def _read(self, raw, timeMs):
+        set_ticks_ms(timeMs)
+        self.pcf.pins = raw
+        self.sensors.updateSensorData()
+
+    def test_debounced_obstacle(self):
+        """Jedno rušivé čtení překážky odrušený stav nezmění."""
+        blocked = IDLE & ~Sensors.ObstacleLeft
+        for t, raw in enumerate((IDLE, IDLE, blocked, IDLE, IDLE)):
+            self._read(raw, t)
+        self.assertFalse(self.sensors.debouncedActive(Sensors.ObstacleLeft))
+
+        for t in range(5, 8):
+            self._read(blocked, t)
+        self.assertTrue(self.sensors.debouncedActive(Sensors.ObstacleLeft))
+
+    def test_majority(self):
+        """Čára uprostřed ve 3 z 5 čtení."""
+        line = IDLE | Sensors.LineMiddle
+        for t, raw in enumerate((line, IDLE, line, line, IDLE)):
+            self._read(raw, t)
+        self.assertTrue(self.sensors.majorityActive(Sensors.LineMiddle, 3, 5))
+        self.assertFalse(self.sensors.majorityActive(Sensors.LineMiddle, 4, 5))
+
+    def test_time_since_line_seen(self):
+        """Jak dávno byla čára vidět a kdy se naposledy změnil senzor."""
+        self._read(IDLE | Sensors.LineLeft, 100)
+        self._read(IDLE, 150)
+        self._read(IDLE, 400)
+
+        self.assertEqual(self.sensors.msSinceActive(Sensors.LineAll), 300)
+        self.assertEqual(self.sensors.msSinceEdge(Sensors.LineLeft), 250)
+        self.assertIsNone(self.sensors.msSinceEdge(Sensors.ObstacleRight))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Testy čtení senzorů v režimu přerušení (INT výstup PCF8574).
+
+Ověřujeme, že:
+    - bez změny vstupů se expander nečte (ani po 50 ms),
+    - změna vstupu se přečte v nejbližším update() bez čekání na periodu,
+    - záložní periodické čtení zůstává,
+    - funguje i čítač hran (countio.Counter).
+"""
+
+import unittest
+import board
+import digitalio
+from adafruit_ticks import advance_ticks
+from busio import I2C as FakeI2C
+from joycar import I2C, PCF8574, Sensors
+from _fake.hardware.i2c_devices import PCF8574Model
+
+
+class FakeCounter:
+    """Náhrada countio.Counter – počítá sestupné hrany."""
+
+    def __init__(self):
+        self.count = 0
+
+
+class TestSensorsInterrupt(unittest.TestCase):
+    """Testy Sensors s intPin."""
+
+    def setUp(self):
+        self.hw = FakeI2C()
+        self.pcf = self.hw.attach(PCF8574Model(intPin=board.P1))
+        self.sensors = Sensors(PCF8574(I2C(self.hw)), intPin=board.P1, fallbackMs=500)
+        self.reads = self.pcf.reads
+
+    def tearDown(self):
+        digitalio.reset()
+
+    def test_no_change_no_read(self):
+        """Bez změny vstupů se před záložní periodou nic nečte."""
+        for _ in range(10):
+            advance_ticks(20)
+            self.sensors.update()
+        self.assertEqual(self.pcf.reads, self.reads)
+
+    def test_change_read_immediately(self):
+        """Překážka se přečte v nejbližším průchodu smyčkou."""
+        self.sensors.update()
+        self.pcf.pins = 0xFF & ~Sensors.ObstacleLeft
+
+        self.sensors.update()
+
+        self.assertEqual(self.pcf.reads, self.reads + 1)
+        self.assertTrue(self.sensors.areActive(Sensors.ObstacleLeft))
+
+        # čtení uvolnilo INT → další průchod už nečte
+        self.sensors.update()
+        self.assertEqual(self.pcf.reads, self.reads + 1)
+
+    def test_fallback_poll(self):
+        """Záložní čtení proběhne po fallbackMs i bez přerušení."""
+        advance_ticks(501)
+        self.sensors.update()
+        self.assertEqual(self.pcf.reads, self.reads + 1)
+
+    def test_edge_counter(self):
+        """Se čítačem hran se čte jen po zaznamenané hraně."""
+        counter = FakeCounter()
+        sensors = Sensors(PCF8574(I2C(self.hw)), intPin=counter)
+        reads = self.pcf.reads
+
+        sensors.update()
+        self.assertEqual(self.pcf.reads, reads)
+
+        counter.count = 1
+        sensors.update()
+        self.assertEqual(self.pcf.reads, reads + 1)
+        self.assertEqual(counter.count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
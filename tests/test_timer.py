@@ -47,7 +47,7 @@ class TestPeriod(unittest.TestCase):
     Testy pro třídu Period.
 
     Period slouží k periodickému spouštění úloh.
-    - ready() nebo isTime() vrací True, když uplynula perioda
+    - ready() vrací True, když uplynula perioda
     - po každém True se perioda automaticky resetuje
     """
 
@@ -58,15 +58,15 @@ class TestPeriod(unittest.TestCase):
 
         # 1. cyklus – ještě ne
         ticks.advance_ticks(50)
-        self.assertFalse(p.isTime(), "Po 50 ms ještě perioda nevypršela")
+        self.assertFalse(p.ready(), "Po 50 ms ještě perioda nevypršela")
 
         # 2. cyklus – perioda vyprší
         ticks.advance_ticks(60)
-        self.assertTrue(p.isTime(), "Po 110 ms perioda vypršela")
+        self.assertTrue(p.ready(), "Po 110 ms perioda vypršela")
 
         # 3. cyklus – ověříme, že se perioda resetovala
         ticks.advance_ticks(50)
-        self.assertFalse(p.isTime(), "Po resetu musí perioda znovu čekat")
+        self.assertFalse(p.ready(), "Po resetu musí perioda znovu čekat")
 
         ticks.advance_ticks(60)
-        self.assertTrue(p.isTime(), "Po dalších 110 ms perioda opět vypršela")
+        self.assertTrue(p.ready(), "Po dalších 110 ms perioda opět vypršela")
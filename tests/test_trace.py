@@ -0,0 +1,149 @@
+"""
+Testy záznamu a přehrávání I2C provozu.
+
+Ověřujeme, že:
+    - TracedBus zaznamená zápisy i čtení včetně dat,
+    - plný kruhový buffer zahazuje nejstarší záznamy,
+    - záznam lze uložit a přehrát do fake sběrnice se stejným výsledkem,
+    - přenos části bufferu (start/end) se zaznamená jen v přenesené délce,
+    - záznam kopíruje data bez memoryview a řezů (bez alokace).
+"""
+
+import io
+import unittest
+from busio import I2C as FakeI2C
+from joycar import I2C, PCF8574, Sensors
+import joycar.trace as joycar_trace
+from joycar.trace import BusTrace, TracedBus, TraceReplayer, FLAG_READ, FLAG_RESTART
+from _fake.hardware.i2c_devices import IS31FL3731Model
+from tests.create import createDisplay, createWheels
+
+
+class TestTrace(unittest.TestCase):
+    """Testy BusTrace, TracedBus a TraceReplayer."""
+
+    def test_records_transfers(self):
+        """Zápis, čtení i zápis s čtením se zaznamenají ve správném pořadí."""
+        hw = FakeI2C()
+        trace = BusTrace(256)
+        bus = TracedBus(hw, trace)
+        hw.queue_read([0x5A])
+        hw.queue_read([0x11, 0x22])
+
+        bus.writeto(0x62, bytes([0xA2, 1, 2, 3, 4]))
+        buf = bytearray(1)
+        bus.readfrom_into(0x38, buf)
+        bus.writeto_then_readfrom(0x62, bytes([0x80]), bytearray(2))
+
+        out = io.BytesIO()
+        trace.dump(out)
+        records = BusTrace.parse(out.getvalue())
+
+        self.assertEqual([(r[1], r[2], r[4]) for r in records], [
+            (0x62, 0, bytes([0xA2, 1, 2, 3, 4])),
+            (0x38, FLAG_READ, bytes([0x5A])),
+            (0x62, 0, bytes([0x80])),
+            (0x62, FLAG_READ | FLAG_RESTART, bytes([0x11, 0x22])),
+        ])
+
+    def test_ring_drops_oldest(self):
+        """Po zaplnění bufferu zůstanou jen nejnovější záznamy."""
+        trace = BusTrace(64, maxPayload=4)
+        bus = TracedBus(FakeI2C(), trace)
+
+        for i in range(20):
+            bus.writeto(0x62, bytes([i, i, i, i, i, i]))
+
+        records = BusTrace.parse(_dump(trace))
+        self.assertEqual(trace.count() + trace.dropped(), 20)
+        self.assertEqual(records[-1][3], 6)
+        self.assertEqual(records[-1][4], bytes([19] * 4))
+        self.assertEqual(records[0][4][0], 20 - trace.count())
+
+    def test_replay_reproduces_run(self):
+        """Přehraná jízda dá stejné zápisy motorů jako původní jízda."""
+        hw = FakeI2C()
+        trace = BusTrace(2048)
+        i2c = I2C(TracedBus(hw, trace))
+        sensors = Sensors(PCF8574(i2c))
+        wheels = createWheels(TracedBus(hw, trace))
+
+        for raw in (0xFF, 0xFB, 0xF7, 0xEF):
+            hw.queue_read([raw])
+            sensors.updateSensorData()
+            speed = 80 if sensors.areActive(Sensors.LineMiddle) else 120
+            wheels.setSpeed({"left": speed, "right": speed})
+
+        records = BusTrace.parse(_dump(trace))
+
+        replay_hw = FakeI2C()
+        replayer = TraceReplayer(records)
+        replayer.load(replay_hw)
+        sensors = Sensors(PCF8574(I2C(replay_hw)))
+        wheels = createWheels(replay_hw)
+        for _ in range(4):
+            sensors.updateSensorData()
+            speed = 80 if sensors.areActive(Sensors.LineMiddle) else 120
+            wheels.setSpeed({"left": speed, "right": speed})
+
+        self.assertEqual(replayer.verify(replay_hw), -1)
+
+
+    def test_partial_display_flush(self):
+        """Částečný zápis displeje (start/end) se zaznamená jen v přenesené délce."""
+        hw = FakeI2C()
+        hw.attach(IS31FL3731Model())
+        trace = BusTrace(2048)
+        display = createDisplay(TracedBus(hw, trace))
+        count = trace.count()
+
+        display.pixel(3, 2, 40)
+        display.flush()
+
+        records = BusTrace.parse(_dump(trace))[count:]
+        idx = display._pixelIndex(3, 2)
+        self.assertEqual([(r[1], r[3], r[4]) for r in records],
+                         [(0x74, 2, bytes([0x24 + idx, 40]))])
+
+        replay_hw = FakeI2C()
+        replay_hw.attach(IS31FL3731Model())
+        replayed = createDisplay(replay_hw)
+        replayed.pixel(3, 2, 40)
+        replayed.flush()
+        self.assertEqual(TraceReplayer(BusTrace.parse(_dump(trace))).verify(replay_hw), -1)
+
+    def test_span_recorded_without_slices(self):
+        """Část bufferu se zapíše i přes konec kruhu, bez memoryview a řezů zdroje."""
+        trace = BusTrace(64, maxPayload=16)
+        data = _NoSlice(range(40))
+        created = []
+        joycar_trace.memoryview = lambda obj: created.append(obj) or memoryview(obj)
+        try:
+            for i in range(10):
+                trace.record(0x74, 0, data, i, i + 20)
+        finally:
+            del joycar_trace.memoryview
+
+        self.assertEqual(created, [])
+        records = BusTrace.parse(_dump(trace))
+        self.assertEqual(records[-1][3], 20)
+        self.assertEqual(records[-1][4], bytes(range(9, 25)))
+
+
+class _NoSlice(bytearray):
+    """Buffer, jehož řez (alokace kopie) test odhalí."""
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            raise AssertionError("řez bufferu alokuje")
+        return super().__getitem__(index)
+
+
+def _dump(trace):
+    out = io.BytesIO()
+    trace.dump(out)
+    return out.getvalue()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -80,4 +80,4 @@ class TestWheelReverse(unittest.TestCase):
         # ---------------------------------------------------------
         # 5) Teď se musí aplikovat nový PWM
         # ---------------------------------------------------------
-        self.assertEqual(self.hw.write_history[-1][1][-1], 100)  # |-100| = 100
+        self.assertEqual(self.hw.write_history[-1][1][3], 100)  # PWM2 (levé kolo dozadu) = |-100| = 100
@@ -23,6 +23,11 @@ import adafruit_ticks as ticks
 from busio import I2C as FakeI2C
 from tests.create import createWheels
 
+
+def pwm_channels(hw_i2c):
+    """Vrátí hodnoty PWM0–PWM3 z posledního burst zápisu do PCA9633."""
+    return list(hw_i2c.write_history[-1][1][1:])
+
 class TestWheelsSetSpeed(unittest.TestCase):
     """Testy správného rozdělení PWM na dvě kola podle realistického modelu."""
 
@@ -42,25 +47,24 @@ class TestWheelsSetSpeed(unittest.TestCase):
 
         # ---------------------------------------------------------
         # 1) Požaduj PWM pro obě kola (0 → 100 a 0 → -50)
-        #    → podle modelu se má PWM aplikovat okamžitě
+        #    → podle modelu se má PWM aplikovat okamžitě,
+        #      a to pro obě kola jediným rámcem
+        #      [řídicí bajt, PWM0, PWM1, PWM2, PWM3]
+        #      (pravé: PWM0 dozadu, PWM1 dopředu; levé: PWM2 dozadu, PWM3 dopředu)
         # ---------------------------------------------------------
         ticks.set_ticks_ms(0)
+        writes_before = len(hw_i2c.write_history)
         wheels.setSpeed({"left": 100, "right": -50})
 
-        # Najdeme poslední nenulové PWM hodnoty
-        nonzero_pwms = [w[1][1] for w in hw_i2c.write_history if w[1][1] != 0]
-
-        self.assertIn(100, nonzero_pwms)   # levé kolo
-        self.assertIn(50, nonzero_pwms)    # pravé kolo (|-50| = 50)
+        self.assertEqual(len(hw_i2c.write_history) - writes_before, 1)
+        self.assertEqual(hw_i2c.write_history[-1], (0x62, bytes([0xA2, 50, 0, 0, 100])))
 
         # ---------------------------------------------------------
         # 2) První update() → nemění se znaménko → žádný reverz
         # ---------------------------------------------------------
         wheels.update()
 
-        nonzero_pwms = [w[1][1] for w in hw_i2c.write_history if w[1][1] != 0]
-        self.assertIn(100, nonzero_pwms)
-        self.assertIn(50, nonzero_pwms)
+        self.assertEqual(pwm_channels(hw_i2c), [50, 0, 0, 100])
 
         # ---------------------------------------------------------
         # 3) Změna znaménka → reverzní STOP pouze u kol, která mění směr
@@ -68,8 +72,7 @@ class TestWheelsSetSpeed(unittest.TestCase):
         wheels.setSpeed({"left": -80, "right": 30})   # levé: 100 → -80, pravé: -50 → 30
 
         wheels.update()  # první update po reverzu = STOP
-        last_pwms = [w[1][1] for w in hw_i2c.write_history[-2:]]
-        self.assertEqual(last_pwms, [0, 0])
+        self.assertEqual(pwm_channels(hw_i2c), [0, 0, 0, 0])
 
         # ---------------------------------------------------------
         # 4) Reverzní timeout ještě nevypršel → stále STOP
@@ -77,8 +80,7 @@ class TestWheelsSetSpeed(unittest.TestCase):
         ticks.advance_ticks(reverse_timeout_min)
         wheels.update()
 
-        last_pwms = [w[1][1] for w in hw_i2c.write_history[-2:]]
-        self.assertEqual(last_pwms, [0, 0])
+        self.assertEqual(pwm_channels(hw_i2c), [0, 0, 0, 0])
 
         # ---------------------------------------------------------
         # 5) Reverzní timeout vypršel → aplikuj nové PWM
@@ -86,7 +88,5 @@ class TestWheelsSetSpeed(unittest.TestCase):
         ticks.advance_ticks(reverse_timeout_max)
         wheels.update()
 
-        nonzero_pwms = [w[1][1] for w in hw_i2c.write_history if w[1][1] != 0]
-
-        self.assertIn(80, nonzero_pwms)   # levé kolo (|-80| = 80)
-        self.assertIn(30, nonzero_pwms)   # pravé kolo
+        # levé kolo dozadu (PWM2 = |-80| = 80), pravé kolo dopředu (PWM1 = 30)
+        self.assertEqual(pwm_channels(hw_i2c), [0, 30, 80, 0])
@@ -0,0 +1,126 @@
+"""
+Test, že ustálená cesta update() nealokuje nové buffery.
+
+Na CircuitPythonu každá alokace v hlavní smyčce dříve či později
+spustí garbage collector a ten robota na několik milisekund zastaví.
+Ovladače proto používají předalokované buffery.
+
+RecordingI2C si ukládá odkazy na všechny buffery, které mu ovladače předaly.
+Protože odkazy drží, žádný objekt nemůže být uvolněn a jeho id() znovu
+použito – počet různých id() je tedy přesně počet různých bufferů.
+Každý buffer, který by ovladač alokoval, tak zůstane naživu a tracemalloc
+ho ve snímku po smyčce přičte řádku ovladače, kde vznikl.
+"""
+
+import tracemalloc
+import unittest
+from busio import I2C as FakeI2C
+from joycar import I2C, PCF8574, PCA9633, PCA9633_registers, Sensors, Wheels
+
+
+class RecordingI2C(FakeI2C):
+    """FakeI2C, který si pamatuje všechny předané buffery."""
+
+    def __init__(self):
+        super().__init__()
+        self.buffers = []
+
+    def writeto(self, addr, data, *, stop=True):
+        self.buffers.append(data)
+        super().writeto(addr, data, stop=stop)
+
+    def readfrom_into(self, addr, buf, *, stop=True):
+        self.buffers.append(buf)
+        super().readfrom_into(addr, buf, stop=stop)
+
+
+def _driverAllocations(before, after) -> int:
+    """Vrátí počet bajtů, které mezi snímky přibyly v modulech joycar."""
+    only = (tracemalloc.Filter(True, "*joycar*"),)
+    diff = after.filter_traces(only).compare_to(before.filter_traces(only), "lineno")
+    return sum(stat.size_diff for stat in diff if stat.size_diff > 0)
+
+
+class TestZeroAlloc(unittest.TestCase):
+    """Testy opakovaného použití předalokovaných bufferů."""
+
+    def setUp(self):
+        tracemalloc.start()
+
+    def tearDown(self):
+        tracemalloc.stop()
+
+    def test_update_path_reuses_buffers(self):
+        """
+        Sto cyklů čtení senzorů a změn rychlosti použije
+        stále tytéž dva buffery: 1 bajt PCF8574 a 5bajtový PWM rámec.
+        """
+        hw = RecordingI2C()
+        i2c = I2C(hw)
+        sensors = Sensors(PCF8574(i2c))
+        wheels = Wheels(PCA9633(i2c), diameter=0.06, wheelBase=0.12)
+
+        # zahřátí – inicializace může alokovat
+        sensors.updateSensorData()
+        wheels.setSpeed({"left": 120, "right": 120})
+        start = len(hw.buffers)
+
+        for i in range(100):
+            hw.queue_read([i & 0x7F])
+            sensors.updateSensorData()
+            speed = 100 + (i & 1) * 20
+            wheels.setSpeed({"left": speed, "right": speed})
+            wheels.update()
+
+        used = hw.buffers[start:]
+        self.assertEqual(len(used), 200)
+        self.assertEqual(len({id(b) for b in used}), 2)
+
+    def test_update_path_does_not_allocate(self):
+        """tracemalloc: sto cyklů update() nenechá v ovladačích žádnou alokaci."""
+        hw = RecordingI2C()
+        i2c = I2C(hw)
+        sensors = Sensors(PCF8574(i2c))
+        wheels = Wheels(PCA9633(i2c), diameter=0.06, wheelBase=0.12)
+        speeds = [{"left": 100, "right": 100}, {"left": 120, "right": 120}]
+        reads = [[i & 0x7F] for i in range(100)]
+
+        sensors.updateSensorData()
+        wheels.setSpeed(speeds[1])
+        before = tracemalloc.take_snapshot()
+
+        for i in range(100):
+            hw.queue_read(reads[i])
+            sensors.updateSensorData()
+            wheels.setSpeed(speeds[i & 1])
+            wheels.update()
+
+        after = tracemalloc.take_snapshot()
+        self.assertEqual(_driverAllocations(before, after), 0)
+
+    def test_pca9633_register_writes_do_not_allocate(self):
+        """
+        tracemalloc: zápisy registrů PCA9633 – přímo i v dávce – používají
+        jen buffery předalokované v konstruktoru.
+        """
+        hw = RecordingI2C()
+        i2c = I2C(hw)
+        pca = PCA9633(i2c)
+        values = [[1, 2, 3], [4, 5, 6]]
+
+        before = tracemalloc.take_snapshot()
+
+        for i in range(100):
+            v = i & 0x7F
+            pca.writeRegister(PCA9633_registers.GRPPWM, v)
+            pca.writeTwoRegisters(PCA9633_registers.MODE1, v, PCA9633_registers.MODE2, v)
+            pca.writeRegisters(PCA9633_registers.PWM0, values[i & 1])
+            i2c.begin_batch()
+            pca.writeRegister(PCA9633_registers.GRPFREQ, v)
+            pca.writeTwoRegisters(PCA9633_registers.PWM0, v, PCA9633_registers.PWM1, v)
+            pca.writeRegisters(PCA9633_registers.PWM2, values[i & 1])
+            i2c.commit()
+
+        after = tracemalloc.take_snapshot()
+        self.assertGreater(len(hw.buffers), 400)
+        self.assertEqual(_driverAllocations(before, after), 0)